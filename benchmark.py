@@ -0,0 +1,62 @@
+import argparse
+import json
+import os
+import sys
+
+from classes.benchmark import find_regressions, format_results, run_benchmarks
+from run import load_config
+
+GAME_CONFIG_PATH = "config/game.yml"
+
+
+def parse_args():
+    """
+    Parses the command line arguments of the benchmark suite.
+
+    Returns:
+        argparse.Namespace: The arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks of the Gomoku engine")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 15, 19])
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="the JSON file the results are written to")
+    parser.add_argument("--baseline", help="the JSON results of a run to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10,
+        help="the slowdown in percent that counts as a regression",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    root = os.path.dirname(os.path.abspath(__file__))
+
+    game_config = load_config(os.path.join(root, GAME_CONFIG_PATH))
+    board_config = load_config(
+        os.path.join(root, game_config["config_paths"]["board_config"])
+    )
+
+    results = run_benchmarks(
+        board_config, args.sizes, args.depths, args.repeats, seed=args.seed
+    )
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+
+        regressions = find_regressions(baseline, results, args.threshold)
+        for name, slowdown in regressions:
+            print(f"Regression: {name} is {slowdown:.1f}% slower than the baseline")
+        if regressions:
+            sys.exit(1)
+        print(f"No metric is more than {args.threshold}% slower than the baseline.")
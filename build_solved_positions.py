@@ -0,0 +1,86 @@
+import argparse
+import os
+
+from classes.game_record import read_game_records
+from classes.solved_positions import (
+    SolvedPositionDatabase,
+    build_solved_positions,
+    get_opening_positions,
+    get_record_positions,
+)
+from run import load_config
+
+GAME_CONFIG_PATH = "config/game.yml"
+
+
+def parse_args():
+    """
+    Parses the command line arguments of the solved-position database build.
+
+    Returns:
+        argparse.Namespace: The arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Solve positions with proof-number search into a database"
+    )
+    parser.add_argument(
+        "--output", help="the database file, solved_positions_path by default"
+    )
+    parser.add_argument(
+        "--depth", type=int, default=0, help="solve every opening up to this many moves"
+    )
+    parser.add_argument(
+        "--records",
+        nargs="*",
+        default=[],
+        help="game record files to solve the positions of",
+    )
+    parser.add_argument(
+        "--min-stones",
+        type=int,
+        default=0,
+        help="the fewest stones of a record position",
+    )
+    parser.add_argument(
+        "--nodes", type=int, default=100000, help="the node budget of every search"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="processes, 0 for one per core"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    root = os.path.dirname(os.path.abspath(__file__))
+
+    game_config = load_config(os.path.join(root, GAME_CONFIG_PATH))
+    board_config = load_config(
+        os.path.join(root, game_config["config_paths"]["board_config"])
+    )
+    size, n_win = board_config["n_cells"], board_config["n_win"]
+    output = args.output or board_config.get("solved_positions_path")
+    if not output:
+        raise SystemExit(
+            "No database file, pass --output or set solved_positions_path."
+        )
+
+    def read_positions():
+        yield from get_opening_positions(
+            size, n_win, args.depth, board_config.get("candidate_radius", 1)
+        )
+        for file_path in args.records:
+            yield from get_record_positions(
+                read_game_records(file_path), size, n_win, args.min_stones
+            )
+
+    def print_result(result):
+        print(
+            f"{result['key']:016x} {result['result'] or 'unsolved'} {result['nodes']} nodes"
+        )
+
+    with SolvedPositionDatabase(output, size, n_win) as database:
+        n_positions = build_solved_positions(
+            database, read_positions(), args.nodes, args.workers or None, print_result
+        )
+        print(f"Searched {n_positions} positions, {len(database)} in {output}")
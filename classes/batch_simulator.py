@@ -0,0 +1,103 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Winner codes of a simulated game, matching the stone codes of the boards
+DRAW = 0
+BLACK_WIN = 1
+WHITE_WIN = 2
+
+# Directions of the lines through a cell: row, column, diagonal and anti-diagonal
+_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class BatchSimulator:
+    """
+    Plays many random games at once on a batch of boards held in one NumPy array.
+
+    Every game fills the cells in its own random order, black first, which plays a
+    uniformly random legal move in every live game per step. After each step the
+    line segments of `2 * n_win - 1` cells through the new stones are gathered for
+    the whole batch, and sliding window sums over them detect the finished games.
+
+    Attributes:
+        rng (np.random.Generator): The random number generator of the move orders.
+    """
+
+    def __init__(self, config: dict, seed: Optional[int] = None):
+        """
+        Initializes the simulator with the board size and win length of the config.
+
+        Args:
+            config (dict): The board configuration with `n_cells` and `n_win`.
+            seed (int, optional): The seed of the random number generator. Defaults to None.
+        """
+        self._n = config["n_cells"]
+        self._n_win = config["n_win"]
+        self.rng = np.random.default_rng(seed)
+
+        steps = np.arange(1 - self._n_win, self._n_win)
+        self._line_offsets = [(dx * steps, dy * steps) for dx, dy in _DIRECTIONS]
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the boards."""
+        return self._n
+
+    @property
+    def nwin(self) -> int:
+        """Returns the number of stones in a row needed to win."""
+        return self._n_win
+
+    def simulate(self, n_games: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Plays `n_games` random games to the end.
+
+        Args:
+            n_games (int): The number of games to play.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The winner of every game, DRAW,
+            BLACK_WIN or WHITE_WIN, the number of moves of every game, and the move
+            orders as cell indices x * n_cells + y, of which the first moves of each
+            game up to its number of moves were played.
+        """
+        n, n_win = self._n, self._n_win
+        n_cells = n * n
+        pad = n_win - 1
+
+        # the padding keeps the segments of cells near the edges inside the array
+        boards = np.zeros((n_games, n + 2 * pad, n + 2 * pad), dtype=np.int8)
+        moves = np.argsort(self.rng.random((n_games, n_cells)), axis=1)
+        winners = np.full(n_games, DRAW, dtype=np.int8)
+        n_moves = np.full(n_games, n_cells, dtype=np.int32)
+
+        live = np.arange(n_games)
+        for step in range(n_cells):
+            color = BLACK_WIN if step % 2 == 0 else WHITE_WIN
+            xs, ys = np.divmod(moves[live, step], n)
+            xs += pad
+            ys += pad
+            boards[live, xs, ys] = color
+
+            # a side has its n_win-th stone after 2 * (n_win - 1) moves at the earliest
+            if step < 2 * pad:
+                continue
+
+            won = np.zeros(live.size, dtype=bool)
+            for dx, dy in self._line_offsets:
+                segments = (
+                    boards[live[:, None], xs[:, None] + dx, ys[:, None] + dy] == color
+                )
+                sums = np.cumsum(segments, axis=1, dtype=np.int16)
+                windows = sums[:, n_win - 1 :].copy()
+                windows[:, 1:] -= sums[:, :-n_win]
+                won |= (windows == n_win).any(axis=1)
+
+            winners[live[won]] = color
+            n_moves[live[won]] = step + 1
+            live = live[~won]
+            if not live.size:
+                break
+
+        return winners, n_moves, moves
@@ -0,0 +1,243 @@
+import platform
+import random
+import time
+from typing import Callable, List, Sequence, Tuple
+
+from .board import Board
+from .constants import BLACK, WHITE
+from .player import Player, SmartPlayer
+
+# Stones placed on the benchmark position of each board size, odd for white to move
+POSITION_STONES = {9: 11, 15: 21, 19: 31}
+
+
+def create_position(board_config: dict, n_cells: int, seed: int) -> Board:
+    """
+    Creates the seeded benchmark position of a board size, white to move.
+
+    Stones are placed alternately, black first, on random candidate moves. Moves
+    that leave a cell completing a line for either side are skipped, so the search
+    has no forced win to cut it short and the position is reproducible. The
+    threat-space solver and the solved-position database are turned off, so that
+    every search runs minimax and its nodes per second measure minimax alone.
+
+    Args:
+        board_config (dict): The board configuration the position is based on.
+        n_cells (int): The size of the board.
+        seed (int): The seed of the stone placement.
+
+    Returns:
+        Board: The position, with a black Player and a white SmartPlayer.
+    """
+    board = Board(
+        dict(
+            board_config,
+            n_cells=n_cells,
+            search_workers=1,
+            threat_search_nodes=0,
+            solved_positions_path="",
+        )
+    )
+    board.player_black = Player(stone_color=BLACK)
+    board.player_white = SmartPlayer(WHITE, board.player_black)
+
+    rng = random.Random(seed + n_cells)
+    players = [board.player_black, board.player_white]
+    n_stones = POSITION_STONES.get(n_cells, 2 * n_cells + 1)
+    while len(board.history) < n_stones:
+        x, y = rng.choice(board.get_candidate_moves())
+        board.make_move(x, y, players[len(board.history) % 2])
+        if board.bitboard.get_winning_cells(BLACK) or board.bitboard.get_winning_cells(
+            WHITE
+        ):
+            board.unmake_move()
+
+    board.current_player = board.player_white
+
+    return board
+
+
+def time_call(function: Callable[[], object], repeats: int, min_time: float) -> float:
+    """
+    Measures the time of a call, the best of `repeats` rounds.
+
+    Each round calls the function as many times as it takes to run for at least
+    `min_time` seconds, which keeps the timer resolution out of fast calls.
+
+    Args:
+        function (Callable[[], object]): The call to time.
+        repeats (int): The number of rounds.
+        min_time (float): The minimum duration of a round in seconds.
+
+    Returns:
+        float: The seconds per call of the fastest round.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        calls = 0
+        start_time = time.perf_counter()
+        while True:
+            function()
+            calls += 1
+            elapsed = time.perf_counter() - start_time
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+
+    return best
+
+
+def run_benchmarks(
+    board_config: dict,
+    sizes: Sequence[int] = (9, 15, 19),
+    depths: Sequence[int] = (1, 2, 3, 4),
+    repeats: int = 3,
+    min_time: float = 0.2,
+    seed: int = 0,
+) -> dict:
+    """
+    Runs the benchmark suite on the seeded position of every board size.
+
+    The board primitives are timed per call. The search is timed per whole
+    `find_optimal_input` call at each target depth, without a time limit and
+    with an empty transposition table, and its minimax nodes per second are taken
+    from the search statistics of the same calls. The nodes of the search are
+    counted once with the full-window search and once with principal variation
+    search, which does not depend on the speed of the machine.
+
+    Args:
+        board_config (dict): The board configuration the positions are based on.
+        sizes (Sequence[int], optional): The board sizes. Defaults to (9, 15, 19).
+        depths (Sequence[int], optional): The target depths of the search. Defaults to (1, 2, 3, 4).
+        repeats (int, optional): The rounds of every measurement. Defaults to 3.
+        min_time (float, optional): The minimum duration of a round of the primitives. Defaults to 0.2.
+        seed (int, optional): The seed of the positions. Defaults to 0.
+
+    Returns:
+        dict: The metadata of the run and the metrics by name, each with its value,
+        unit and whether higher values are better.
+    """
+    metrics = {}
+
+    def add_metric(name: str, value: float, unit: str, higher_is_better: bool):
+        metrics[name] = {
+            "value": value,
+            "unit": unit,
+            "higher_is_better": higher_is_better,
+        }
+
+    for n_cells in sizes:
+        board = create_position(board_config, n_cells, seed)
+        x, y = board.last_move.x, board.last_move.y
+
+        for name, function in [
+            ("check_win_condition", board.check_win_condition),
+            ("get_pattern_count", lambda: board.get_pattern_count(x, y, False)),
+            ("get_unvisited_xy_pairs", board.get_unvisited_xy_pairs),
+        ]:
+            seconds = time_call(function, repeats, min_time)
+            add_metric(f"{name}/n{n_cells}", seconds * 1e6, "us", False)
+
+        for depth in depths:
+            search_board = create_position(
+                dict(
+                    board_config, heuristics_target_depth=depth, heuristics_time_limit=0
+                ),
+                n_cells,
+                seed,
+            )
+            best_seconds, best_rate = float("inf"), 0.0
+            for _ in range(repeats):
+                player = SmartPlayer(
+                    WHITE, search_board.player_black, collect_stats=True
+                )
+                start_time = time.perf_counter()
+                player.find_optimal_input(search_board, "advanced")
+                seconds = time.perf_counter() - start_time
+                best_seconds = min(best_seconds, seconds)
+                best_rate = max(best_rate, player.search_stats.nodes_per_second)
+            nodes = player.search_stats.nodes
+
+            player = SmartPlayer(
+                WHITE, search_board.player_black, collect_stats=True, pvs=True
+            )
+            player.find_optimal_input(search_board, "advanced")
+            pvs_nodes = player.search_stats.nodes
+
+            add_metric(
+                f"find_optimal_input/n{n_cells}/d{depth}", best_seconds, "s", False
+            )
+            add_metric(
+                f"minimax_nodes_per_second/n{n_cells}/d{depth}",
+                best_rate,
+                "nodes/s",
+                True,
+            )
+            add_metric(f"search_nodes/n{n_cells}/d{depth}", nodes, "nodes", False)
+            add_metric(
+                f"search_nodes_pvs/n{n_cells}/d{depth}", pvs_nodes, "nodes", False
+            )
+
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "repeats": repeats,
+        },
+        "metrics": metrics,
+    }
+
+
+def find_regressions(
+    baseline: dict, current: dict, threshold: float
+) -> List[Tuple[str, float]]:
+    """
+    Compares the metrics of two benchmark runs.
+
+    A metric regresses when it is more than `threshold` percent slower than in the
+    baseline: a time that grew by more than that, or a rate that dropped by more
+    than that. Metrics missing from either run are skipped.
+
+    Args:
+        baseline (dict): The results of the reference run.
+        current (dict): The results of the new run.
+        threshold (float): The allowed slowdown in percent.
+
+    Returns:
+        List[Tuple[str, float]]: The regressed metrics with their slowdown in percent.
+    """
+    regressions = []
+    for name, metric in current["metrics"].items():
+        reference = baseline["metrics"].get(name)
+        if reference is None or not reference["value"] or not metric["value"]:
+            continue
+
+        if metric["higher_is_better"]:
+            slowdown = reference["value"] / metric["value"] - 1
+        else:
+            slowdown = metric["value"] / reference["value"] - 1
+
+        if slowdown * 100 > threshold:
+            regressions.append((name, slowdown * 100))
+
+    return regressions
+
+
+def format_results(results: dict) -> str:
+    """
+    Formats the metrics of a benchmark run as a table.
+
+    Args:
+        results (dict): The results of the run.
+
+    Returns:
+        str: One line per metric with its value and unit.
+    """
+    metrics = results["metrics"]
+    width = max(len(name) for name in metrics) + 2
+    return "\n".join(
+        f"{name.ljust(width)}{metric['value']:>14.3f} {metric['unit']}"
+        for name, metric in metrics.items()
+    )
@@ -0,0 +1,942 @@
+import random
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .constants import BLACK, EMPTY, WHITE
+from .patterns import (
+    LINE_BLACK,
+    LINE_EDGE,
+    LINE_WHITE,
+    PATTERN_SCORES,
+    get_pattern_tables,
+    get_window_scores,
+)
+from .stone import Stone
+
+ZOBRIST_SEED = 2024
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(n: int) -> Tuple[Tuple[int, ...], Tuple[int, ...], int]:
+    """
+    Returns the Zobrist keys for a board of size n.
+
+    The keys are drawn from a fixed seed, so every board of the same size,
+    in this or any other process, hashes a position to the same value.
+
+    Args:
+        n (int): The size of the board.
+
+    Returns:
+        Tuple: The 64-bit keys of black stones and of white stones indexed by
+        bit index, and the key of the side to move.
+    """
+    rng = random.Random(ZOBRIST_SEED + n)
+    n_bits = n * (n + 1)
+    black_keys = tuple(rng.getrandbits(64) for _ in range(n_bits))
+    white_keys = tuple(rng.getrandbits(64) for _ in range(n_bits))
+    return black_keys, white_keys, rng.getrandbits(64)
+
+
+@lru_cache(maxsize=None)
+def get_neighbour_indices(n: int, radius: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Returns the bit indices of the cells within a Chebyshev radius of each cell.
+
+    Args:
+        n (int): The size of the board.
+        radius (int): The Chebyshev radius of the neighbourhood.
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: The neighbour indices of every bit index,
+        excluding the cell itself. Guard column bits have no neighbours.
+    """
+    stride = n + 1
+    neighbours = [()] * (n * stride)
+    for x in range(n):
+        for y in range(n):
+            neighbours[x * stride + y] = tuple(
+                nx * stride + ny
+                for nx in range(max(0, x - radius), min(n, x + radius + 1))
+                for ny in range(max(0, y - radius), min(n, y + radius + 1))
+                if (nx, ny) != (x, y)
+            )
+
+    return tuple(neighbours)
+
+
+@lru_cache(maxsize=None)
+def get_line_layout(n: int, n_win: int) -> Tuple[tuple, tuple]:
+    """
+    Returns the empty line codes of a board and the place of each cell in its lines.
+
+    The board has one line per row, column, diagonal and anti-diagonal. A line
+    code holds two bits per cell, LINE_EMPTY, LINE_BLACK or LINE_WHITE, and is
+    padded with `n_win - 1` LINE_EDGE cells at both ends, so that the segment of
+    `2 * n_win - 1` cells centred on any cell is a plain shift and mask.
+
+    Args:
+        n (int): The size of the board.
+        n_win (int): The number of stones in a row needed to win.
+
+    Returns:
+        Tuple[tuple, tuple]: The line codes of an empty board, and for every bit
+        index the (line index, position along the line) pairs of its four lines.
+    """
+    radius = n_win - 1
+    stride = n + 1
+    lines = (
+        [[(x, y) for y in range(n)] for x in range(n)]
+        + [[(x, y) for x in range(n)] for y in range(n)]
+        + [[(x, x - d) for x in range(n) if 0 <= x - d < n] for d in range(1 - n, n)]
+        + [[(x, c - x) for x in range(n) if 0 <= c - x < n] for c in range(2 * n - 1)]
+    )
+
+    codes = []
+    positions = [[] for _ in range(n * stride)]
+    for line_index, cells in enumerate(lines):
+        code = 0
+        for k in range(radius):
+            code |= LINE_EDGE << (2 * k)
+            code |= LINE_EDGE << (2 * (radius + len(cells) + k))
+        codes.append(code)
+
+        for position, (x, y) in enumerate(cells):
+            positions[x * stride + y].append((line_index, position))
+
+    return tuple(codes), tuple(tuple(cell_lines) for cell_lines in positions)
+
+
+@lru_cache(maxsize=None)
+def get_window_layout(n: int, n_win: int) -> Tuple[int, Tuple[Tuple[int, ...], ...]]:
+    """
+    Returns the number of winning windows of a board and the windows of each cell.
+
+    A window is a run of `n_win` cells along a row, a column, a diagonal or an
+    anti-diagonal, so a line of length L holds L - n_win + 1 windows and a cell
+    away from the edges lies in 4 * n_win of them.
+
+    Args:
+        n (int): The size of the board.
+        n_win (int): The number of stones in a row needed to win.
+
+    Returns:
+        Tuple[int, Tuple[Tuple[int, ...], ...]]: The number of windows, and for every
+        bit index the indices of the windows containing the cell. Guard column bits
+        are in no window.
+    """
+    stride = n + 1
+    windows = [[] for _ in range(n * stride)]
+    n_windows = 0
+    for dx, dy in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for x in range(n):
+            for y in range(n):
+                end_x, end_y = x + dx * (n_win - 1), y + dy * (n_win - 1)
+                if not (0 <= end_x < n and 0 <= end_y < n):
+                    continue
+                for k in range(n_win):
+                    windows[(x + dx * k) * stride + y + dy * k].append(n_windows)
+                n_windows += 1
+
+    return n_windows, tuple(tuple(cell_windows) for cell_windows in windows)
+
+
+@lru_cache(maxsize=None)
+def get_symmetry_indices(n: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Returns the 8 symmetries of the square board as permutations of the bit indices.
+
+    The first 4 symmetries rotate the board by 0, 90, 180 and 270 degrees and the
+    other 4 transpose it first, in the order of `classes.training_data.get_symmetries`.
+
+    Args:
+        n (int): The size of the board.
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: For every symmetry, the bit index every bit index
+        is moved to. Guard column bits stay in place.
+    """
+    stride = n + 1
+    symmetries = []
+    for flip in (False, True):
+        for k in range(4):
+            indices = list(range(n * stride))
+            for x in range(n):
+                for y in range(n):
+                    i, j = (y, x) if flip else (x, y)
+                    for _ in range(k):
+                        i, j = n - 1 - j, i
+                    indices[x * stride + y] = i * stride + j
+            symmetries.append(tuple(indices))
+
+    return tuple(symmetries)
+
+
+class BitBoard:
+    """
+    Represents a board position as integer bitboards.
+
+    Every cell (x, y) is mapped to the bit x * (n + 1) + y. The extra guard
+    column at y = n is never occupied, so shifting a bitboard along a row or
+    a diagonal never wraps a stone onto the neighbouring row.
+
+    The Zobrist hash of the position, the set of candidate moves, the empty
+    cells within `candidate_radius` of a stone, the line codes used to look
+    up patterns, and the stone counts of every winning window are updated
+    incrementally whenever a stone is placed or removed.
+
+    For each color, the windows free of opponent stones are also tallied by how
+    many stones of the color they hold, so that a five, the open fours and the
+    window score of a color are lookups instead of board scans.
+
+    Attributes:
+        black (int): The bitset of black stones.
+        white (int): The bitset of white stones.
+        hash (int): The Zobrist hash of the position.
+    """
+
+    def __init__(self, n: int, n_win: int, candidate_radius: int = 1):
+        self._n = n
+        self._n_win = n_win
+        self._stride = n + 1
+        self._candidate_radius = candidate_radius
+
+        # shifts for horizontal, vertical, diagonal down-right and diagonal down-left
+        self._shifts = (1, self._stride, self._stride + 1, self._stride - 1)
+        self._full_mask = 0
+        for x in range(n):
+            self._full_mask |= ((1 << n) - 1) << (x * self._stride)
+
+        self._black_keys, self._white_keys, self._side_key = get_zobrist_keys(n)
+
+        # number of stones around every cell, and the bitset of cells with any
+        self._neighbours = get_neighbour_indices(n, candidate_radius)
+        self._neighbour_counts = [0] * (n * self._stride)
+        self._near = 0
+
+        # line codes of every row, column and diagonal for pattern lookups
+        line_codes, self._line_positions = get_line_layout(n, n_win)
+        self._line_codes = list(line_codes)
+        self._pattern_tables = get_pattern_tables(n_win)
+        self._segment_bits = 2 * (n_win - 1)
+
+        # stones of each color in every window, and for each color the number of
+        # windows without opponent stones by their count of own stones
+        n_windows, self._cell_windows = get_window_layout(n, n_win)
+        self._window_counts = {BLACK: bytearray(n_windows), WHITE: bytearray(n_windows)}
+        self._open_windows = {
+            BLACK: [n_windows] + [0] * n_win,
+            WHITE: [n_windows] + [0] * n_win,
+        }
+        self._window_scores = tuple(enumerate(get_window_scores(n_win)))
+        # windows holding stones of both colors, which nobody can complete
+        self._n_windows = n_windows
+        self._dead_windows = 0
+
+        self.black = 0
+        self.white = 0
+        self.hash = 0
+
+    @classmethod
+    def from_stones(
+        cls, stones: List[List[Stone]], n_win: int, candidate_radius: int = 1
+    ) -> "BitBoard":
+        """
+        Builds the bitboards from a grid of Stone objects.
+
+        Args:
+            stones (List[List[Stone]]): The grid of stones indexed as [x][y].
+            n_win (int): The number of stones in a row needed to win.
+            candidate_radius (int, optional): The radius of candidate moves. Defaults to 1.
+
+        Returns:
+            BitBoard: The bitboard representation of the grid.
+        """
+        bitboard = cls(len(stones), n_win, candidate_radius)
+        for x, row in enumerate(stones):
+            for y, stone in enumerate(row):
+                if stone.color in (BLACK, WHITE):
+                    bitboard.set_stone(x, y, stone.color)
+
+        return bitboard
+
+    def copy(self) -> "BitBoard":
+        """
+        Copies the position into a new bitboard, sharing the precomputed tables.
+
+        Returns:
+            BitBoard: The copy.
+        """
+        bitboard = BitBoard.__new__(BitBoard)
+        bitboard.__dict__.update(self.__dict__)
+        bitboard._neighbour_counts = list(self._neighbour_counts)
+        bitboard._line_codes = list(self._line_codes)
+        bitboard._window_counts = {
+            color: bytearray(counts) for color, counts in self._window_counts.items()
+        }
+        bitboard._open_windows = {
+            color: list(open_windows)
+            for color, open_windows in self._open_windows.items()
+        }
+        return bitboard
+
+    def __deepcopy__(self, memo: dict) -> "BitBoard":
+        # the precomputed tables never change, only the position needs copying
+        return self.copy()
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the board."""
+        return self._n
+
+    @property
+    def nwin(self) -> int:
+        """Returns the number of stones in a row needed to win."""
+        return self._n_win
+
+    @property
+    def candidate_radius(self) -> int:
+        """Returns the radius around stones in which empty cells are candidate moves."""
+        return self._candidate_radius
+
+    @property
+    def side_key(self) -> int:
+        """Returns the Zobrist key of the side to move."""
+        return self._side_key
+
+    @property
+    def occupancy(self) -> int:
+        """Returns the bitset of all occupied cells."""
+        return self.black | self.white
+
+    def index(self, x: int, y: int) -> int:
+        """Returns the bit index of the cell (x, y)."""
+        return x * self._stride + y
+
+    def get_stones(self, color: str) -> int:
+        """Returns the bitset of stones of the given color."""
+        return self.black if color == BLACK else self.white
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        """
+        Check if the cell at the given coordinates holds a stone.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+
+        Returns:
+            bool: True if the cell is occupied, False otherwise.
+        """
+        return bool((self.black | self.white) >> (x * self._stride + y) & 1)
+
+    def get_color(self, x: int, y: int) -> str:
+        """
+        Returns the color of the stone at the given coordinates.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+
+        Returns:
+            str: "B", "W" or "_" for an empty cell.
+        """
+        idx = x * self._stride + y
+        if self.black >> idx & 1:
+            return BLACK
+        if self.white >> idx & 1:
+            return WHITE
+        return EMPTY
+
+    def set_stone(self, x: int, y: int, color: str) -> None:
+        """
+        Places a stone of the given color at the given coordinates.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+            color (str): The color of the stone, "B" or "W".
+        """
+        idx = x * self._stride + y
+        if color == BLACK:
+            self.black |= 1 << idx
+            self.hash ^= self._black_keys[idx]
+            code = LINE_BLACK
+            other = WHITE
+        else:
+            self.white |= 1 << idx
+            self.hash ^= self._white_keys[idx]
+            code = LINE_WHITE
+            other = BLACK
+
+        for line_index, position in self._line_positions[idx]:
+            self._line_codes[line_index] += code << (2 * position + self._segment_bits)
+
+        own, opponent = self._window_counts[color], self._window_counts[other]
+        own_open, opponent_open = self._open_windows[color], self._open_windows[other]
+        for window in self._cell_windows[idx]:
+            count, opponent_count = own[window], opponent[window]
+            if not opponent_count:
+                own_open[count] -= 1
+                own_open[count + 1] += 1
+            if not count:
+                opponent_open[opponent_count] -= 1
+                if opponent_count:
+                    self._dead_windows += 1
+            own[window] = count + 1
+
+        counts = self._neighbour_counts
+        for nidx in self._neighbours[idx]:
+            counts[nidx] += 1
+            if counts[nidx] == 1:
+                self._near |= 1 << nidx
+
+    def remove_stone(self, x: int, y: int) -> None:
+        """
+        Removes the stone at the given coordinates.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+        """
+        idx = x * self._stride + y
+        if self.black >> idx & 1:
+            self.black ^= 1 << idx
+            self.hash ^= self._black_keys[idx]
+            code = LINE_BLACK
+            color, other = BLACK, WHITE
+        elif self.white >> idx & 1:
+            self.white ^= 1 << idx
+            self.hash ^= self._white_keys[idx]
+            code = LINE_WHITE
+            color, other = WHITE, BLACK
+        else:
+            return
+
+        for line_index, position in self._line_positions[idx]:
+            self._line_codes[line_index] -= code << (2 * position + self._segment_bits)
+
+        own, opponent = self._window_counts[color], self._window_counts[other]
+        own_open, opponent_open = self._open_windows[color], self._open_windows[other]
+        for window in self._cell_windows[idx]:
+            count, opponent_count = own[window] - 1, opponent[window]
+            if not opponent_count:
+                own_open[count + 1] -= 1
+                own_open[count] += 1
+            if not count:
+                opponent_open[opponent_count] += 1
+                if opponent_count:
+                    self._dead_windows -= 1
+            own[window] = count
+
+        counts = self._neighbour_counts
+        for nidx in self._neighbours[idx]:
+            counts[nidx] -= 1
+            if counts[nidx] == 0:
+                self._near ^= 1 << nidx
+
+    def has_empty(self) -> bool:
+        """Returns True if there is at least one empty cell on the board."""
+        return (self.black | self.white) != self._full_mask
+
+    def get_empty_cells(self) -> List[Tuple[int, int]]:
+        """
+        Retrieve the coordinates of all empty cells in raster order.
+
+        Returns:
+            List[Tuple[int, int]]: A list of (x, y) tuples of the empty cells.
+        """
+        return self.get_cells(self._full_mask & ~(self.black | self.white))
+
+    def get_candidate_cells(self) -> List[Tuple[int, int]]:
+        """
+        Retrieve the empty cells within `candidate_radius` of any stone in raster order.
+
+        On an empty board the centre is the only candidate. If every stone is
+        surrounded so that no empty cell is near one, all empty cells are returned.
+
+        Returns:
+            List[Tuple[int, int]]: A list of (x, y) tuples of the candidate cells.
+        """
+        occupancy = self.black | self.white
+        if not occupancy:
+            return [(self._n // 2, self._n // 2)]
+
+        candidates = self._near & ~occupancy
+        if not candidates:
+            candidates = self._full_mask & ~occupancy
+
+        return self.get_cells(candidates)
+
+    def get_cells(self, mask: int) -> List[Tuple[int, int]]:
+        """Returns the (x, y) coordinates of the bits set in the mask in raster order."""
+        cells = []
+        while mask:
+            low = mask & -mask
+            cells.append(divmod(low.bit_length() - 1, self._stride))
+            mask ^= low
+
+        return cells
+
+    def get_run_mask(self, stones: int, length: int, shift: int) -> int:
+        """
+        Returns the bitset of cells that start a run of `length` stones.
+
+        Args:
+            stones (int): The bitset of stones to inspect.
+            length (int): The length of the run.
+            shift (int): The bit shift of the direction to inspect.
+
+        Returns:
+            int: A bitset with a bit set at the first cell of every run.
+        """
+        mask = stones
+        for k in range(1, length):
+            mask &= stones >> (k * shift)
+
+        return mask
+
+    def count_runs(self, color: str, length: int) -> int:
+        """
+        Counts the runs of `length` consecutive stones of the given color.
+
+        Overlapping runs are counted separately, e.g. a run of 4 stones
+        contains two runs of 3.
+
+        Args:
+            color (str): The color of the stones, "B" or "W".
+            length (int): The length of the run.
+
+        Returns:
+            int: The number of runs in all four directions.
+        """
+        stones = self.get_stones(color)
+        return sum(
+            bin(self.get_run_mask(stones, length, shift)).count("1")
+            for shift in self._shifts
+        )
+
+    def has_win(self, color: str) -> bool:
+        """
+        Check if the given color has `n_win` stones in a row.
+
+        Args:
+            color (str): The color of the stones, "B" or "W".
+
+        Returns:
+            bool: True if the color has a winning line, False otherwise.
+        """
+        stones = self.get_stones(color)
+        for shift in self._shifts:
+            if self.get_run_mask(stones, self._n_win, shift):
+                return True
+
+        return False
+
+    def get_winning_cells(self, color: str) -> int:
+        """
+        Returns the bitset of empty cells that complete `n_win` in a row for the color.
+
+        For every direction and every position k in a window of `n_win` cells,
+        the window qualifies when cell k is empty and the others hold stones of
+        the color. The guard column is neither a stone nor empty, so no window
+        crosses a row boundary.
+
+        Args:
+            color (str): The color of the stones, "B" or "W".
+
+        Returns:
+            int: A bitset of the winning cells.
+        """
+        stones = self.get_stones(color)
+        empty = self._full_mask & ~(self.black | self.white)
+        cells = 0
+
+        for shift in self._shifts:
+            for k in range(self._n_win):
+                mask = empty >> (k * shift)
+                for j in range(self._n_win):
+                    if j != k:
+                        mask &= stones >> (j * shift)
+                cells |= mask << (k * shift)
+
+        return cells
+
+    def get_threat_cells(self, color: str, missing: int) -> int:
+        """
+        Returns the bitset of empty cells in windows that lack `missing` stones of the color.
+
+        A window qualifies when it holds `n_win - missing` stones of the color and
+        its other cells are empty, and all of its empty cells are returned. With
+        `missing` 1 these are the winning cells, with 2 the cells that make a four
+        and with 3 the cells that make a three.
+
+        Args:
+            color (str): The color of the stones, "B" or "W".
+            missing (int): The number of stones the windows lack.
+
+        Returns:
+            int: A bitset of the cells.
+        """
+        stones = self.get_stones(color)
+        empty = self._full_mask & ~(self.black | self.white)
+        cells = 0
+
+        n_win = self._n_win
+        target = n_win - missing
+        for shift in self._shifts:
+            # the windows free of opponent stones, and their stone counts in binary
+            # with one bitset per binary digit, summed like a ripple-carry adder
+            window_mask = self._full_mask
+            digits = [0] * n_win.bit_length()
+            for k in range(n_win):
+                shifted_stones = stones >> (k * shift)
+                window_mask &= shifted_stones | empty >> (k * shift)
+                carry = shifted_stones
+                for b, digit in enumerate(digits):
+                    digits[b], carry = digit ^ carry, digit & carry
+
+            for b, digit in enumerate(digits):
+                window_mask &= digit if target >> b & 1 else ~digit
+            for k in range(n_win):
+                cells |= window_mask << (k * shift)
+
+        return cells & empty
+
+    def get_open_cells(self, color: str) -> int:
+        """
+        Returns the bitset of empty cells in windows free of opponent stones.
+
+        A stone anywhere else is in no window the color can still complete.
+
+        Args:
+            color (str): The color of the stones, "B" or "W".
+
+        Returns:
+            int: A bitset of the cells.
+        """
+        empty = self._full_mask & ~(self.black | self.white)
+        free = empty | self.get_stones(color)
+        cells = 0
+
+        for shift in self._shifts:
+            window_mask = self._full_mask
+            for k in range(self._n_win):
+                window_mask &= free >> (k * shift)
+            for k in range(self._n_win):
+                cells |= window_mask << (k * shift)
+
+        return cells & empty
+
+    def get_canonical_hash(self, color: str) -> Tuple[int, int]:
+        """
+        Hashes the position the same way as all of its rotations and reflections.
+
+        The canonical hash is the smallest Zobrist hash of the 8 symmetric positions,
+        with the side key added when white is to move.
+
+        Args:
+            color (str): The stone color of the side to move.
+
+        Returns:
+            Tuple[int, int]: The canonical hash, and the index of the symmetry of
+            `get_symmetry_indices` that turns the position into the canonical one.
+        """
+        best_hash, best_symmetry = None, None
+        for symmetry, indices in enumerate(get_symmetry_indices(self._n)):
+            hash_ = 0
+            for stones, keys in (
+                (self.black, self._black_keys),
+                (self.white, self._white_keys),
+            ):
+                while stones:
+                    low = stones & -stones
+                    hash_ ^= keys[indices[low.bit_length() - 1]]
+                    stones ^= low
+            if best_hash is None or hash_ < best_hash:
+                best_hash, best_symmetry = hash_, symmetry
+
+        if color == WHITE:
+            best_hash ^= self._side_key
+        return best_hash, best_symmetry
+
+    def get_symmetric_cell(
+        self, x: int, y: int, symmetry: int, inverse: bool = False
+    ) -> Tuple[int, int]:
+        """
+        Moves a cell by one of the symmetries of `get_symmetry_indices`.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+            symmetry (int): The index of the symmetry.
+            inverse (bool, optional): True to undo the symmetry instead. Defaults to False.
+
+        Returns:
+            Tuple[int, int]: The coordinates of the moved cell.
+        """
+        indices = get_symmetry_indices(self._n)[symmetry]
+        if inverse:
+            idx = indices.index(x * self._stride + y)
+        else:
+            idx = indices[x * self._stride + y]
+        return divmod(idx, self._stride)
+
+    def has_five(self, color: str) -> bool:
+        """
+        Check if a window holds `n_win` stones of the given color, from the window counters.
+
+        This agrees with `has_win`, which scans the bitboards instead.
+
+        Args:
+            color (str): The color of the stones, "B" or "W".
+
+        Returns:
+            bool: True if the color has a winning line, False otherwise.
+        """
+        return self._open_windows[color][self._n_win] > 0
+
+    def has_open_window(self) -> bool:
+        """
+        Check if any window is still free of the stones of at least one color.
+
+        Once every window holds stones of both colors, no line can be completed by
+        either side, so the game is drawn however the empty cells are filled.
+
+        Returns:
+            bool: True if some color can still complete a window, False otherwise.
+        """
+        return self._dead_windows < self._n_windows
+
+    def get_threat_count(self, color: str) -> int:
+        """
+        Counts the windows one stone short of a five for the given color.
+
+        Such a window holds `n_win - 1` stones of the color and one empty cell, so
+        it is a four, and two of them with different empty cells make an open four.
+
+        Args:
+            color (str): The color of the stones, "B" or "W".
+
+        Returns:
+            int: The number of windows the color can complete with its next stone.
+        """
+        return self._open_windows[color][self._n_win - 1]
+
+    def get_open_window_counts(self, color: str) -> Tuple[int, ...]:
+        """
+        Returns the windows free of opponent stones by their number of stones of the color.
+
+        Args:
+            color (str): The color of the stones, "B" or "W".
+
+        Returns:
+            Tuple[int, ...]: The `n_win + 1` window counts, from empty windows to fives.
+        """
+        return tuple(self._open_windows[color])
+
+    def get_window_score(self, color: str) -> int:
+        """
+        Scores the windows that are still open to either color, from the point of view of one.
+
+        Every window free of opponent stones adds the score of its stone count for
+        the color, and every window free of the color's stones subtracts it for the
+        opponent, see `classes.patterns.get_window_scores`.
+
+        Args:
+            color (str): The color to score for, "B" or "W".
+
+        Returns:
+            int: The score of the color minus the score of its opponent.
+        """
+        own = self._open_windows[color]
+        opponent = self._open_windows[WHITE if color == BLACK else BLACK]
+        return sum(score * (own[k] - opponent[k]) for k, score in self._window_scores)
+
+    def get_winner_color(self) -> Optional[str]:
+        """
+        Returns the color that has `n_win` stones in a row.
+
+        Returns:
+            Optional[str]: "B" or "W" if a winning line exists, None otherwise.
+        """
+        if self.has_five(BLACK):
+            return BLACK
+        if self.has_five(WHITE):
+            return WHITE
+        return None
+
+    def _count_adjacent(self, stones: int, idx: int, shift: int) -> int:
+        """
+        Counts the consecutive stones on both sides of the bit `idx` along one
+        direction, looking at most `n_win - 1` cells away.
+
+        The guard column keeps the walk from wrapping around a row, so only
+        the top edge needs a bounds check.
+        """
+        count = 0
+        for step in range(1, self._n_win):
+            if not stones >> (idx + step * shift) & 1:
+                break
+            count += 1
+
+        for step in range(1, self._n_win):
+            nidx = idx - step * shift
+            if nidx < 0 or not stones >> nidx & 1:
+                break
+            count += 1
+
+        return count
+
+    def get_run_length(self, x: int, y: int, color: str) -> int:
+        """
+        Counts the maximum number of consecutive stones of the given color
+        adjacent to (x, y) along any of the four directions.
+
+        The cell (x, y) itself is not counted.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+            color (str): The color of the stones, "B" or "W".
+
+        Returns:
+            int: The maximum number of consecutive stones in any direction.
+        """
+        stones = self.get_stones(color)
+        idx = x * self._stride + y
+
+        return max(self._count_adjacent(stones, idx, shift) for shift in self._shifts)
+
+    def get_pattern_classes(self, x: int, y: int, color: str) -> List[int]:
+        """
+        Looks up the patterns a stone of the given color at (x, y) forms on its four lines.
+
+        The segment of `n_win - 1` cells on each side of (x, y) is cut from the line
+        code of each direction and used as an index into the shared pattern table of
+        the color. The cell (x, y) itself may be empty or hold the stone.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+            color (str): The color of the stone, "B" or "W".
+
+        Returns:
+            List[int]: The pattern class of every direction, see `classes.patterns`.
+        """
+        table = self._pattern_tables[color]
+        segment_bits = self._segment_bits
+        half_mask = (1 << segment_bits) - 1
+        classes = []
+
+        for line_index, position in self._line_positions[x * self._stride + y]:
+            segment = self._line_codes[line_index] >> (2 * position)
+            classes.append(
+                table[
+                    (segment & half_mask)
+                    | (segment >> (segment_bits + 2) & half_mask) << segment_bits
+                ]
+            )
+
+        return classes
+
+    def get_pattern_score(self, x: int, y: int, color: str) -> int:
+        """
+        Scores the patterns a stone of the given color at (x, y) forms on its four lines.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+            color (str): The color of the stone, "B" or "W".
+
+        Returns:
+            int: The sum of the scores of the pattern classes of the four directions.
+        """
+        return sum(
+            PATTERN_SCORES[pattern] for pattern in self.get_pattern_classes(x, y, color)
+        )
+
+    def get_winner_color_at(self, x: int, y: int) -> Optional[str]:
+        """
+        Check the four lines through (x, y) for `n_win` stones in a row.
+
+        Only the stone at (x, y) and at most `n_win - 1` cells on each side of
+        it are inspected, so the check costs O(n_win) instead of a board scan.
+
+        Args:
+            x (int): The x-coordinate of the cell, usually the last move.
+            y (int): The y-coordinate of the cell, usually the last move.
+
+        Returns:
+            Optional[str]: The color of the stone at (x, y) if it completes a
+            winning line, None otherwise.
+        """
+        color = self.get_color(x, y)
+        if color == EMPTY:
+            return None
+
+        stones = self.get_stones(color)
+        idx = x * self._stride + y
+
+        for shift in self._shifts:
+            if self._count_adjacent(stones, idx, shift) + 1 >= self._n_win:
+                return color
+
+        return None
+
+    def playout(self, color: str, rng: random.Random = random) -> Optional[str]:
+        """
+        Plays the game out with uniformly random moves and returns the winner.
+
+        The playout works on copies of the two stone integers only, so the board
+        itself, its hash, line codes and candidate set, is left untouched. The empty
+        cells are shuffled once and filled in that order, and every move is checked
+        for a win along the four lines through it.
+
+        Args:
+            color (str): The color of the side to move.
+            rng (random.Random, optional): The random number generator. Defaults to the random module.
+
+        Returns:
+            Optional[str]: The color of the winner, None if the board fills up first.
+        """
+        empty = self._full_mask & ~(self.black | self.white)
+        cells = []
+        while empty:
+            low = empty & -empty
+            cells.append(low.bit_length() - 1)
+            empty ^= low
+        rng.shuffle(cells)
+
+        n_win = self._n_win
+        shifts = self._shifts
+        own, other = (
+            (self.black, self.white) if color == BLACK else (self.white, self.black)
+        )
+        other_color = WHITE if color == BLACK else BLACK
+
+        for idx in cells:
+            own |= 1 << idx
+            for shift in shifts:
+                count = 1
+                nidx = idx + shift
+                while count < n_win and own >> nidx & 1:
+                    count += 1
+                    nidx += shift
+                nidx = idx - shift
+                while count < n_win and nidx >= 0 and own >> nidx & 1:
+                    count += 1
+                    nidx -= shift
+                if count >= n_win:
+                    return color
+
+            own, other = other, own
+            color, other_color = other_color, color
+
+        return None
+
+    def __str__(self) -> str:
+        return "\n".join(
+            "  ".join(self.get_color(x, y) for y in range(self._n))
+            for x in range(self._n)
+        )
@@ -1,26 +1,55 @@
 from typing import List, Tuple
 
+from .bitboard import BitBoard
+from .constants import BLACK, EMPTY, WHITE
 from .player import Player
-from .stone import Stone
+from .stone import Stone, StoneView
+
+# Cell codes of the flat cell array of a board
+CELL_COLORS = (EMPTY, BLACK, WHITE)
+CELL_CODES = {color: code for code, color in enumerate(CELL_COLORS)}
+
+# Board weights by board size, shared by all boards as they never change
+_board_weights_cache = {}
 
 
 class Board:
     """
     Represents the game board for the Gomoku game.
+
+    The cells are kept in a flat bytearray of codes, 0 for empty, 1 for black and
+    2 for white, indexed as x * size + y, next to the bitboards the search works
+    on. Read-only StoneView objects are only created for the moves played, which
+    `last_move`, `history` and `board` share, and on demand for the other cells.
+    The grid of `board` is kept until the position or the players change.
     """
 
     def __init__(self, config: dict):
+        self._config = config
         self._n = config["n_cells"]
         self._n_win = config["n_win"]
         self._target_depth = config["heuristics_target_depth"]
         self._score_win = config["heuristics_score_win"]
         self._score_loose = config["heuristics_score_loose"]
+        # the keys added after the first release default to the values of board.yml,
+        # so that older board configs keep working
+        self._time_limit = config.get("heuristics_time_limit", 5)
+        self._transposition_table_size = config.get("transposition_table_size", 65536)
+        self._candidate_radius = config.get("candidate_radius", 1)
+        self._search_workers = config.get("search_workers", 1)
+        self._search_pvs = config.get("search_pvs", False)
+        self._aspiration_window = config.get("aspiration_window", 20000)
+        self._threat_search_nodes = config.get("threat_search_nodes", 1000)
+        self._threat_search_time_limit = config.get("threat_search_time_limit", 0.25)
+        self._solved_positions_path = config.get("solved_positions_path", "")
+        self._mcts_iterations = config.get("mcts_iterations", 0)
+        self._mcts_time_limit = config.get("mcts_time_limit", 5)
+        self._mcts_exploration = config.get("mcts_exploration", 1.4)
 
         self._left_stones = self._n * self._n
-        self._board = [
-            [Stone(x=x, y=y, color="_", player=None) for y in range(self._n)]
-            for x in range(self._n)
-        ]
+        self._cells = bytearray(self._n * self._n)
+        self._stones = {}
+        self._bitboard = BitBoard(self._n, self._n_win, self._candidate_radius)
         self._board_weights = None
         self.assign_board_weights()
 
@@ -33,6 +62,9 @@ class Board:
         self.winner = None
         self.last_move = None
         self.history = []
+        self._undo_stack = []
+        # the grid of `board` and the players it was built with, None until it is needed
+        self._grid = None
 
     @property
     def size(self) -> int:
@@ -49,6 +81,11 @@ class Board:
         """Returns the target depth for the AI."""
         return self._target_depth
 
+    @property
+    def time_limit(self) -> float:
+        """Returns the time budget of the AI per move in seconds, 0 for no limit."""
+        return self._time_limit
+
     @property
     def score_win(self) -> int:
         """Returns the score for a win."""
@@ -59,20 +96,183 @@ class Board:
         """Returns the score for a loss."""
         return self._score_loose
 
+    @property
+    def transposition_table_size(self) -> int:
+        """Returns the number of entries in the transposition table of the AI."""
+        return self._transposition_table_size
+
+    @property
+    def search_workers(self) -> int:
+        """Returns the number of processes searching the root moves of the AI in parallel."""
+        return self._search_workers
+
+    @property
+    def search_pvs(self) -> bool:
+        """Returns True if the AI searches with principal variation search and aspiration windows."""
+        return self._search_pvs
+
+    @property
+    def aspiration_window(self) -> int:
+        """Returns the half-width of the aspiration window around the previous iteration's score."""
+        return self._aspiration_window
+
+    @property
+    def threat_search_nodes(self) -> int:
+        """Returns the node budget of each proof of the threat-space solver, 0 if it is disabled."""
+        return self._threat_search_nodes
+
+    @property
+    def threat_search_time_limit(self) -> float:
+        """Returns the time budget of the threat-space solver per move in seconds, 0 for no limit."""
+        return self._threat_search_time_limit
+
+    @property
+    def solved_positions_path(self) -> str:
+        """Returns the path of the solved-position database, empty if there is none."""
+        return self._solved_positions_path
+
+    @property
+    def mcts_iterations(self) -> int:
+        """Returns the number of playouts of the MCTS player per move, 0 for no limit."""
+        return self._mcts_iterations
+
+    @property
+    def mcts_time_limit(self) -> float:
+        """Returns the time budget of the MCTS player per move in seconds, 0 for no limit."""
+        return self._mcts_time_limit
+
+    @property
+    def mcts_exploration(self) -> float:
+        """Returns the exploration constant of the UCT formula of the MCTS player."""
+        return self._mcts_exploration
+
+    @property
+    def zobrist_hash(self) -> int:
+        """Returns the Zobrist hash of the current position."""
+        return self._bitboard.hash
+
     @property
     def board(self) -> List[List[Stone]]:
-        """Returns the current state of the board."""
-        return self._board
+        """Returns the current state of the board as a grid of read-only Stone views."""
+        players = (self.player_black, self.player_white)
+        if self._grid is None or self._grid[1] != players:
+            grid = [
+                [self.get_stone(x, y) for y in range(self._n)] for x in range(self._n)
+            ]
+            self._grid = grid, players
+
+        return self._grid[0]
 
     @board.setter
     def board(self, _board: List[List[Stone]]):
-        """Sets the current state of the board."""
-        self._board = _board
+        """Sets the current state of the board from a grid of stones and rebuilds the bitboards."""
+        self._cells = bytearray(
+            CELL_CODES[stone.color] for row in _board for stone in row
+        )
+        self._bitboard = BitBoard.from_stones(
+            _board, self._n_win, self._candidate_radius
+        )
+        self._left_stones = self._cells.count(0)
+        self._stones = {}
+        self._undo_stack = []
+        self._grid = None
+
+    @property
+    def cells(self) -> bytearray:
+        """Returns the flat array of cell codes, indexed as x * size + y."""
+        return self._cells
 
     @property
-    def board_weights(self) -> List[List[Stone]]:
+    def bitboard(self) -> BitBoard:
+        """Returns the bitboard storage backend of the board."""
+        return self._bitboard
+
+    @property
+    def board_weights(self) -> List[List[int]]:
         return self._board_weights
 
+    def get_stone(self, x: int, y: int) -> Stone:
+        """
+        Returns a read-only view of the cell at the given coordinates: the Stone of
+        the move that filled it, or a new one for a cell without one.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+
+        Returns:
+            Stone: The color, player and visited flag of the cell.
+        """
+        stone = self._stones.get(x * self._n + y)
+        if stone is not None:
+            return stone
+
+        code = self._cells[x * self._n + y]
+        player = (None, self.player_black, self.player_white)[code]
+        return StoneView(x, y, CELL_COLORS[code], player, code != 0)
+
+    def copy(self) -> "Board":
+        """
+        Copies the position, the history and the undo stack into a new board.
+
+        The config, the players and the precomputed tables are shared with the copy,
+        so copying costs little more than the cell array and the bitboards.
+
+        Returns:
+            Board: The copy.
+        """
+        board = Board.__new__(Board)
+        board.__dict__.update(self.__dict__)
+        board._cells = bytearray(self._cells)
+        board._stones = dict(self._stones)
+        board._bitboard = self._bitboard.copy()
+        board.history = list(self.history)
+        board._undo_stack = list(self._undo_stack)
+        return board
+
+    def get_snapshot(self) -> tuple:
+        """
+        Returns a compact, picklable snapshot of the position.
+
+        The snapshot holds the config, the stone bitboards of both colors and the
+        board scores, which is all a search process needs to rebuild the position
+        with `from_snapshot`. Players, the history and the undo stack are left out.
+
+        Returns:
+            tuple: The config, black stones, white stones, weighted score and pattern score.
+        """
+        return (
+            self._config,
+            self._bitboard.black,
+            self._bitboard.white,
+            self.weighted_score,
+            self.pattern_score,
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: tuple) -> "Board":
+        """
+        Rebuilds a board from a snapshot taken with `get_snapshot`.
+
+        Args:
+            snapshot (tuple): The snapshot of the position.
+
+        Returns:
+            Board: A board with the stones and scores of the snapshot and no players.
+        """
+        config, black, white, weighted_score, pattern_score = snapshot
+        board = cls(config)
+
+        for color, stones in ((BLACK, black), (WHITE, white)):
+            for x, y in board.bitboard.get_cells(stones):
+                board._cells[x * board._n + y] = CELL_CODES[color]
+                board._bitboard.set_stone(x, y, color)
+                board._left_stones -= 1
+
+        board.weighted_score = weighted_score
+        board.pattern_score = pattern_score
+        return board
+
     def is_visited(self, x: int, y: int) -> bool:
         """
         Check if the cell at the given coordinates has been visited.
@@ -84,7 +284,7 @@ class Board:
         Returns:
             bool: True if the cell has been visited, False otherwise.
         """
-        return self._board[x][y].visited
+        return self._bitboard.is_occupied(x, y)
 
     def put_stone(self, x: int, y: int) -> bool:
         """
@@ -98,19 +298,60 @@ class Board:
             bool: True if the stone was successfully placed, False if the position was already occupied.
         """
         # put the stone to the board according to it's coordinate
-        if self._board[x][y].visited:
+        if self._bitboard.is_occupied(x, y):
             return False
 
-        stone = self._board[x][y]
-        stone.color = self.current_player.stone_color
-        stone.player = self.current_player
-        stone.visited = True
+        self.make_move(x, y)
+
+        return True
+
+    def make_move(self, x: int, y: int, player: Player = None) -> None:
+        """
+        Places a stone for the given player without validating the move.
+
+        Everything the move changes, the cell, the bitboards with their hash and
+        candidate set, the weighted and pattern scores, the left stones, the last
+        move and the history, is recorded on an undo stack so that `unmake_move`
+        restores the board exactly.
+
+        Args:
+            x (int): The x-coordinate on the board.
+            y (int): The y-coordinate on the board.
+            player (Player, optional): The player making the move. Defaults to the current player.
+        """
+        player = player or self.current_player
+        self._undo_stack.append(
+            (x, y, self.last_move, self.weighted_score, self.pattern_score)
+        )
+
+        stone = StoneView(x, y, player.stone_color, player, True)
+        self._cells[x * self._n + y] = CELL_CODES[stone.color]
+        self._stones[x * self._n + y] = stone
+        self._grid = None
+        self._bitboard.set_stone(x, y, stone.color)
 
         self.last_move = stone
         self.history.append(stone)
         self._left_stones -= 1
 
-        return True
+    def unmake_move(self) -> None:
+        """
+        Takes back the last move made with `make_move` or `put_stone`.
+
+        Raises:
+            IndexError: If there is no move to take back.
+        """
+        x, y, self.last_move, self.weighted_score, self.pattern_score = (
+            self._undo_stack.pop()
+        )
+
+        self._cells[x * self._n + y] = 0
+        del self._stones[x * self._n + y]
+        self._grid = None
+        self._bitboard.remove_stone(x, y)
+
+        self.history.pop()
+        self._left_stones += 1
 
     def get_unvisited_xy_pairs(self) -> List[Tuple[int]]:
         """
@@ -120,12 +361,20 @@ class Board:
             List[Tuple[int]]: A list of tuples where each tuple contains the x and y
             coordinates of an unvisited stone.
         """
-        return [
-            (stone.x, stone.y)
-            for row in self._board
-            for stone in row
-            if not stone.visited
-        ]
+        return self._bitboard.get_empty_cells()
+
+    def get_candidate_moves(self) -> List[Tuple[int, int]]:
+        """
+        Retrieve the moves worth searching: the empty cells within the candidate
+        radius of any stone, or the centre of an empty board.
+
+        The candidate set is kept up to date by the bitboards as stones are
+        placed and removed, so this does not rescan the board.
+
+        Returns:
+            List[Tuple[int, int]]: A list of (x, y) tuples of the candidate moves.
+        """
+        return self._bitboard.get_candidate_cells()
 
     def get_left_stones(self) -> int:
         """
@@ -136,6 +385,19 @@ class Board:
         """
         return self._left_stones
 
+    def is_drawn(self) -> bool:
+        """
+        Check if the game can no longer be won by either player.
+
+        The bitboard tracks the windows of `n_win` cells holding stones of both
+        colors, so this is a counter lookup. A full board is always drawn by this
+        test unless a line is complete.
+
+        Returns:
+            bool: True if every window is blocked for both players, False otherwise.
+        """
+        return not self._bitboard.has_open_window()
+
     def toggle_player(self) -> None:
         """
         Switches the current player to the other player.
@@ -146,26 +408,27 @@ class Board:
         toggle_flag = self.current_player.stone_color == self.player_black.stone_color
         self.current_player = self.player_white if toggle_flag else self.player_black
 
-    def check_sliding_win_condition(self, w: List[Stone]) -> bool:
+    def check_window_win_condition(self, start: int, step: int) -> Tuple[bool, Player]:
         """
-        Check if there are `n_win` consecutive black or white stones in the given list.
+        Check if the `n_win` cells of a line window in the cell array hold stones of one color.
+
+        The window is a strided slice of the flat cell array, so no Stone is created
+        unless the window is a winning one.
 
         Args:
-            w (List[Stone]): A list of Stone objects to check for a winning condition.
+            start (int): The index x * size + y of the first cell of the window.
+            step (int): The index step between the cells: 1 along a row, size along a
+                column, size + 1 and size - 1 along the diagonals.
 
         Returns:
-            bool: True if there are `n_win` consecutive stones of the same color, False otherwise.
+            Tuple[bool, Player]: True and the player of the stones if they form a winning
+            line, otherwise False and None.
         """
+        window = self._cells[start : start + step * (self._n_win - 1) + 1 : step]
+        if window[0] and window.count(window[0]) == self._n_win:
+            return True, self.get_stone(*divmod(start, self._n)).player
 
-        all_black_stones = all(stone.color == "B" for stone in w)
-        all_white_stones = all(stone.color == "W" for stone in w)
-
-        if all_black_stones or all_white_stones:
-            self.winner == self.current_player
-
-            return True
-
-        return False
+        return False, None
 
     def check_rowwise_win_condition(self) -> Tuple[bool, Player]:
         """
@@ -179,14 +442,14 @@ class Board:
             whether a winning condition was found, and the second element is the Player
             who won. If no winning condition is found, the second element is None.
         """
+        n = self.size
         # iterate each row.
-        for i in range(self.size):
+        for i in range(n):
             # iterate via sliding window with the number of n_win stones.
-            for j in range(self.size - self.nwin + 1):
-                w = self._board[i][j : j + self.nwin]  # sliding window
-                condition = self.check_sliding_win_condition(w)
+            for j in range(n - self.nwin + 1):
+                condition, player = self.check_window_win_condition(i * n + j, 1)
                 if condition:
-                    return True, w[0].player
+                    return True, player
 
         return False, None
 
@@ -201,14 +464,14 @@ class Board:
             bool: True if a winning condition is found, False otherwise.
             player: The player who has won, or None if no winning condition is found.
         """
+        n = self.size
         # iterate each column.
-        for j in range(self.size):
+        for j in range(n):
             # iterate via sliding window with the number of n_win stones.
-            for i in range(self.size - self.nwin + 1):
-                w = [self._board[i + k][j] for k in range(self.nwin)]
-                condition = self.check_sliding_win_condition(w)
+            for i in range(n - self.nwin + 1):
+                condition, player = self.check_window_win_condition(i * n + j, n)
                 if condition:
-                    return True, w[0].player
+                    return True, player
 
         return False, None
 
@@ -219,7 +482,7 @@ class Board:
         This method checks if there are `n_win` stones of the same color in a row
         diagonally in any direction on the board. It iterates through all possible
         diagonal lines on the board and checks for the win condition using the
-        `check_sliding_win_condition` method.
+        `check_window_win_condition` method.
 
         Returns:
             tuple: A tuple containing a boolean and a player object. The boolean
@@ -230,50 +493,27 @@ class Board:
         # n_win is the number of stones of the same color in a row to win
         # check if there are n_win black or white stones in a row in any direction of any diagonals
 
-        for j in range(self.size):
+        n, n_win = self.size, self.nwin
+        for j in range(n):
             # skip if there is less than n_win number of stones to check
-            if self.size - j < self.nwin:
+            if n - j < n_win:
                 continue
 
-            for i in range(self.size - self.nwin + 1):
-                if i + j + self.nwin > self.size:
+            for i in range(n - n_win + 1):
+                if i + j + n_win > n:
                     continue
 
-                w_diag_right = [self._board[k + i][k + i + j] for k in range(self.nwin)]
-                w_diag_right_mirror = [
-                    self._board[k + i + j][k + i] for k in range(self.nwin)
-                ]
-
-                condition_diag_right = self.check_sliding_win_condition(w_diag_right)
-                condition_diag_mirror_right = self.check_sliding_win_condition(
-                    w_diag_right_mirror
-                )
-
-                if condition_diag_right:
-                    return True, w_diag_right[0].player
-
-                if condition_diag_mirror_right:
-                    return True, w_diag_right_mirror[0].player
-
-                w_diag_left = [
-                    self._board[self.size - k - i - j - 1][k + i]
-                    for k in range(self.nwin)
-                ]
-                w_diag_left_mirror = [
-                    self._board[k + i][self.size - k - i - j - 1]
-                    for k in range(self.nwin)
-                ]
-
-                condition_diag_left = self.check_sliding_win_condition(w_diag_left)
-                condition_diag_mirror_left = self.check_sliding_win_condition(
-                    w_diag_left_mirror
-                )
-
-                if condition_diag_left:
-                    return True, w_diag_left[0].player
-
-                if condition_diag_mirror_left:
-                    return True, w_diag_left_mirror[0].player
+                # the down-right diagonals start at their top cell, and the down-left
+                # ones at their bottom cell, so that every window steps forward
+                for start, step in (
+                    (i * n + i + j, n + 1),
+                    ((i + j) * n + i, n + 1),
+                    ((n - n_win - i - j) * n + n_win - 1 + i, n - 1),
+                    ((n - n_win - i) * n + n_win - 1 + i + j, n - 1),
+                ):
+                    condition, player = self.check_window_win_condition(start, step)
+                    if condition:
+                        return True, player
 
         return False, None
 
@@ -287,6 +527,9 @@ class Board:
         corresponding player and returns True. If no win condition is found,
         it returns False.
 
+        The window counters of the bitboard tell in O(1) whether any line is
+        won, so the scans only run to find the winner of a won board.
+
         Returns:
             bool: True if a win condition is found, False otherwise.
         """
@@ -304,6 +547,9 @@ class Board:
         o o o o o o o o o
         """
 
+        if self._bitboard.get_winner_color() is None:
+            return False
+
         diag_status, diag_winner = self.check_diagwise_win_condition()
         row_status, row_winner = self.check_rowwise_win_condition()
         col_status, col_winner = self.check_colwise_win_condition()
@@ -317,6 +563,32 @@ class Board:
 
         return diag_status or row_status or col_status
 
+    def check_win_condition_at(self, x: int = None, y: int = None) -> bool:
+        """
+        Checks for a winning condition on the four lines through a single cell.
+
+        Only the stone at (x, y), or at the last move when no cell is given,
+        can complete a new line, so this costs O(n_win) per call. The full
+        scan in `check_win_condition` remains available to validate it.
+
+        Args:
+            x (int, optional): The x-coordinate of the cell. Defaults to the last move.
+            y (int, optional): The y-coordinate of the cell. Defaults to the last move.
+
+        Returns:
+            bool: True if a win condition is found, False otherwise.
+        """
+        if x is None or y is None:
+            if self.last_move is None:
+                return False
+            x, y = self.last_move.x, self.last_move.y
+
+        if self._bitboard.get_winner_color_at(x, y) is None:
+            return False
+
+        self.winner = self.get_stone(x, y).player
+        return True
+
     def assign_board_weights(self) -> None:
         """
         Assigns weights to the board positions based on their proximity to the center.
@@ -344,6 +616,10 @@ class Board:
          [1, 2, 3, 4, 4, 4, 3, 2, 1]]
         """
 
+        if self.size in _board_weights_cache:
+            self._board_weights = _board_weights_cache[self.size]
+            return
+
         self._board_weights = [[0 for _ in range(self.size)] for _ in range(self.size)]
         weight_i = 1
         for i in range(self.size // 2 + 1):
@@ -363,6 +639,7 @@ class Board:
         self._board_weights[mid][mid] = (
             self._board_weights[mid][mid - 1] + self._board_weights[mid][mid + 1]
         )
+        _board_weights_cache[self.size] = self._board_weights
 
     def get_pattern_count(self, x: int, y: int, is_maximizing: bool) -> int:
         """
@@ -377,49 +654,41 @@ class Board:
         Returns:
             int: The maximum number of consecutive stones of the current player in any direction.
         """
-        directions = [
-            (1, 0),  # Horizontal right
-            (0, 1),  # Vertical down
-            (1, 1),  # Diagonal down-right
-            (1, -1),  # Diagonal down-left
-        ]
-
-        count = 0
         player_color = (
             self.current_player.stone_color
             if is_maximizing
             else ("B" if self.current_player.stone_color == "W" else "W")
         )
 
-        for dx, dy in directions:
-            consecutive_count = 0
-            for step in range(1, self.nwin):
-                nx, ny = x + step * dx, y + step * dy
-                if (
-                    0 <= nx < self.size
-                    and 0 <= ny < self.size
-                    and self._board[nx][ny].color == player_color
-                ):
-                    consecutive_count += 1
-                else:
-                    break
-
-            for step in range(1, self.nwin):
-                nx, ny = x - step * dx, y - step * dy
-                if (
-                    0 <= nx < self.size
-                    and 0 <= ny < self.size
-                    and self._board[nx][ny].color == player_color
-                ):
-                    consecutive_count += 1
-                else:
-                    break
+        return self._bitboard.get_run_length(x, y, player_color)
 
-            count = max(count, consecutive_count)
+    def get_pattern_score(self, x: int, y: int, is_maximizing: bool) -> int:
+        """
+        Scores the line patterns, fives, fours, threes and twos, that a stone of the current
+        player or of the opponent forms at the given position (x, y).
+
+        The patterns are looked up in precomputed tables from the line codes kept by the
+        bitboards, see `classes.patterns`.
+
+        Args:
+            x (int): The x-coordinate of the position.
+            y (int): The y-coordinate of the position.
+            is_maximizing (bool): A flag indicating whether the current player is the maximizing player.
+
+        Returns:
+            int: The sum of the pattern scores of the four directions through the position.
+        """
+        player_color = (
+            self.current_player.stone_color
+            if is_maximizing
+            else ("B" if self.current_player.stone_color == "W" else "W")
+        )
 
-        return count
+        return self._bitboard.get_pattern_score(x, y, player_color)
 
     def __str__(self) -> str:
+        n = self._n
         return "\n".join(
-            ["  ".join([str(stone) for stone in row]) for row in self._board]
+            "  ".join(CELL_COLORS[code] for code in self._cells[x * n : (x + 1) * n])
+            for x in range(n)
         )
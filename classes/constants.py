@@ -0,0 +1,8 @@
+# Stone colors
+WHITE = "W"
+BLACK = "B"
+EMPTY = "_"
+UNDEFINED = "undefined"
+
+# Game results
+DRAW = "draw"
@@ -2,16 +2,21 @@ import time
 from typing import Tuple
 
 from .board import Board
-from .player import DumbPlayer, Player, SmartPlayer
+from .constants import DRAW
+from .game_controller import GameController
+from .player import DumbPlayer, MCTSPlayer, Player, SmartPlayer
 
 
 class Game:
     """
     Represents the Gomoku game.
 
+    The game is the console front-end: it prompts for moves and prints the board,
+    while the moves themselves are played through a headless GameController.
+
     Attributes:
         game_modes (dict): Configuration for different game modes.
-        board (Board): The game board.
+        controller (GameController): The controller playing the game.
     """
 
     def __init__(self, config: dict):
@@ -22,31 +27,40 @@ class Game:
             config (dict): Configuration dictionary containing game modes and board configuration.
         """
         self.game_modes = config["game_modes"]  # switch game modes
-        self.board = Board(config["board_config"])
+        self.controller = GameController(config["board_config"])
+
+    @property
+    def board(self) -> Board:
+        """Returns the board of the current game."""
+        return self.controller.board
 
     def setup(self, game_mode: str) -> None:
         """
         Sets up the game based on the selected game mode.
 
         Args:
-            game_mode (str): The game mode to set up. Can be "hvh" (Human vs Human), "hvd" (Human vs Dumb AI), or "hvai" (Human vs Smart AI).
+            game_mode (str): The game mode to set up. Can be "hvh" (Human vs Human), "hvd" (Human vs Dumb AI),
+                "hvai" (Human vs Smart AI) or "hvmcts" (Human vs Monte Carlo Tree Search AI).
         """
         self.game_mode = game_mode
-        self.board.player_black = Player(stone_color="B")
+        player_black = Player(stone_color="B")
 
         if self.game_mode == "hvh":
-            self.board.player_white = Player(stone_color="W")
+            player_white = Player(stone_color="W")
 
         elif self.game_mode == "hvd":
-            self.board.player_white = DumbPlayer(stone_color="W")
+            player_white = DumbPlayer(stone_color="W")
 
         elif self.game_mode == "hvai":
-            self.board.player_white = SmartPlayer(
-                stone_color="W", opponent=self.board.player_black
+            player_white = SmartPlayer(
+                stone_color="W", opponent=player_black, collect_stats=True, ponder=True
             )
 
+        elif self.game_mode == "hvmcts":
+            player_white = MCTSPlayer(stone_color="W", opponent=player_black)
+
         # Player with black stone starts the game
-        self.board.current_player = self.board.player_black
+        self.controller.new_game(player_black, player_white)
 
     def get_game_mode_desc(self) -> str:
         """
@@ -59,6 +73,8 @@ class Game:
             return "Human vs Human"
         elif self.game_mode == "hvd":
             return "Human vs Dumb"
+        elif self.game_mode == "hvmcts":
+            return "Human vs MCTS"
         else:
             return "Human vs AI/Smart"
 
@@ -86,21 +102,21 @@ class Game:
         if len(parsed_input) != 2:
             raise ValueError(
                 f"The input should consist of x and y values between 0"
-                f" and {self.board.get_size() - 1}"
+                f" and {self.board.size - 1}"
             )
 
         x, y = parsed_input[0], parsed_input[1]
         if not x.isnumeric() or not y.isnumeric():
             raise ValueError(
                 f"The input should consist of x and y values between 0"
-                f" and {self.board.get_size() - 1}"
+                f" and {self.board.size - 1}"
             )
 
         x, y = int(x), int(y)
         if not 0 <= x < self.board.size or not 0 <= y < self.board.size:
             raise ValueError(
                 f"The x, y values ranges between 0"
-                f" and {self.board.get_size() - 1}\n"
+                f" and {self.board.size - 1}\n"
                 f"Received input is ({x},{y})"
             )
 
@@ -118,38 +134,32 @@ class Game:
             bool: True if the move results in a win condition, False otherwise.
 
         Raises:
-            ValueError: If the position (x, y) is already occupied on the board.
+            ValueError: If the game is over or the position (x, y) is already occupied on the board.
         """
-        if not self.board.put_stone(x, y):
-            raise ValueError(f"The ({x},{y}) exists in the board.")
-
-        win_condition = self.board.check_win_condition()
-        if win_condition:
-            return True
+        result = self.controller.play(x, y)
 
-        self.board.toggle_player()
-
-        return False
+        return result is not None and result != DRAW
 
     def handle_player_input(self):
         """
         Handles the input for the current player based on their type.
 
-        For a DumbPlayer, it retrieves input from the player's get_input method
-        using the unvisited coordinates on the board.
+        Computer players choose their moves through the GameController.
+
+        For a DumbPlayer, it prints the random move of the player.
 
         For a Player, it prompts the user to enter x and y coordinates.
 
-        For a SmartPlayer, it retrieves input from the player's get_input method
-        using the current board state and measures the time taken to compute the input.
+        For a SmartPlayer, it measures the time taken to compute the input and prints
+        a summary of the statistics of the search and of the pondering.
+
+        For an MCTSPlayer, it reports the playouts per second of the search.
 
         Returns:
             str: The input line representing the coordinates.
         """
         if type(self.board.current_player) is DumbPlayer:
-            line_input = self.board.current_player.get_input(
-                self.board.get_unvisited_xy_pairs()
-            )
+            line_input = "{} {}".format(*self.controller.get_ai_move())
             print(f"Dumb computer input: {line_input}")
         elif type(self.board.current_player) is Player:
             line_input = input(
@@ -160,14 +170,36 @@ class Game:
         elif type(self.board.current_player) is SmartPlayer:
             print("Smart computer is thinking...")
             start_time = time.time()
-            line_input = self.board.current_player.get_input(self.board, "advanced")
-            print(self.board.weighted_score)
-            print(self.board.pattern_score)
+            line_input = "{} {}".format(*self.controller.get_ai_move())
+            smart_player = self.board.current_player
+            if smart_player.search_stats is not None:
+                print(smart_player.search_stats.format_summary())
+            if smart_player.ponder:
+                print(
+                    f"Ponder hits: {smart_player.ponder_hits}/"
+                    f"{smart_player.ponder_hits + smart_player.ponder_misses}"
+                    f" ({smart_player.ponder_hit_rate:.1%}), latency saved:"
+                    f" {smart_player.ponder_time_saved:.1f} seconds"
+                )
             elapsed_time = time.time() - start_time
             print(
                 f"Smart computer input: {line_input}, elapsed time: {round(elapsed_time,1)} seconds"
             )
             print("-----------------------")
+        elif type(self.board.current_player) is MCTSPlayer:
+            print("MCTS computer is thinking...")
+            line_input = "{} {}".format(*self.controller.get_ai_move())
+            mcts_player = self.board.current_player
+            print(
+                f"Playouts: {mcts_player.playouts}"
+                f" ({mcts_player.playouts_per_second:.0f} per second),"
+                f" reused from the previous turn: {mcts_player.reused_playouts}"
+            )
+            print(
+                f"MCTS computer input: {line_input}, elapsed time:"
+                f" {round(mcts_player.search_time, 1)} seconds"
+            )
+            print("-----------------------")
         return line_input
 
     def main_game_loop(self):
@@ -179,7 +211,7 @@ class Game:
         - Checks if the input is "exit" to terminate the game.
         - Validates the player's input.
         - Processes the player's turn and checks for a win condition.
-        - If a player wins, announces the winner and exits the loop.
+        - If a player wins or the game is drawn, announces the result and exits the loop.
         - Catches and handles invalid input exceptions.
 
         Raises:
@@ -203,6 +235,9 @@ class Game:
                     )
                     print(self.board)
                     break
+                if self.controller.result == DRAW:
+                    print("No line can be completed any more, the game is a draw.")
+                    break
             except ValueError as e:
                 print(f"Invalid input: {e}")
 
@@ -0,0 +1,168 @@
+from typing import List, Optional, Tuple
+
+from .board import Board
+from .constants import DRAW
+from .player import DumbPlayer, MCTSPlayer, Player, SmartPlayer
+
+
+class GameController:
+    """
+    Drives a game of Gomoku from code, without any prompts or printing.
+
+    The controller owns the Board and applies the rules: it validates moves,
+    places the stones, detects the end of the game and passes the turn. Console
+    front-ends and batch runners both play through it.
+
+    A SmartPlayer with `ponder` set starts pondering after its move when a human
+    player is to move next, and is stopped when the game ends.
+
+    Attributes:
+        board (Board): The board of the current game.
+        heuristics (str): The heuristics a SmartPlayer evaluates with, "basic", "advanced" or "windows",
+            unless the player has its own.
+        last_search_stats (SearchStats): The statistics of the last computer move, None if
+            the player did not collect any.
+    """
+
+    def __init__(self, board_config: dict, heuristics: str = "advanced"):
+        """
+        Initializes the controller with an empty board without players.
+
+        Args:
+            board_config (dict): The board configuration.
+            heuristics (str, optional): The heuristics of a SmartPlayer. Defaults to "advanced".
+        """
+        self._board_config = board_config
+        self.heuristics = heuristics
+        self.board = Board(board_config)
+        self.last_search_stats = None
+        self._result = None
+
+    def new_game(self, player_black: Player, player_white: Player) -> None:
+        """
+        Starts a new game on an empty board, black to move.
+
+        Args:
+            player_black (Player): The player with the black stones.
+            player_white (Player): The player with the white stones.
+        """
+        self.stop_pondering()
+        self.board = Board(self._board_config)
+        self.board.player_black = player_black
+        self.board.player_white = player_white
+        self.board.current_player = player_black
+        self._result = None
+
+    @property
+    def result(self) -> Optional[str]:
+        """
+        Returns the result of the game: the stone color of the winner, DRAW if the
+        board filled up or no line can be completed any more, or None while the game
+        is running.
+        """
+        return self._result
+
+    @property
+    def is_over(self) -> bool:
+        """Returns True if the game has ended."""
+        return self._result is not None
+
+    @property
+    def history(self) -> List[Tuple[int, int]]:
+        """Returns the moves of the game so far as (x, y) pairs."""
+        return [(stone.x, stone.y) for stone in self.board.history]
+
+    def play(self, x: int, y: int) -> Optional[str]:
+        """
+        Plays a move of the current player and passes the turn to the other one.
+
+        Args:
+            x (int): The x-coordinate of the move.
+            y (int): The y-coordinate of the move.
+
+        Returns:
+            Optional[str]: The result of the game after the move, None if it goes on.
+
+        Raises:
+            ValueError: If the game is over, or the position is off the board or already occupied.
+        """
+        if self.is_over:
+            raise ValueError("The game is over.")
+        if not 0 <= x < self.board.size or not 0 <= y < self.board.size:
+            raise ValueError(
+                f"The x, y values ranges between 0 and {self.board.size - 1}\n"
+                f"Received input is ({x},{y})"
+            )
+        if not self.board.put_stone(x, y):
+            raise ValueError(f"The ({x},{y}) exists in the board.")
+
+        player = self.board.current_player
+        if self.board.check_win_condition_at(x, y):
+            self._result = player.stone_color
+        elif self.board.get_left_stones() == 0 or self.board.is_drawn():
+            self._result = DRAW
+        else:
+            self.board.toggle_player()
+
+        if self._result is not None:
+            self.stop_pondering()
+        elif (
+            type(player) is SmartPlayer
+            and player.ponder
+            and type(self.board.current_player) is Player
+        ):
+            player.start_pondering(self.board, self.heuristics)
+
+        return self._result
+
+    def stop_pondering(self) -> None:
+        """Stops the pondering of the computer players of the game, if any."""
+        for player in (self.board.player_black, self.board.player_white):
+            if type(player) is SmartPlayer:
+                player.stop_pondering()
+
+    def get_ai_move(self) -> Tuple[int, int]:
+        """
+        Asks the current player, a computer player, for its move without playing it.
+
+        The statistics of a SmartPlayer search are left in `last_search_stats`.
+
+        Returns:
+            Tuple[int, int]: The x and y coordinates of the chosen move.
+
+        Raises:
+            ValueError: If the current player is a human player.
+        """
+        player = self.board.current_player
+        self.last_search_stats = None
+        if type(player) is DumbPlayer:
+            line_input = player.get_input(self.board.get_unvisited_xy_pairs())
+        elif type(player) is SmartPlayer:
+            line_input = player.get_input(self.board, self.heuristics)
+            self.last_search_stats = player.search_stats
+        elif type(player) is MCTSPlayer:
+            line_input = player.get_input(self.board)
+        else:
+            raise ValueError(
+                f"The player with {player.get_color_desc()} stone is not a computer."
+            )
+
+        x, y = line_input.split(" ")
+        return int(x), int(y)
+
+    def request_ai_move(self) -> Tuple[int, int]:
+        """
+        Lets the computer player to move choose a move and plays it.
+
+        Returns:
+            Tuple[int, int]: The move that was played.
+
+        Raises:
+            ValueError: If the game is over or the current player is a human player.
+        """
+        if self.is_over:
+            raise ValueError("The game is over.")
+
+        x, y = self.get_ai_move()
+        self.play(x, y)
+        return x, y
@@ -0,0 +1,221 @@
+import mmap
+import os
+import struct
+from typing import Iterator, List, Optional, Tuple
+
+from .board import Board
+from .constants import BLACK, DRAW, WHITE
+from .player import Player
+
+# Start of every record file, with the version of the format
+FILE_MAGIC = b"GMKR\x01"
+
+# Size, n_win, result, lengths of the player names and number of moves of a record
+RECORD_HEADER = struct.Struct("<BBBBBH")
+
+# Largest board whose cells fit in one byte per move, 15 x 15 = 225 cells
+ONE_BYTE_MAX_SIZE = 15
+
+RESULT_CODES = {None: 0, BLACK: 1, WHITE: 2, DRAW: 3}
+RESULTS = {code: result for result, code in RESULT_CODES.items()}
+
+
+class GameRecord:
+    """
+    A finished or unfinished game in the compact binary record format.
+
+    A record is a header of 7 bytes with the board size, n_win, the result, the
+    lengths of the player names and the number of moves, followed by the UTF-8
+    player names and the moves. Every move is the cell index x * size + y, in one
+    byte on boards up to 15 x 15 and in two little-endian bytes on larger boards.
+
+    Attributes:
+        size (int): The size of the board.
+        n_win (int): The number of stones in a row that win.
+        moves (List[Tuple[int, int]]): The moves of the game, black first.
+        black (str): The name of the black player.
+        white (str): The name of the white player.
+        result (str): The stone color of the winner, DRAW, or None if the game was not finished.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        n_win: int,
+        moves: List[Tuple[int, int]],
+        black: str = "",
+        white: str = "",
+        result: Optional[str] = None,
+    ):
+        self.size = size
+        self.n_win = n_win
+        self.moves = moves
+        self.black = black
+        self.white = white
+        self.result = result
+
+    def to_bytes(self) -> bytes:
+        """
+        Packs the record.
+
+        Returns:
+            bytes: The header, the player names and the moves.
+
+        Raises:
+            ValueError: If the board is larger than 255 x 255 or a player name longer than 255 bytes.
+        """
+        if self.size > 255:
+            raise ValueError(f"The board size {self.size} does not fit a record.")
+        black, white = self.black.encode(), self.white.encode()
+        if len(black) > 255 or len(white) > 255:
+            raise ValueError("The player names of a record are limited to 255 bytes.")
+
+        header = RECORD_HEADER.pack(
+            self.size,
+            self.n_win,
+            RESULT_CODES[self.result],
+            len(black),
+            len(white),
+            len(self.moves),
+        )
+        cells = [x * self.size + y for x, y in self.moves]
+        move_format = "B" if self.size <= ONE_BYTE_MAX_SIZE else "H"
+        return (
+            header + black + white + struct.pack(f"<{len(cells)}{move_format}", *cells)
+        )
+
+    @classmethod
+    def from_buffer(cls, buffer, offset: int = 0) -> Tuple["GameRecord", int]:
+        """
+        Unpacks a record from a buffer without copying the rest of the buffer.
+
+        Args:
+            buffer: The bytes, bytearray, memoryview or mmap holding the record.
+            offset (int, optional): The position of the record in the buffer. Defaults to 0.
+
+        Returns:
+            Tuple[GameRecord, int]: The record and the position right after it.
+
+        Raises:
+            ValueError: If the buffer ends before the record does.
+        """
+        if offset + RECORD_HEADER.size > len(buffer):
+            raise ValueError(f"Truncated game record at byte {offset}.")
+        size, n_win, result, n_black, n_white, n_moves = RECORD_HEADER.unpack_from(
+            buffer, offset
+        )
+        offset += RECORD_HEADER.size
+
+        move_format = "B" if size <= ONE_BYTE_MAX_SIZE else "H"
+        moves_format = f"<{n_moves}{move_format}"
+        end = offset + n_black + n_white + struct.calcsize(moves_format)
+        if end > len(buffer):
+            raise ValueError(f"Truncated game record at byte {offset}.")
+
+        black = bytes(buffer[offset : offset + n_black]).decode()
+        offset += n_black
+        white = bytes(buffer[offset : offset + n_white]).decode()
+        offset += n_white
+        cells = struct.unpack_from(moves_format, buffer, offset)
+
+        moves = [divmod(cell, size) for cell in cells]
+        return cls(size, n_win, moves, black, white, RESULTS[result]), end
+
+    def replay(self, board_config: dict) -> Board:
+        """
+        Replays the moves of the record on a new board with `Board.put_stone`.
+
+        Args:
+            board_config (dict): The board configuration, whose size and n_win are
+                replaced by those of the record.
+
+        Returns:
+            Board: The board after the last move, with the player to move next as current player.
+
+        Raises:
+            ValueError: If a move of the record is off the board or on an occupied cell.
+        """
+        board = Board(dict(board_config, n_cells=self.size, n_win=self.n_win))
+        board.player_black = Player(stone_color=BLACK)
+        board.player_white = Player(stone_color=WHITE)
+        board.current_player = board.player_black
+
+        for x, y in self.moves:
+            if not 0 <= x < self.size or not board.put_stone(x, y):
+                raise ValueError(f"Invalid move ({x},{y}) in the game record.")
+            board.toggle_player()
+
+        return board
+
+
+class GameRecordWriter:
+    """
+    Appends game records to a record file.
+
+    A new file starts with the format magic, and records are only ever appended,
+    so files can grow across runs and be read while they are being written.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Opens the record file for appending, creating it if needed.
+
+        Args:
+            file_path (str): The path of the record file.
+        """
+        self._file = open(file_path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(FILE_MAGIC)
+
+    def write(self, record: GameRecord) -> None:
+        """
+        Appends a record.
+
+        Args:
+            record (GameRecord): The record to append.
+        """
+        self._file.write(record.to_bytes())
+
+    def flush(self) -> None:
+        """Writes the buffered records to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Closes the record file."""
+        self._file.close()
+
+    def __enter__(self) -> "GameRecordWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_game_records(file_path: str) -> Iterator[GameRecord]:
+    """
+    Iterates over the records of a record file lazily.
+
+    The file is memory-mapped, so only the pages of the records being read are
+    loaded, however large the file is.
+
+    Args:
+        file_path (str): The path of the record file.
+
+    Yields:
+        GameRecord: The records in the order they were written.
+
+    Raises:
+        ValueError: If the file is not a record file or ends in the middle of a record.
+    """
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if buffer[: len(FILE_MAGIC)] != FILE_MAGIC:
+                raise ValueError(f"{file_path} is not a game record file.")
+
+            offset = len(FILE_MAGIC)
+            while offset < len(buffer):
+                record, offset = GameRecord.from_buffer(buffer, offset)
+                yield record
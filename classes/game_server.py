@@ -0,0 +1,336 @@
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple, Union
+
+from .board import Board
+from .constants import BLACK, WHITE
+from .game_controller import GameController
+from .player import Player, SmartPlayer
+from .tournament import create_player
+
+
+def compute_ai_move(
+    snapshot: tuple, engine: dict, stone_color: str, time_per_move: float
+) -> Tuple[int, int]:
+    """
+    Computes the move of a computer player in a worker process of the server.
+
+    Args:
+        snapshot (tuple): The snapshot of the position from `Board.get_snapshot`.
+        engine (dict): The engine entry of the player, as in the tournament config.
+        stone_color (str): The stone color of the player to move.
+        time_per_move (float): The cap on the time of the move in seconds.
+
+    Returns:
+        Tuple[int, int]: The move of the player.
+    """
+    player = create_player(engine, stone_color, time_per_move)
+    player.opponent = Player(BLACK if stone_color == WHITE else WHITE)
+
+    # the server already runs every move in a worker process of its own
+    snapshot = (dict(snapshot[0], search_workers=1),) + snapshot[1:]
+    controller = GameController(snapshot[0])
+    controller.board = Board.from_snapshot(snapshot)
+    controller.board.current_player = player
+    if stone_color == BLACK:
+        controller.board.player_black = player
+        controller.board.player_white = player.opponent
+    else:
+        controller.board.player_black = player.opponent
+        controller.board.player_white = player
+
+    try:
+        return controller.get_ai_move()
+    finally:
+        if isinstance(player, SmartPlayer):
+            player.close()
+
+
+class GameSession:
+    """
+    Represents the game of one client connection to the server.
+
+    Attributes:
+        controller (GameController): The controller of the game, owning its Board.
+        engines (dict): The engine entry of each computer player by stone color.
+    """
+
+    def __init__(self, board_config: dict):
+        self.controller = GameController(board_config)
+        self.engines = {}
+
+    def new_game(self, black: Union[str, dict], white: Union[str, dict]) -> None:
+        """
+        Starts a new game between two players.
+
+        Args:
+            black (Union[str, dict]): The black player, "human" or an engine entry or player type.
+            white (Union[str, dict]): The white player, "human" or an engine entry or player type.
+
+        Raises:
+            ValueError: If a player type is unknown.
+        """
+        players = {}
+        self.engines = {}
+        for color, spec in ((BLACK, black), (WHITE, white)):
+            engine = {"player": spec} if isinstance(spec, str) else dict(spec)
+            if engine["player"] == "human":
+                players[color] = Player(stone_color=color)
+            else:
+                players[color] = create_player(engine, color, 0)
+                self.engines[color] = engine
+
+        self.controller.new_game(players[BLACK], players[WHITE])
+
+    def get_state(self) -> dict:
+        """
+        Returns the state of the game as plain values.
+
+        Returns:
+            dict: The rows of the board, the moves so far, the color to move and the result.
+        """
+        board = self.controller.board
+        return {
+            "board": ["".join(stone.color for stone in row) for row in board.board],
+            "history": [list(move) for move in self.controller.history],
+            "to_move": (
+                board.current_player.stone_color
+                if board.current_player is not None
+                else None
+            ),
+            "result": self.controller.result,
+        }
+
+
+class GameServer:
+    """
+    Hosts many concurrent games over a line-delimited JSON protocol.
+
+    Every connection is a session with its own game. A request is one JSON object
+    per line with a `cmd` and is answered by one JSON object per line with `ok`
+    set, echoing the `id` of the request if it has one:
+
+    - {"cmd": "new_game", "black": "human", "white": "smart"} starts a game, where
+      a player is "human", a player type of the tournament engines or an engine entry,
+    - {"cmd": "play", "x": 4, "y": 4} plays a move for the player to move,
+    - {"cmd": "ai_move"} lets the computer player to move play,
+    - {"cmd": "state"} returns the state of the game,
+    - {"cmd": "quit"} closes the session.
+
+    Computer moves are searched in a process pool from a snapshot of the board, so
+    the event loop keeps serving the other sessions. Requests of a session are handled
+    one at a time, which stops reading from a client until its answer is written. On
+    top of that, the server limits the sessions, the computer moves in flight and the
+    time of a move, and closes sessions that stay idle.
+    """
+
+    def __init__(self, config: dict, board_config: dict):
+        """
+        Initializes the server.
+
+        Args:
+            config (dict): The server configuration with `host`, `port`, `unix_socket`,
+                `workers`, `max_sessions`, `max_pending_moves`, `ai_time_per_move`,
+                `move_timeout` and `idle_timeout`.
+            board_config (dict): The board configuration of the games.
+        """
+        self._host = config["host"]
+        self._port = config["port"]
+        self._unix_socket = config["unix_socket"]
+        self._workers = config["workers"] or os.cpu_count()
+        self._max_sessions = config["max_sessions"]
+        self._max_pending_moves = config["max_pending_moves"]
+        self._ai_time_per_move = config["ai_time_per_move"]
+        self._move_timeout = config["move_timeout"]
+        self._idle_timeout = config["idle_timeout"]
+        self._board_config = board_config
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._sessions = 0
+        self._pending_moves = 0
+
+    @property
+    def address(self) -> Union[str, Tuple[str, int]]:
+        """Returns the path of the Unix socket or the (host, port) of the TCP socket."""
+        if self._unix_socket:
+            return self._unix_socket
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self) -> None:
+        """Starts the process pool and listens on the configured socket."""
+        # forked workers would inherit the client sockets and keep them open
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        self._executor = ProcessPoolExecutor(
+            self._workers, mp_context=multiprocessing.get_context(start_method)
+        )
+        if self._unix_socket:
+            self._server = await asyncio.start_unix_server(
+                self.handle_connection, self._unix_socket
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self.handle_connection, self._host, self._port
+            )
+
+    async def serve_forever(self) -> None:
+        """Serves clients until the server is closed."""
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stops listening and shuts down the process pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serves the session of one client connection until it quits, idles or disconnects.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of requests.
+            writer (asyncio.StreamWriter): The stream of responses.
+        """
+        if self._sessions >= self._max_sessions:
+            await self.send(writer, {"ok": False, "error": "Too many sessions."})
+            writer.close()
+            return
+
+        self._sessions += 1
+        session = GameSession(self._board_config)
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(
+                        reader.readline(), self._idle_timeout or None
+                    )
+                except asyncio.TimeoutError:
+                    await self.send(
+                        writer, {"ok": False, "error": "Session timed out."}
+                    )
+                    break
+                except ValueError:
+                    await self.send(writer, {"ok": False, "error": "Request too long."})
+                    break
+                if not line:
+                    break
+
+                request = None
+                try:
+                    request = json.loads(line)
+                    response = await self.handle_request(session, request)
+                    if "id" in request:
+                        response["id"] = request["id"]
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    response = {"ok": False, "error": f"Invalid request: {e}"}
+
+                await self.send(writer, response)
+                if isinstance(request, dict) and request.get("cmd") == "quit":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._sessions -= 1
+            writer.close()
+
+    async def send(self, writer: asyncio.StreamWriter, response: dict) -> None:
+        """
+        Writes a response line and waits until the client has taken it.
+
+        Args:
+            writer (asyncio.StreamWriter): The stream of responses.
+            response (dict): The response.
+        """
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+
+    async def handle_request(self, session: GameSession, request: dict) -> dict:
+        """
+        Executes a request of a session.
+
+        Args:
+            session (GameSession): The session of the client.
+            request (dict): The request.
+
+        Returns:
+            dict: The response.
+
+        Raises:
+            ValueError: If the request is invalid.
+        """
+        cmd = request["cmd"]
+        if cmd == "new_game":
+            session.new_game(
+                request.get("black", "human"), request.get("white", "smart")
+            )
+        elif cmd == "play":
+            if session.controller.board.current_player is None:
+                raise ValueError("No game has been started.")
+            session.controller.play(int(request["x"]), int(request["y"]))
+        elif cmd == "ai_move":
+            return await self.play_ai_move(session)
+        elif cmd not in ("state", "quit"):
+            raise ValueError(f"Unknown command: {cmd}")
+
+        return dict(ok=True, **session.get_state())
+
+    async def play_ai_move(self, session: GameSession) -> dict:
+        """
+        Searches the move of the computer player to move in the process pool and plays it.
+
+        Args:
+            session (GameSession): The session of the client.
+
+        Returns:
+            dict: The response with the move and the new state, or the error.
+        """
+        controller = session.controller
+        board = controller.board
+        if board.current_player is None or controller.is_over:
+            raise ValueError("There is no game in progress.")
+
+        color = board.current_player.stone_color
+        if color not in session.engines:
+            raise ValueError("The player to move is not a computer.")
+        if self._pending_moves >= self._max_pending_moves:
+            return {"ok": False, "error": "Server busy, try again later."}
+
+        # the job counts as pending until the worker is done, even after a timeout
+        self._pending_moves += 1
+        job = asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            compute_ai_move,
+            board.get_snapshot(),
+            session.engines[color],
+            color,
+            self._ai_time_per_move,
+        )
+        job.add_done_callback(self._finish_pending_move)
+
+        try:
+            x, y = await asyncio.wait_for(asyncio.shield(job), self._move_timeout)
+        except asyncio.TimeoutError:
+            return {"ok": False, "error": "The computer move timed out."}
+        except BrokenProcessPool:
+            return {"ok": False, "error": "The computer move failed."}
+
+        controller.play(x, y)
+        return dict(ok=True, move=[x, y], **session.get_state())
+
+    def _finish_pending_move(self, job: asyncio.Future) -> None:
+        self._pending_moves -= 1
+        if not job.cancelled():
+            job.exception()
@@ -0,0 +1,123 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+
+class MCTSNode:
+    """
+    Represents a node of the Monte Carlo search tree.
+
+    A node stands for the position after its move and keeps the playout results
+    from the point of view of the player who made that move, so that a parent
+    picks the child that is best for the side to move in the parent.
+
+    Attributes:
+        move (Tuple[int, int]): The move leading to the node, None for the root.
+        color (str): The stone color of the player who made the move.
+        parent (MCTSNode): The parent node, None for the root.
+        children (Dict[Tuple[int, int], MCTSNode]): The expanded children by move.
+        untried_moves (List[Tuple[int, int]]): The moves not expanded yet, None until
+            the node is expanded for the first time.
+        visits (int): The number of playouts through the node.
+        wins (float): The playouts won by `color`, a draw counting as half a win.
+        winner (str): The color of the winner if the move ends the game, None otherwise.
+        is_terminal (bool): True if the game is over after the move.
+    """
+
+    __slots__ = (
+        "move",
+        "color",
+        "parent",
+        "children",
+        "untried_moves",
+        "visits",
+        "wins",
+        "winner",
+        "is_terminal",
+    )
+
+    def __init__(
+        self,
+        move: Optional[Tuple[int, int]],
+        color: str,
+        parent: Optional["MCTSNode"] = None,
+        winner: Optional[str] = None,
+        is_terminal: bool = False,
+    ):
+        self.move = move
+        self.color = color
+        self.parent = parent
+        self.children: Dict[Tuple[int, int], "MCTSNode"] = {}
+        self.untried_moves: Optional[List[Tuple[int, int]]] = None
+        self.visits = 0
+        self.wins = 0.0
+        self.winner = winner
+        self.is_terminal = is_terminal
+
+    def add_child(
+        self,
+        move: Tuple[int, int],
+        color: str,
+        winner: Optional[str] = None,
+        is_terminal: bool = False,
+    ) -> "MCTSNode":
+        """
+        Adds the child reached by the given move.
+
+        Args:
+            move (Tuple[int, int]): The move leading to the child.
+            color (str): The stone color of the player making the move.
+            winner (str, optional): The color of the winner if the move ends the game. Defaults to None.
+            is_terminal (bool, optional): True if the game is over after the move. Defaults to False.
+
+        Returns:
+            MCTSNode: The new child.
+        """
+        child = MCTSNode(move, color, self, winner, is_terminal)
+        self.children[move] = child
+        return child
+
+    def select_child(self, exploration: float) -> "MCTSNode":
+        """
+        Selects the child with the highest UCT score.
+
+        The score is the win rate of the child plus `exploration` times
+        sqrt(ln(visits of the node) / visits of the child), which favours children
+        that have been tried less often.
+
+        Args:
+            exploration (float): The exploration constant of the UCT formula.
+
+        Returns:
+            MCTSNode: The selected child.
+        """
+        log_visits = math.log(self.visits)
+        return max(
+            self.children.values(),
+            key=lambda child: child.wins / child.visits
+            + exploration * math.sqrt(log_visits / child.visits),
+        )
+
+    def update(self, winner: Optional[str]) -> None:
+        """
+        Records the result of a playout in the node and all of its ancestors.
+
+        Args:
+            winner (str): The color of the winner of the playout, None for a draw.
+        """
+        node = self
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.color:
+                node.wins += 1
+            node = node.parent
+
+    def get_best_child(self) -> "MCTSNode":
+        """
+        Returns the most visited child, which is the most reliable choice of move.
+
+        Returns:
+            MCTSNode: The most visited child.
+        """
+        return max(self.children.values(), key=lambda child: child.visits)
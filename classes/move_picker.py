@@ -0,0 +1,86 @@
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Sequence, Tuple
+
+from .constants import BLACK, WHITE
+
+if TYPE_CHECKING:
+    from .board import Board
+
+# Stages of the move picker
+HASH_MOVE = 0
+THREAT_MOVES = 1
+KILLER_MOVES = 2
+QUIET_MOVES = 3
+
+
+class MovePicker:
+    """
+    Yields the moves of a position lazily, best candidates first.
+
+    The moves come in stages:
+    1. the move from the transposition table or the principal variation,
+    2. moves that win immediately, then moves that block an immediate win of the opponent,
+    3. the killer moves of the current ply,
+    4. the remaining candidate moves ordered by the history table.
+
+    A stage is generated only after the previous ones have been exhausted, so a
+    cutoff on an early move skips the work of the later stages.
+
+    Attributes:
+        stage (int): The stage of the last yielded move.
+    """
+
+    def __init__(
+        self,
+        board: "Board",
+        color: str,
+        hash_move: Optional[Tuple[int, int]] = None,
+        killer_moves: Sequence[Tuple[int, int]] = (),
+        history: Optional[Dict[Tuple[int, int], int]] = None,
+    ):
+        """
+        Initializes the move picker for the side to move.
+
+        Args:
+            board (Board): The current state of the game board.
+            color (str): The stone color of the side to move.
+            hash_move (Tuple[int, int], optional): The best move known for the position. Defaults to None.
+            killer_moves (Sequence[Tuple[int, int]], optional): The killer moves of the ply. Defaults to ().
+            history (Dict[Tuple[int, int], int], optional): The history scores of the side to move. Defaults to None.
+        """
+        self._board = board
+        self._color = color
+        self._hash_move = hash_move
+        self._killer_moves = killer_moves
+        self._history = history or {}
+        self.stage = HASH_MOVE
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        bitboard = self._board.bitboard
+        picked = set()
+
+        self.stage = HASH_MOVE
+        if self._hash_move is not None and not bitboard.is_occupied(*self._hash_move):
+            picked.add(self._hash_move)
+            yield self._hash_move
+
+        self.stage = THREAT_MOVES
+        opponent_color = BLACK if self._color == WHITE else WHITE
+        for color in (self._color, opponent_color):
+            for move in bitboard.get_cells(bitboard.get_winning_cells(color)):
+                if move not in picked:
+                    picked.add(move)
+                    yield move
+
+        self.stage = KILLER_MOVES
+        for move in self._killer_moves:
+            if move not in picked and not bitboard.is_occupied(*move):
+                picked.add(move)
+                yield move
+
+        self.stage = QUIET_MOVES
+        history = self._history
+        quiet_moves = [
+            move for move in self._board.get_candidate_moves() if move not in picked
+        ]
+        quiet_moves.sort(key=lambda move: -history.get(move, 0))
+        yield from quiet_moves
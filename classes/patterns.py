@@ -0,0 +1,167 @@
+from functools import lru_cache
+from itertools import product
+from typing import Dict, Tuple
+
+from .constants import BLACK, WHITE
+
+# Pattern classes of the line segment through a stone, weakest first
+NONE = 0
+CLOSED_TWO = 1
+OPEN_TWO = 2
+CLOSED_THREE = 3
+OPEN_THREE = 4
+CLOSED_FOUR = 5
+OPEN_FOUR = 6
+FIVE = 7
+
+PATTERN_NAMES = (
+    "none",
+    "closed two",
+    "open two",
+    "closed three",
+    "open three",
+    "closed four",
+    "open four",
+    "five",
+)
+PATTERN_SCORES = (0, 10, 100, 100, 1000, 1000, 10000, 100000)
+
+# Cell codes of a line segment as seen by the stone in its centre
+EMPTY_CELL = 0
+OWN_CELL = 1
+BLOCKED_CELL = 2  # an opponent stone or the board edge
+
+# Cell codes of the line codes kept by the bitboards, two bits per cell
+LINE_EMPTY = 0
+LINE_BLACK = 1
+LINE_WHITE = 2
+LINE_EDGE = 3
+
+# A stone threatening one more stone to reach the next class
+_DOWNGRADES = {
+    OPEN_FOUR: OPEN_THREE,
+    CLOSED_FOUR: CLOSED_THREE,
+    OPEN_THREE: OPEN_TWO,
+    CLOSED_THREE: CLOSED_TWO,
+}
+
+
+def classify_segment(cells: Tuple[int, ...], n_win: int) -> int:
+    """
+    Classifies the pattern formed by the stone in the centre of a line segment.
+
+    The segment holds `n_win - 1` cells on each side of the centre, which covers
+    every window of `n_win` cells that contains the centre. Only windows without
+    blocked cells can still become a five. A four has one empty cell left in such
+    a window and is open if two different cells complete a five. A three is open
+    if one more stone can make an open four, and twos follow the same way.
+
+    Args:
+        cells (Tuple[int, ...]): The cell codes of the segment, EMPTY_CELL, OWN_CELL
+            or BLOCKED_CELL, with OWN_CELL in the centre.
+        n_win (int): The number of stones in a row needed to win.
+
+    Returns:
+        int: The pattern class, from NONE to FIVE.
+    """
+    return _classify_segment(tuple(cells), n_win, {})
+
+
+def _classify_segment(
+    cells: Tuple[int, ...], n_win: int, memo: Dict[Tuple[int, ...], int]
+) -> int:
+    if cells in memo:
+        return memo[cells]
+
+    windows = [
+        range(start, start + n_win)
+        for start in range(n_win)
+        if BLOCKED_CELL not in cells[start : start + n_win]
+    ]
+    counts = [sum(cells[k] == OWN_CELL for k in window) for window in windows]
+
+    pattern = NONE
+    if n_win in counts:
+        pattern = FIVE
+    elif n_win - 1 in counts:
+        winning_cells = {
+            k
+            for window, count in zip(windows, counts)
+            if count == n_win - 1
+            for k in window
+            if cells[k] == EMPTY_CELL
+        }
+        pattern = OPEN_FOUR if len(winning_cells) > 1 else CLOSED_FOUR
+    elif counts and max(counts) >= n_win - 3:
+        threat_cells = {
+            k
+            for window, count in zip(windows, counts)
+            if count >= n_win - 3
+            for k in window
+            if cells[k] == EMPTY_CELL
+        }
+        for k in threat_cells:
+            threat = _classify_segment(
+                cells[:k] + (OWN_CELL,) + cells[k + 1 :], n_win, memo
+            )
+            pattern = max(pattern, _DOWNGRADES.get(threat, NONE))
+
+    memo[cells] = pattern
+    return pattern
+
+
+@lru_cache(maxsize=None)
+def get_window_scores(n_win: int) -> Tuple[int, ...]:
+    """
+    Returns the score of a window still open to a color by its number of stones.
+
+    Every stone multiplies the score of a window by 10, except that the window
+    one stone short of a five scores as a closed four and a full window as a five.
+
+    Args:
+        n_win (int): The number of stones in a row needed to win.
+
+    Returns:
+        Tuple[int, ...]: The `n_win + 1` scores, from an empty window to a five.
+    """
+    scores = [0] + [10 ** (k - 1) for k in range(1, n_win)] + [PATTERN_SCORES[FIVE]]
+    scores[n_win - 1] = PATTERN_SCORES[CLOSED_FOUR]
+    return tuple(scores)
+
+
+@lru_cache(maxsize=None)
+def get_pattern_tables(n_win: int) -> Dict[str, Tuple[int, ...]]:
+    """
+    Returns the pattern class tables of both colors for the given `n_win`.
+
+    A table is indexed by the line codes of the `2 * (n_win - 1)` cells around a
+    stone, two bits per cell with the first cell of the segment in the lowest bits,
+    leaving out the centre cell itself. The tables are built once per `n_win` and
+    shared between all boards.
+
+    Args:
+        n_win (int): The number of stones in a row needed to win.
+
+    Returns:
+        Dict[str, Tuple[int, ...]]: The table of pattern classes of each stone color.
+    """
+    radius = n_win - 1
+    memo = {}
+    tables = {}
+
+    for color, own_code in ((BLACK, LINE_BLACK), (WHITE, LINE_WHITE)):
+        cell_of_code = [
+            OWN_CELL if code == own_code else BLOCKED_CELL for code in range(4)
+        ]
+        cell_of_code[LINE_EMPTY] = EMPTY_CELL
+
+        table = []
+        # product() varies the last item fastest, so the codes come high digit first
+        for codes in product(range(4), repeat=2 * radius):
+            cells = [cell_of_code[code] for code in reversed(codes)]
+            cells.insert(radius, OWN_CELL)
+            table.append(_classify_segment(tuple(cells), n_win, memo))
+
+        tables[color] = tuple(table)
+
+    return tables
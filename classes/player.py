@@ -1,15 +1,148 @@
+import multiprocessing
 import random
-from copy import deepcopy
-from typing import TYPE_CHECKING, List, Tuple
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .constants import BLACK, UNDEFINED, WHITE
+from .mcts import MCTSNode
+from .move_picker import MovePicker
+from .patterns import FIVE, PATTERN_SCORES
+from .search_stats import SearchStats
+from .threat_solver import ThreatSolver
+from .transposition import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
 
 if TYPE_CHECKING:
     from .board import Board
     from .player import Player, SmartPlayer
 
-# Constants
-WHITE = "W"
-BLACK = "B"
-UNDEFINED = "undefined"
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget of the move is used up.
+    """
+
+
+# Heuristics whose scores depend on the order of the moves that led to a position,
+# through the running scores of the board, so the transposition table only keeps
+# their moves
+PATH_DEPENDENT_HEURISTICS = ("advanced",)
+
+# State of a root search worker process, set up by `_init_root_worker`
+_root_worker = {}
+
+
+def _init_root_worker(
+    shared_alpha: "multiprocessing.sharedctypes.Synchronized",
+) -> None:
+    """
+    Initializes a worker process of the parallel root search.
+
+    Args:
+        shared_alpha (Synchronized): The best root score found so far by any worker.
+    """
+    _root_worker["alpha"] = shared_alpha
+    _root_worker["players"] = {}
+    _root_worker["search_id"] = None
+
+
+def _search_root_move(
+    snapshot: tuple,
+    stone_color: str,
+    move: Tuple[int, int],
+    target_depth: int,
+    heuristics: str,
+    pv_moves: Dict[int, Tuple[int, int]],
+    deadline: float,
+    search_id: int,
+    collect_stats: bool,
+    pvs: bool,
+) -> Tuple[int, Optional[SearchStats]]:
+    """
+    Searches a single root move in a worker process of the parallel root search.
+
+    The worker keeps a SmartPlayer per stone color, so its transposition table and
+    history tables carry over between the root moves and iterations of a search. The
+    move is searched against the best root score published by the other workers,
+    lowered by one, so that a move scoring the same as the best one still gets its
+    exact score and ties are broken by the root move order like the sequential search.
+
+    Args:
+        snapshot (tuple): The snapshot of the position from `Board.get_snapshot`.
+        stone_color (str): The stone color of the searching player.
+        move (Tuple[int, int]): The root move to search.
+        target_depth (int): The depth passed to minimax.
+        heuristics (str): The heuristics to evaluate with, "basic", "advanced" or "windows".
+        pv_moves (Dict[int, Tuple[int, int]]): The principal variation of the previous iteration.
+        deadline (float): The time.time() at which the search times out, None for no limit.
+        search_id (int): The number of the search the move belongs to.
+        collect_stats (bool): True to collect the statistics of the search of the move.
+        pvs (bool): True to search with principal variation search.
+
+    Returns:
+        Tuple[int, Optional[SearchStats]]: The score of the move, exact if it is higher
+        than the alpha it was searched with, and the statistics of its search if collected.
+    """
+    from .board import Board
+
+    board = Board.from_snapshot(snapshot)
+    players = _root_worker["players"]
+    player_key = (stone_color, board.size, board.nwin)
+    if player_key not in players:
+        opponent = Player(BLACK if stone_color == WHITE else WHITE)
+        player = SmartPlayer(stone_color, opponent)
+        player.transposition_table = TranspositionTable(board.transposition_table_size)
+        players[player_key] = player
+    player = players[player_key]
+    board.current_player = player
+    if stone_color == BLACK:
+        board.player_black, board.player_white = player, player.opponent
+    else:
+        board.player_black, board.player_white = player.opponent, player
+
+    if _root_worker["search_id"] != search_id:
+        _root_worker["search_id"] = search_id
+        for searcher in players.values():
+            searcher.transposition_table.new_search()
+            searcher.reset_move_ordering()
+
+    player._pv_moves = pv_moves
+    player._pvs = pvs
+    if deadline is not None:
+        player._deadline = time.perf_counter() + deadline - time.time()
+
+    stats = None
+    table = player.transposition_table
+    if collect_stats:
+        stats = SearchStats()
+        probes, hits = table.probes, table.hits
+    player._stats = stats
+
+    shared_alpha = _root_worker["alpha"]
+    player.set_move(*move, board, player)
+    try:
+        score = player.minimax(
+            board,
+            0,
+            target_depth,
+            False,
+            heuristics,
+            alpha=shared_alpha.value - 1,
+        )
+    finally:
+        player._deadline = None
+        player._stats = None
+
+    with shared_alpha.get_lock():
+        if score > shared_alpha.value:
+            shared_alpha.value = score
+
+    if stats is not None:
+        stats.tt_probes = table.probes - probes
+        stats.tt_hits = table.hits - hits
+
+    return score, stats
 
 
 class Player:
@@ -68,16 +201,97 @@ class SmartPlayer(Player):
     Represents a smart player who makes strategic moves.
 
     Inherits from Player.
+
+    Attributes:
+        opponent (Player): The opponent of the player.
+        transposition_table (TranspositionTable): The table of searched positions,
+            created with the size from the board config on the first search.
+        killer_moves (Dict[int, List[Tuple[int, int]]]): The last two moves that caused
+            a cutoff at each depth of the current search.
+        history_scores (Dict[str, Dict[Tuple[int, int], int]]): The history table of
+            each stone color, scoring moves by the cutoffs they caused.
+        first_move_cutoffs (int): The cutoffs caused by the first move tried at a node.
+        later_move_cutoffs (int): The cutoffs caused by any later move.
+        completed_depth (int): The target depth of the deepest completed iteration of
+            the last search.
+        principal_variation (List[Tuple[int, int]]): The expected line of play found by
+            the last search, starting with the chosen move.
+        target_depth (int): The maximum search depth, None to use the board config.
+        time_limit (float): The time budget per move, None to use the board config.
+        heuristics (str): The heuristics to evaluate with, None to use the one asked for.
+        pvs (bool): True for principal variation search with aspiration windows, False
+            for full-window alpha-beta, None to use the board config.
+        collect_stats (bool): True to collect the statistics of every search.
+        search_stats (SearchStats): The statistics of the last search, None if they are
+            not collected.
+        ponder (bool): True to search during the opponent's turn, see `start_pondering`.
+        ponder_move (Tuple[int, int]): The predicted reply of the opponent being pondered on.
+        ponder_hits (int): The opponent moves that were predicted by the pondering.
+        ponder_misses (int): The opponent moves that were not.
+        ponder_time_saved (float): The seconds of searching done ahead by the hits.
+
+    With `search_workers` above 1 in the board config, the root moves are searched in
+    a pool of worker processes, which lives until `close` is called.
     """
 
-    def __init__(self, stone_color: str, opponent: "Player"):
+    def __init__(
+        self,
+        stone_color: str,
+        opponent: "Player",
+        target_depth: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        heuristics: Optional[str] = None,
+        collect_stats: bool = False,
+        ponder: bool = False,
+        pvs: Optional[bool] = None,
+    ):
         super().__init__(stone_color)
         self.opponent = opponent
+        self.target_depth = target_depth
+        self.time_limit = time_limit
+        self.heuristics = heuristics
+        self.collect_stats = collect_stats
+        self.ponder = ponder
+        self.pvs = pvs
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+        self.ponder_time_saved = 0.0
+        self.search_stats = None
+        self._stats = None
+        self.transposition_table = None
+        self.reset_move_ordering()
+
+        self.completed_depth = None
+        self.principal_variation = []
+        self._pv_moves = {}
+        self._root_moves = None
+        self._solved_positions = None
+        self._deadline = None
+        self._pvs = False
+        self._executor = None
+        self._shared_alpha = None
+        self._search_id = 0
+
+        # the deadline of the whole move, which another thread may change while pondering
+        self._search_deadline = None
+        self._deadline_lock = threading.Lock()
+        # True for the separate player that runs the search of `start_pondering`
+        self._pondering = False
+        self._ponderer = None
+        self._ponder_thread = None
+        self.ponder_move = None
+        self._ponder_history_length = None
+        self._ponder_result = None
+        self._ponder_start = None
+        self._ponder_end = None
 
     def set_move(self, i: int, j: int, board: "Board", player: "Player") -> None:
         """
         Sets a move on the board for the given player.
 
+        The move is recorded on the undo stack of the board, so that changes the search
+        makes to the board scores afterwards are reverted by `unset_move`.
+
         Args:
             i (int): The row index on the board.
             j (int): The column index on the board.
@@ -88,9 +302,7 @@ class SmartPlayer(Player):
             None
         """
 
-        board.board[i][j].player = player
-        board.board[i][j].color = player.stone_color
-        board.board[i][j].visited = True
+        board.make_move(i, j, player)
 
     def unset_move(
         self,
@@ -101,8 +313,8 @@ class SmartPlayer(Player):
         """
         Unsets a move on the board at the specified coordinates.
 
-        This method resets the cell at the given (i, j) coordinates on the board
-        to its initial state, indicating that no player has made a move there.
+        This method takes back the last move set at the given (i, j) coordinates and
+        restores everything derived from the board to its state before that move.
 
         Args:
             i (int): The row index of the cell to unset.
@@ -113,9 +325,7 @@ class SmartPlayer(Player):
             None
         """
 
-        board.board[i][j].player = None
-        board.board[i][j].color = "_"
-        board.board[i][j].visited = False
+        board.unmake_move()
 
     def is_unvisited_left(self, board: "Board") -> bool:
         """
@@ -128,29 +338,30 @@ class SmartPlayer(Player):
             bool: True if there is at least one unvisited cell, False otherwise.
         """
 
-        for i in range(board.size):
-            for j in range(board.size):
-                if not board.is_visited(i, j):
-                    return True
-
-        return False
+        return board.bitboard.has_empty()
 
     def evaluate_basic(self, board: "Board", depth: int) -> int:
         """
         Evaluate the board state with a basic heuristic.
 
         This function evaluates the current state of the board and returns a score based on the depth of the game tree.
-        If the winner is a SmartPlayer, it returns a score indicating a win, adjusted by the depth. Otherwise, it returns
-        a score indicating a loss, also adjusted by the depth.
+        If the stones of this player form a winning line, it returns a score indicating a win, adjusted by the depth.
+        If the opponent's stones do, it returns a score indicating a loss, also adjusted by the depth.
+
+        The winning lines are looked up in the window counters of the bitboard, so the
+        whole board is checked in O(1).
 
         Args:
             board (Board): The current state of the game board.
             depth (int): The depth of the game tree at the current state.
 
         Returns:
-            int: The evaluated score of the board state.
+            int: The evaluated score of the board state, 0 if nobody has won yet.
         """
-        if type(board.winner) is SmartPlayer:
+        winner_color = board.bitboard.get_winner_color()
+        if winner_color is None:
+            return 0
+        elif winner_color == self.stone_color:
             return board.score_win - depth
         else:
             return board.score_loose + depth
@@ -161,7 +372,9 @@ class SmartPlayer(Player):
 
         This method calculates the evaluation score by combining the board's
         weighted score and pattern score, adjusted by the given depth. The
-        scores are weighted to provide a more nuanced evaluation.
+        scores are weighted to provide a more nuanced evaluation. A won or lost
+        position scores the basic win or loss score times the score of a five,
+        so that it outweighs any pattern score.
 
         Args:
             board (Board): The current state of the game board.
@@ -171,17 +384,49 @@ class SmartPlayer(Player):
             int: The evaluation score of the board.
         """
 
+        win_score = self.evaluate_basic(board, depth)
+        if win_score != 0:
+            return win_score * PATTERN_SCORES[FIVE]
+
         weighted_score = board.weighted_score * (depth + 1)
         pattern_score = board.pattern_score * (depth + 1)
         return weighted_score + pattern_score
 
-    def evaluate(self, board: "Board", depth: int, heuristics: str) -> int:
+    def evaluate_windows(self, board: "Board", depth: int) -> int:
+        """
+        Evaluates the board state from the stone counts of the winning windows.
+
+        Every window of `n_win` cells that is still open to one color scores for that
+        color by its number of stones, see `BitBoard.get_window_score`. The counters
+        are kept up to date on every move, so the evaluation is a handful of lookups.
+        Won and lost positions score as in `evaluate_advanced`.
+
+        Args:
+            board (Board): The current state of the game board.
+            depth (int): The depth of the game tree at the current state.
+
+        Returns:
+            int: The evaluation score of the board.
+        """
+        win_score = self.evaluate_basic(board, depth)
+        if win_score != 0:
+            return win_score * PATTERN_SCORES[FIVE]
+
+        return board.bitboard.get_window_score(self.stone_color)
+
+    def evaluate(
+        self,
+        board: "Board",
+        depth: int,
+        heuristics: str,
+    ) -> int:
         """
         Evaluate the current state of the board and return a score based on the game outcome.
 
         Args:
             board (Board): The current game board.
             depth (int): The depth of the game tree at the current state.
+            heuristics (str): The heuristics to evaluate with, "basic", "advanced" or "windows".
 
         Returns:
             int: A score representing the evaluation of the board state.
@@ -191,11 +436,11 @@ class SmartPlayer(Player):
         """
 
         if heuristics == "basic":
-            score = (
-                self.evaluate_basic(board, depth) if board.check_win_condition() else 0
-            )
+            score = self.evaluate_basic(board, depth)
         elif heuristics == "advanced":
             score = self.evaluate_advanced(board, depth)
+        elif heuristics == "windows":
+            score = self.evaluate_windows(board, depth)
         else:
             score = 0
 
@@ -214,6 +459,14 @@ class SmartPlayer(Player):
         """
         Perform the minimax algorithm with alpha-beta pruning to determine the best move.
 
+        Moves are tried in the order of a MovePicker: the transposition table move, immediate
+        wins and blocks, the killer moves of the ply, then the rest by history score.
+
+        With principal variation search, only the first move gets the full window. The
+        later ones are searched with a null window, which only proves that they are no
+        better than the best move so far, and searched again with the full window when
+        that fails.
+
         Args:
             board (Board): The current state of the game board.
             depth (int): The current depth in the game tree.
@@ -226,107 +479,779 @@ class SmartPlayer(Player):
             int: The evaluated score of the board for the current move.
         """
 
-        score = self.evaluate(board, depth, heuristics)
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        # the statistics cost a single check per node when they are not collected
+        stats = self._stats
+        if stats is not None:
+            stats.nodes += 1
 
-        if depth == target_depth or score != 0:
-            return score
+        is_won = board.bitboard.get_winner_color() is not None
+        if depth == target_depth or is_won:
+            if stats is not None:
+                stats.leaf_evaluations += 1
+            return self.evaluate(board, depth, heuristics)
 
-        if not self.is_unvisited_left(board):
+        # a full board, or one where no line can be completed, is a draw
+        if not self.is_unvisited_left(board) or board.is_drawn():
             return 0
 
-        if is_maximizing:
-            # Smart computer maximizes the score
-            best_score = -float("inf")
-
-            for i in range(board.size):
-                for j in range(board.size):
-                    if not board.is_visited(i, j):
-                        self.set_move(i, j, board, self)
-                        board.weighted_score += board.board_weights[i][j]
-                        board.pattern_score += board.get_pattern_count(i, j) * 10
-
-                        score = self.minimax(
-                            board,
-                            depth + 1,
-                            target_depth,
-                            not is_maximizing,
-                            heuristics,
-                            alpha,
-                            beta,
-                        )
-                        best_score = max(best_score, score)
-                        self.unset_move(i, j, board)
-
-                        alpha = max(alpha, best_score)
-                        if beta <= alpha:
-                            break
-
-            return best_score
+        # look up the position searched through another move order, whose score
+        # holds if it was searched at the same ply and does not depend on the path
+        remaining_depth = target_depth - depth
+        key = board.zobrist_hash ^ (board.bitboard.side_key if is_maximizing else 0)
+        ply = None if heuristics in PATH_DEPENDENT_HEURISTICS else depth
+        alpha_orig, beta_orig = alpha, beta
+        hash_move = None
+        entry = self.transposition_table.probe(key)
+        if entry is not None:
+            tt_depth, tt_score, tt_flag, hash_move, tt_ply = entry
+            if tt_depth >= remaining_depth and ply is not None and tt_ply == ply:
+                if tt_flag == EXACT:
+                    return tt_score
+                elif tt_flag == LOWER_BOUND:
+                    alpha = max(alpha, tt_score)
+                elif tt_flag == UPPER_BOUND:
+                    beta = min(beta, tt_score)
+
+                if beta <= alpha:
+                    return tt_score
+
+        # the previous iteration's principal variation goes first
+        hash_move = self._pv_moves.get(key, hash_move)
+
+        player = self if is_maximizing else self.opponent
+        move_picker = MovePicker(
+            board,
+            player.stone_color,
+            hash_move,
+            self.killer_moves.get(depth, ()),
+            self.history_scores[player.stone_color],
+        )
+
+        best_move = None
+        best_score = -float("inf") if is_maximizing else float("inf")
+        for n_moves, (i, j) in enumerate(move_picker):
+            self.set_move(i, j, board, player)
+            if is_maximizing:
+                # Smart computer maximizes the score
+                board.weighted_score += board.board_weights[i][j]
+                board.pattern_score += board.get_pattern_score(i, j, is_maximizing)
+            else:
+                # Player for black minimizes the score
+                board.weighted_score -= board.board_weights[i][j]
+                board.pattern_score -= board.get_pattern_score(i, j, is_maximizing)
+
+            window, score = (alpha, beta), None
+            if self._pvs and n_moves > 0:
+                # a null window only proves whether the move beats the best one so far
+                null_alpha, null_beta = (
+                    (alpha, alpha + 1) if is_maximizing else (beta - 1, beta)
+                )
+                score = self.minimax(
+                    board,
+                    depth + 1,
+                    target_depth,
+                    not is_maximizing,
+                    heuristics,
+                    null_alpha,
+                    null_beta,
+                )
+                if alpha < score < beta:
+                    if stats is not None:
+                        stats.pvs_researches += 1
+                    # the failed null window search still bounds the score on one side
+                    window = (score, beta) if is_maximizing else (alpha, score)
+                    score = None
+
+            if score is None:
+                score = self.minimax(
+                    board,
+                    depth + 1,
+                    target_depth,
+                    not is_maximizing,
+                    heuristics,
+                    *window,
+                )
+            self.unset_move(i, j, board)
+
+            if is_maximizing:
+                if score > best_score:
+                    best_score, best_move = score, (i, j)
+                alpha = max(alpha, best_score)
+            else:
+                if score < best_score:
+                    best_score, best_move = score, (i, j)
+                beta = min(beta, best_score)
+
+            if beta <= alpha:
+                self.update_move_ordering(
+                    depth, remaining_depth, (i, j), player, n_moves
+                )
+                if stats is not None:
+                    stats.cutoffs_by_ply[depth + 1] = (
+                        stats.cutoffs_by_ply.get(depth + 1, 0) + 1
+                    )
+                    stats.first_move_cutoffs += n_moves == 0
+                break
+
+        if best_score <= alpha_orig:
+            flag = UPPER_BOUND
+        elif best_score >= beta_orig:
+            flag = LOWER_BOUND
         else:
-            # Player for black minimizes the score
-            best_score = float("inf")
-
-            for i in range(board.size):
-                for j in range(board.size):
-                    if not board.is_visited(i, j):
-                        self.set_move(i, j, board, self.opponent)
-                        board.weighted_score -= board.board_weights[i][j]
-                        board.pattern_score -= board.get_pattern_count(i, j) * 10
-
-                        score = self.minimax(
-                            board,
-                            depth + 1,
-                            target_depth,
-                            not is_maximizing,
-                            heuristics,
-                            alpha,
-                            beta,
-                        )
-                        best_score = min(best_score, score)
-                        self.unset_move(i, j, board)
-
-                        beta = min(beta, best_score)
-                        if beta <= alpha:
-                            break
-
-            return best_score
-
-    def find_optimal_input(self, board: "Board", heuristics: str) -> Tuple[int, int]:
+            flag = EXACT
+        self.transposition_table.store(
+            key, remaining_depth, best_score, flag, best_move, ply
+        )
+
+        return best_score
+
+    def update_move_ordering(
+        self,
+        depth: int,
+        remaining_depth: int,
+        move: Tuple[int, int],
+        player: "Player",
+        n_moves: int,
+    ) -> None:
         """
-        Determines the optimal move for the player on the given board using the minimax algorithm.
+        Records a move that caused an alpha-beta cutoff.
+
+        The move becomes the first killer move of its ply, its history score grows
+        with the square of the remaining depth, and the cutoff is counted as a first
+        move or a later move cutoff.
+
+        Args:
+            depth (int): The depth of the node in the game tree.
+            remaining_depth (int): The depth left to search below the node.
+            move (Tuple[int, int]): The move that caused the cutoff.
+            player (Player): The player who made the move.
+            n_moves (int): The number of moves tried before it at the node.
+        """
+        killer_moves = self.killer_moves.setdefault(depth, [])
+        if move not in killer_moves:
+            killer_moves.insert(0, move)
+            del killer_moves[2:]
+
+        history = self.history_scores[player.stone_color]
+        history[move] = history.get(move, 0) + remaining_depth * remaining_depth
+
+        if n_moves == 0:
+            self.first_move_cutoffs += 1
+        else:
+            self.later_move_cutoffs += 1
+
+    def reset_move_ordering(self) -> None:
+        """Clears the killer moves, the history tables and the cutoff counters."""
+        self.killer_moves = {}
+        self.history_scores = {BLACK: {}, WHITE: {}}
+        self.first_move_cutoffs = 0
+        self.later_move_cutoffs = 0
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Returns the share of alpha-beta cutoffs caused by the first move tried."""
+        cutoffs = self.first_move_cutoffs + self.later_move_cutoffs
+        return self.first_move_cutoffs / cutoffs if cutoffs else 0.0
+
+    def get_root_moves(self, board: "Board") -> List[Tuple[int, int]]:
+        """
+        Returns the root moves of the current search in the order they are searched.
+
+        The moves are ordered like the inner nodes, with the move of the previous
+        iteration first. When the threat-space solver found defences against a
+        forced win of the opponent, only those are searched.
 
         Args:
             board (Board): The current state of the game board.
 
         Returns:
-            Tuple[int, int]: The coordinates of the optimal move as a tuple (row, column).
+            List[Tuple[int, int]]: The root moves.
         """
+        key = board.zobrist_hash ^ board.bitboard.side_key
+        moves = list(
+            MovePicker(
+                board,
+                self.stone_color,
+                self._pv_moves.get(key) or self.transposition_table.get_move(key),
+                history=self.history_scores[self.stone_color],
+            )
+        )
+        if self._root_moves is not None:
+            moves = [move for move in moves if move in self._root_moves] + [
+                move for move in self._root_moves if move not in moves
+            ]
 
-        best_score = -float("inf")
+        return moves
 
-        for i in range(board.size):
-            for j in range(board.size):
-                if not board.is_visited(i, j):
-                    self.set_move(i, j, board, self)
-                    score = self.minimax(
-                        board, 0, board.target_depth, False, heuristics
-                    )
-                    self.unset_move(i, j, board)
+    def probe_solved_positions(self, board: "Board") -> Optional[Tuple[int, int]]:
+        """
+        Looks up the position in the solved-position database of the board config.
+
+        The database is read when it is first needed. Only wins and draws are answered
+        from it, since a lost position is best played with the search, which picks the
+        move that makes the win hardest to find.
+
+        Args:
+            board (Board): The current state of the game board, with this player to move.
+
+        Returns:
+            Optional[Tuple[int, int]]: The move that wins or holds the draw, or None if the
+            position is not solved or lost.
+        """
+        from .solved_positions import SolvedPositionDatabase
+
+        database = self._solved_positions
+        if (
+            database is None
+            or database.file_path != board.solved_positions_path
+            or (database.size, database.n_win) != (board.size, board.nwin)
+        ):
+            database = SolvedPositionDatabase(
+                board.solved_positions_path, board.size, board.nwin
+            )
+            self._solved_positions = database
+
+        solved = database.probe(board.bitboard, self.stone_color)
+        if solved is None or solved[0] == self.opponent.stone_color:
+            return None
+        return solved[1]
+
+    def search_threats(
+        self, board: "Board"
+    ) -> Tuple[Optional[List[Tuple[int, int]]], Optional[List[Tuple[int, int]]]]:
+        """
+        Runs the threat-space solver on the position before the main search.
+
+        The solver first looks for a forced win of the player. Failing that, it looks
+        for a forced win of the opponent, as if the opponent were to move, and for the
+        moves that refute it. All of these share the threat search time limit of the
+        board config, which never runs past the deadline of the move.
+
+        Args:
+            board (Board): The current state of the game board, with this player to move.
+
+        Returns:
+            Tuple[Optional[List[Tuple[int, int]]], Optional[List[Tuple[int, int]]]]: The
+            winning line of the player, or None, and the moves that defend against a
+            forced win of the opponent, or None if the opponent has none. When no
+            defence holds, the first move of the opponent's win is the only one.
+        """
+        with self._deadline_lock:
+            deadline = self._search_deadline
+        if board.threat_search_time_limit:
+            threat_deadline = time.perf_counter() + board.threat_search_time_limit
+            deadline = (
+                threat_deadline if deadline is None else min(deadline, threat_deadline)
+            )
+
+        solver = ThreatSolver(board.threat_search_nodes)
+        line = solver.solve(board.bitboard, self.stone_color, deadline)
+        if line is not None:
+            return line, None
+
+        threat = solver.solve(board.bitboard, self.opponent.stone_color, deadline)
+        if threat is None:
+            return None, None
+
+        defences = solver.find_defences(
+            board.bitboard, self.stone_color, threat, deadline
+        )
+        return None, defences or threat[:1]
+
+    def search_root(
+        self,
+        board: "Board",
+        target_depth: int,
+        heuristics: str,
+        alpha: int = -float("inf"),
+        beta: int = float("inf"),
+    ) -> Tuple[Tuple[int, int], int]:
+        """
+        Searches every root move to the given depth and returns the best one.
+
+        Root moves are ordered like the inner nodes, with the move of the previous
+        iteration first, and each one is searched against the best score so far,
+        since moves that cannot beat it need no exact score. With principal variation
+        search, the moves after the first are searched with a null window first.
+
+        Args:
+            board (Board): The current state of the game board.
+            target_depth (int): The depth passed to minimax for each root move.
+            heuristics (str): The heuristics to evaluate with, "basic", "advanced" or "windows".
+            alpha (int, optional): The lower bound of the score window. Defaults to -float("inf").
+            beta (int, optional): The upper bound of the score window. Defaults to float("inf").
+
+        Returns:
+            Tuple[Tuple[int, int], int]: The best move and its score. A score at or
+            outside the bounds of the window is only a bound of the exact score.
+        """
+        key = board.zobrist_hash ^ board.bitboard.side_key
+        best_move, best_score = None, -float("inf")
+        for n_moves, (i, j) in enumerate(self.get_root_moves(board)):
+            self.set_move(i, j, board, self)
+            bound = max(alpha, best_score)
+            score = None
+            if self._pvs and n_moves > 0:
+                score = self.minimax(
+                    board, 0, target_depth, False, heuristics, bound, bound + 1
+                )
+                if bound < score < beta:
+                    if self._stats is not None:
+                        self._stats.pvs_researches += 1
+                    bound, score = score, None
+            if score is None:
+                score = self.minimax(
+                    board, 0, target_depth, False, heuristics, bound, beta
+                )
+            self.unset_move(i, j, board)
+
+            if score > best_score:
+                best_move = (i, j)
+                best_score = score
+            if best_score >= beta:
+                break
+
+        # the root is never searched by minimax, its entry only serves its move
+        if alpha < best_score < beta:
+            self.transposition_table.store(
+                key, target_depth + 1, best_score, EXACT, best_move, None
+            )
+
+        return best_move, best_score
+
+    def search_root_parallel(
+        self, board: "Board", target_depth: int, heuristics: str
+    ) -> Tuple[Tuple[int, int], int]:
+        """
+        Searches the root moves in worker processes and returns the best one.
 
-                    if score > best_score:
-                        best_move = (i, j)
-                        best_score = score
+        Every worker gets a compact snapshot of the position and searches one root
+        move at a time against the best score published so far, so root moves that
+        start after a good move has been found are pruned as in `search_root`. The
+        scores are collected in the root move order and the first move with the best
+        score is chosen, which is the move the sequential search would choose.
+
+        Args:
+            board (Board): The current state of the game board.
+            target_depth (int): The depth passed to minimax for each root move.
+            heuristics (str): The heuristics to evaluate with, "basic", "advanced" or "windows".
+
+        Returns:
+            Tuple[Tuple[int, int], int]: The best move and its score.
+
+        Raises:
+            SearchTimeout: If the time budget runs out before every root move is searched.
+        """
+        if self._executor is None:
+            self._shared_alpha = multiprocessing.Value("d", -float("inf"))
+            self._executor = ProcessPoolExecutor(
+                board.search_workers,
+                initializer=_init_root_worker,
+                initargs=(self._shared_alpha,),
+            )
+
+        key = board.zobrist_hash ^ board.bitboard.side_key
+        moves = self.get_root_moves(board)
+
+        deadline = None
+        if self._deadline is not None:
+            deadline = time.time() + self._deadline - time.perf_counter()
+
+        self._shared_alpha.value = -float("inf")
+        snapshot = board.get_snapshot()
+        futures = [
+            self._executor.submit(
+                _search_root_move,
+                snapshot,
+                self.stone_color,
+                move,
+                target_depth,
+                heuristics,
+                self._pv_moves,
+                deadline,
+                self._search_id,
+                self._stats is not None,
+                self._pvs,
+            )
+            for move in moves
+        ]
+        try:
+            scores = []
+            for future in futures:
+                score, stats = future.result()
+                scores.append(score)
+                if stats is not None:
+                    self._stats.merge(stats)
+        finally:
+            for future in futures:
+                future.cancel()
+
+        best_score = max(scores)
+        best_move = moves[scores.index(best_score)]
+
+        self.transposition_table.store(
+            key, target_depth + 1, best_score, EXACT, best_move, None
+        )
+
+        return best_move, best_score
+
+    def close(self) -> None:
+        """Stops pondering and shuts down the worker processes of the parallel root search, if any."""
+        self.stop_pondering()
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+            self._shared_alpha = None
+
+    def get_principal_variation(
+        self, board: "Board", max_length: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Follows the best moves stored in the transposition table from the current position.
+
+        Args:
+            board (Board): The current state of the game board, with this player to move.
+            max_length (int): The maximum number of moves to follow.
+
+        Returns:
+            List[Tuple[int, int]]: The moves of the principal variation.
+        """
+        principal_variation = []
+        is_maximizing = True
+        while len(principal_variation) < max_length:
+            key = board.zobrist_hash ^ (board.bitboard.side_key if is_maximizing else 0)
+            move = self.transposition_table.get_move(key)
+            if move is None or board.is_visited(*move):
+                break
+
+            player = self if is_maximizing else self.opponent
+            self.set_move(*move, board, player)
+            principal_variation.append(move)
+            is_maximizing = not is_maximizing
+
+        for move in reversed(principal_variation):
+            self.unset_move(*move, board)
+
+        return principal_variation
+
+    def find_optimal_input(
+        self, board: "Board", heuristics: str
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Determines the optimal move for the player on the given board using the minimax algorithm.
+
+        The search deepens iteratively up to the target depth. Each iteration starts
+        from the principal variation of the previous one, and once the time limit
+        has passed the running iteration is abandoned and the best move of the
+        deepest completed one is returned. The first iteration always completes.
+
+        Positions searched in earlier turns stay in the transposition table, and the
+        hit rate of the current search is available from `transposition_table.hit_rate`.
+
+        With more than one search worker in the board config, the iterations after the
+        first search the root moves in parallel with `search_root_parallel`.
+
+        With `collect_stats` set, the statistics of the search are left in `search_stats`.
+
+        With a solved-position database in the board config, a win or a draw found in it
+        is played at once. Unless `threat_search_nodes` is 0 in the board config, the
+        threat-space solver runs next: a proven forced win is played at once, and against a proven forced
+        win of the opponent only the moves that defend against it are searched. The time
+        of the solver comes out of the time limit of the move.
+
+        With principal variation search, each sequential iteration after the first is
+        searched within the aspiration window of the board config around the score of
+        the previous one, and searched again with a full window if its score falls
+        outside.
+
+        The target depth, the time limit, the heuristics and the search mode of the
+        player take precedence over the board config and the `heuristics` argument.
+
+        If the player was pondering, the pondering search is taken over when the
+        opponent played the predicted move, and stopped otherwise.
+
+        Args:
+            board (Board): The current state of the game board.
+            heuristics (str): The heuristics to evaluate with, "basic", "advanced" or "windows".
+
+        Returns:
+            Optional[Tuple[int, int]]: The coordinates of the optimal move as a tuple
+            (row, column), None for a pondering search stopped in its first iteration.
+        """
+        if self._ponder_thread not in (None, threading.current_thread()):
+            move = self.finish_pondering(board)
+            if move is not None:
+                return move
+
+        heuristics = self.heuristics or heuristics
+        max_depth = (
+            board.target_depth if self.target_depth is None else self.target_depth
+        )
+        time_limit = board.time_limit if self.time_limit is None else self.time_limit
+        self._pvs = board.search_pvs if self.pvs is None else self.pvs
+
+        if self.transposition_table is None:
+            self.transposition_table = TranspositionTable(
+                board.transposition_table_size
+            )
+        self.transposition_table.new_search()
+        self.reset_move_ordering()
+        self._search_id += 1
+
+        start_time = time.perf_counter()
+        if not self._pondering:
+            # the deadline of a pondering search is set by `start_pondering` and
+            # changed when the opponent has moved, possibly before the search starts
+            with self._deadline_lock:
+                self._search_deadline = start_time + time_limit if time_limit else None
+        n_moves = len(board.history)
+        self.completed_depth = None
+        self.principal_variation = []
+        stats = SearchStats() if self.collect_stats else None
+        self._stats = stats
+
+        line = None
+        if board.solved_positions_path:
+            move = self.probe_solved_positions(board)
+            line = None if move is None else [move]
+        if line is None and board.threat_search_nodes:
+            line, self._root_moves = self.search_threats(board)
+        if line is not None:
+            # a solved position or a proven win is played without searching
+            self._stats = None
+            self.principal_variation = line
+            if stats is not None:
+                stats.elapsed_time = time.perf_counter() - start_time
+                stats.principal_variation = list(line)
+            self.search_stats = stats
+            return line[0]
+
+        # only a pondering search can be stopped before its first iteration completes
+        best_move, best_score = None, None
+        for target_depth in range(max_depth + 1):
+            # the first iteration always completes so that there is a move to play
+            if target_depth > 0:
+                with self._deadline_lock:
+                    self._deadline = self._search_deadline
+
+            # a single evaluation per root move is not worth the worker processes, and
+            # the workers would not see a pondering search being stopped
+            parallel = (
+                board.search_workers > 1 and target_depth > 0 and not self._pondering
+            )
+
+            try:
+                if parallel:
+                    move, score = self.search_root_parallel(
+                        board, target_depth, heuristics
+                    )
+                elif self._pvs and best_score is not None:
+                    alpha = best_score - board.aspiration_window
+                    beta = best_score + board.aspiration_window
+                    move, score = self.search_root(
+                        board, target_depth, heuristics, alpha, beta
+                    )
+                    if not alpha < score < beta:
+                        if stats is not None:
+                            stats.aspiration_researches += 1
+                        move, score = self.search_root(board, target_depth, heuristics)
+                else:
+                    move, score = self.search_root(board, target_depth, heuristics)
+            except SearchTimeout:
+                # take back the moves of the abandoned iteration
+                while len(board.history) > n_moves:
+                    board.unmake_move()
+                break
+            finally:
+                self._deadline = None
+
+            best_move, best_score = move, score
+            self.completed_depth = target_depth
+            self.principal_variation = self.get_principal_variation(
+                board, target_depth + 2
+            ) or [best_move]
+            self._pv_moves = self.get_pv_moves(board, self.principal_variation)
+
+        self._pv_moves = {}
+        self._root_moves = None
+        self._stats = None
+
+        if stats is not None:
+            if self.completed_depth is not None:
+                stats.depth_reached = self.completed_depth + 1
+            stats.tt_probes += self.transposition_table.probes
+            stats.tt_hits += self.transposition_table.hits
+            stats.elapsed_time = time.perf_counter() - start_time
+            stats.principal_variation = list(self.principal_variation)
+        self.search_stats = stats
 
         return best_move
 
+    def get_pv_moves(
+        self, board: "Board", principal_variation: List[Tuple[int, int]]
+    ) -> Dict[int, Tuple[int, int]]:
+        """
+        Maps the search keys of the positions along a principal variation to their moves.
+
+        Args:
+            board (Board): The current state of the game board, with this player to move.
+            principal_variation (List[Tuple[int, int]]): The moves of the principal variation.
+
+        Returns:
+            Dict[int, Tuple[int, int]]: The move to try first in each position of the variation.
+        """
+        pv_moves = {}
+        is_maximizing = True
+        for move in principal_variation:
+            key = board.zobrist_hash ^ (board.bitboard.side_key if is_maximizing else 0)
+            pv_moves[key] = move
+            self.set_move(*move, board, self if is_maximizing else self.opponent)
+            is_maximizing = not is_maximizing
+
+        for move in reversed(principal_variation):
+            self.unset_move(*move, board)
+
+        return pv_moves
+
+    @property
+    def ponder_hit_rate(self) -> float:
+        """Returns the share of the opponent moves predicted by the pondering."""
+        n_ponders = self.ponder_hits + self.ponder_misses
+        return self.ponder_hits / n_ponders if n_ponders else 0.0
+
+    def start_pondering(self, board: "Board", heuristics: str) -> None:
+        """
+        Starts searching the position after the opponent's predicted reply in the background.
+
+        The predicted reply is the second move of the principal variation of the last
+        search. The search runs in a thread on a copy of the board, without a time limit
+        until the opponent has moved. It runs on a separate SmartPlayer that shares only
+        the transposition table of the player, so the results of the last search of the
+        player are left alone until `finish_pondering` takes the pondering search over.
+        Pure Python search holds the GIL, so pondering pays off while the main thread
+        waits, such as for the input of a human player.
+
+        Args:
+            board (Board): The current state of the game board, with the opponent to move.
+            heuristics (str): The heuristics to evaluate with, "basic", "advanced" or "windows".
+        """
+        self.stop_pondering()
+        if len(self.principal_variation) < 2:
+            return
+        move = self.principal_variation[1]
+        if board.is_visited(*move):
+            return
+
+        if self.transposition_table is None:
+            self.transposition_table = TranspositionTable(
+                board.transposition_table_size
+            )
+        ponderer = SmartPlayer(
+            self.stone_color,
+            self.opponent,
+            target_depth=self.target_depth,
+            time_limit=self.time_limit,
+            heuristics=self.heuristics,
+            collect_stats=self.collect_stats,
+            pvs=self.pvs,
+        )
+        ponderer.transposition_table = self.transposition_table
+        ponderer._solved_positions = self._solved_positions
+        # no deadline until the opponent has moved, set before the search can start
+        ponderer._pondering = True
+        ponderer._search_deadline = None
+
+        ponder_board = board.copy()
+        ponder_board.make_move(*move, self.opponent)
+        ponder_board.current_player = ponderer
+
+        self._ponderer = ponderer
+        self.ponder_move = move
+        self._ponder_history_length = len(board.history) + 1
+        self._ponder_result = None
+        self._ponder_start = time.perf_counter()
+        self._ponder_end = None
+        self._ponder_thread = threading.Thread(
+            target=self._ponder, args=(ponder_board, heuristics), daemon=True
+        )
+        self._ponder_thread.start()
+
+    def _ponder(self, board: "Board", heuristics: str) -> None:
+        try:
+            self._ponder_result = self._ponderer.find_optimal_input(board, heuristics)
+        except SearchTimeout:
+            self._ponder_result = None
+        self._ponder_end = time.perf_counter()
+
+    def _stop_ponder_thread(self, deadline: Optional[float]) -> None:
+        ponderer = self._ponderer
+        with ponderer._deadline_lock:
+            ponderer._search_deadline = ponderer._deadline = deadline
+        self._ponder_thread.join()
+        self._ponder_thread = None
+        self._ponderer = None
+        self.ponder_move = None
+
+    def finish_pondering(self, board: "Board") -> Optional[Tuple[int, int]]:
+        """
+        Ends the pondering once the opponent has moved.
+
+        On a hit, the pondering search gets the time limit of the move from now on,
+        and its move and its results, such as `principal_variation`, become those of
+        the player. On a miss, the search is stopped and its entries stay in the
+        transposition table for the real search.
+
+        Args:
+            board (Board): The current state of the game board, with this player to move.
+
+        Returns:
+            Optional[Tuple[int, int]]: The move of the pondering search on a hit, None on a miss.
+        """
+        last_move = board.last_move
+        is_hit = (
+            last_move is not None
+            and (last_move.x, last_move.y) == self.ponder_move
+            and len(board.history) == self._ponder_history_length
+        )
+        if not is_hit:
+            self._stop_ponder_thread(-float("inf"))
+            self.ponder_misses += 1
+            return None
+
+        hit_time = time.perf_counter()
+        time_limit = board.time_limit if self.time_limit is None else self.time_limit
+        ponderer = self._ponderer
+        self._stop_ponder_thread(hit_time + time_limit if time_limit else None)
+        if self._ponder_result is None:
+            self.ponder_misses += 1
+            return None
+
+        self.completed_depth = ponderer.completed_depth
+        self.principal_variation = ponderer.principal_variation
+        self.search_stats = ponderer.search_stats
+        self._solved_positions = ponderer._solved_positions
+
+        self.ponder_hits += 1
+        self.ponder_time_saved += min(hit_time, self._ponder_end) - self._ponder_start
+        return self._ponder_result
+
+    def stop_pondering(self) -> None:
+        """Stops the pondering search, if any, without counting it as a hit or a miss."""
+        if self._ponder_thread is not None:
+            self._stop_ponder_thread(-float("inf"))
+
     def get_input(self, board: "Board", heuristics: str = "basic") -> str:
         """
         Determines the optimal move for the player based on the current state of the board.
 
-        This method uses a deep copy of the board to simulate the game tree and find the optimal move.
+        The game tree is searched on the live board, and every move made by the search is
+        taken back with `Board.unmake_move`, so the board is left exactly as it was.
         Currently, it supports the following approaches:
         - Heuristics with minimax function and backtracking (Game tree)
-        - Monte Carlo Tree search (not implemented)
+        - Monte Carlo Tree search (see MCTSPlayer)
         - Reinforcement learning (not implemented)
 
         Args:
@@ -338,11 +1263,187 @@ class SmartPlayer(Player):
 
         # 3 approaches to find the optimal move
         # approach1: Heuristics with minimax function and backtracking (Game tree)
-        # approach2: Monte Carlo Tree search (not implemented)
-        # approach2: Reinforcement learning (not implemented)
+        # approach2: Monte Carlo Tree search, see MCTSPlayer
+        # approach3: Reinforcement learning (not implemented)
+
+        x, y = self.find_optimal_input(board, heuristics)
+        return f"{x} {y}"
+
+
+class MCTSPlayer(Player):
+    """
+    Represents a computer player using Monte Carlo Tree Search.
+
+    Inherits from Player.
+
+    Every iteration walks down the search tree on the live board with UCT selection,
+    expands one candidate move, plays the game out with random moves on the stone
+    integers of the bitboard and records the winner in the nodes on the path. The
+    search stops after `iterations` playouts or `time_limit` seconds, whichever comes
+    first, and plays the most visited move. Both limits come from the board config
+    unless they are set on the player. The subtree of the position after the
+    opponent's reply is kept for the next turn.
 
-        board_ai = deepcopy(board)
-        # pass the copy of board to the function
-        # to simulate the game tree and find the optimal move.
-        x, y = self.find_optimal_input(board_ai, heuristics)
+    Attributes:
+        opponent (Player): The opponent of the player.
+        root (MCTSNode): The subtree kept for the next turn, None if there is none.
+        playouts (int): The number of playouts of the last search.
+        reused_playouts (int): The playouts inherited from the previous turn's tree.
+        search_time (float): The duration of the last search in seconds.
+        iterations (int): The playouts per move, None to use the board config.
+        time_limit (float): The time budget per move, None to use the board config.
+    """
+
+    def __init__(
+        self,
+        stone_color: str,
+        opponent: "Player",
+        iterations: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(stone_color)
+        self.opponent = opponent
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.root = None
+        self.playouts = 0
+        self.reused_playouts = 0
+        self.search_time = 0.0
+        self._root_history_length = None
+        # the random moves of the search, seeded for reproducible playouts
+        self._rng = random.Random(seed)
+
+    @property
+    def playouts_per_second(self) -> float:
+        """Returns the playout rate of the last search."""
+        return self.playouts / self.search_time if self.search_time else 0.0
+
+    def get_root(self, board: "Board") -> MCTSNode:
+        """
+        Returns the root of the search tree for the current position.
+
+        If the board has moved on by exactly this player's last move and one reply
+        of the opponent, the subtree under that reply becomes the new root.
+
+        Args:
+            board (Board): The current state of the game board, with this player to move.
+
+        Returns:
+            MCTSNode: The root node, with the opponent as the player of its move.
+        """
+        root, self.root = self.root, None
+        if root is not None and len(board.history) == self._root_history_length + 1:
+            played = board.history[self._root_history_length - 1]
+            reply = board.history[-1]
+            child = root.children.get((reply.x, reply.y))
+            if (played.x, played.y) == root.move and child is not None:
+                child.parent = None
+                return child
+
+        return MCTSNode(None, self.opponent.stone_color)
+
+    def run_iteration(self, board: "Board", root: MCTSNode, exploration: float):
+        """
+        Runs one selection, expansion, playout and backpropagation step.
+
+        Args:
+            board (Board): The current state of the game board, left unchanged.
+            root (MCTSNode): The root of the search tree.
+            exploration (float): The exploration constant of the UCT formula.
+        """
+        bitboard = board.bitboard
+        players = {self.stone_color: self, self.opponent.stone_color: self.opponent}
+        n_moves = 0
+
+        node = root
+        while not node.is_terminal:
+            if node.untried_moves is None:
+                node.untried_moves = board.get_candidate_moves()
+                self._rng.shuffle(node.untried_moves)
+
+            if node.untried_moves:
+                move = node.untried_moves.pop()
+                color = WHITE if node.color == BLACK else BLACK
+                board.make_move(*move, players[color])
+                n_moves += 1
+                winner = color if bitboard.has_five(color) else None
+                node = node.add_child(
+                    move,
+                    color,
+                    winner,
+                    winner is not None or not bitboard.has_open_window(),
+                )
+                break
+
+            node = node.select_child(exploration)
+            board.make_move(*node.move, players[node.color])
+            n_moves += 1
+
+        if node.is_terminal:
+            winner = node.winner
+        else:
+            winner = bitboard.playout(
+                WHITE if node.color == BLACK else BLACK, self._rng
+            )
+
+        for _ in range(n_moves):
+            board.unmake_move()
+
+        node.update(winner)
+
+    def find_optimal_input(self, board: "Board") -> Tuple[int, int]:
+        """
+        Searches the current position and returns the most visited move.
+
+        Args:
+            board (Board): The current state of the game board.
+
+        Returns:
+            Tuple[int, int]: The coordinates of the chosen move as a tuple (row, column).
+
+        Raises:
+            ValueError: If neither an iteration limit nor a time limit is configured.
+        """
+        iterations = (
+            board.mcts_iterations if self.iterations is None else self.iterations
+        )
+        time_limit = (
+            board.mcts_time_limit if self.time_limit is None else self.time_limit
+        )
+        if not iterations and not time_limit:
+            raise ValueError("MCTS needs an iteration limit or a time limit.")
+
+        root = self.get_root(board)
+        self.reused_playouts = root.visits
+
+        start_time = time.perf_counter()
+        deadline = start_time + time_limit
+        playouts = 0
+        while (not iterations or playouts < iterations) and (
+            not time_limit or time.perf_counter() < deadline
+        ):
+            self.run_iteration(board, root, board.mcts_exploration)
+            playouts += 1
+
+        self.playouts = playouts
+        self.search_time = time.perf_counter() - start_time
+
+        best_child = root.get_best_child()
+        self.root = best_child
+        self._root_history_length = len(board.history) + 1
+
+        return best_child.move
+
+    def get_input(self, board: "Board") -> str:
+        """
+        Determines the move for the player with Monte Carlo Tree Search.
+
+        Args:
+            board (Board): The current state of the game board.
+
+        Returns:
+            str: The coordinates of the chosen move in the format "x y".
+        """
+        x, y = self.find_optimal_input(board)
         return f"{x} {y}"
@@ -0,0 +1,190 @@
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .constants import BLACK, DRAW, WHITE
+
+if TYPE_CHECKING:
+    from .bitboard import BitBoard
+
+INFINITY = float("inf")
+
+
+class ProofNode:
+    """
+    A node of the proof-number search tree.
+
+    Attributes:
+        move (Tuple[int, int]): The move that leads to the node, None at the root.
+        parent (ProofNode): The parent node, None at the root.
+        children (List[ProofNode]): The child nodes, empty until the node is expanded.
+        proof (float): The number of leaves still to prove to prove the node.
+        disproof (float): The number of leaves still to disprove to disprove the node.
+    """
+
+    __slots__ = ("move", "parent", "children", "proof", "disproof")
+
+    def __init__(
+        self,
+        move: Optional[Tuple[int, int]] = None,
+        parent: Optional["ProofNode"] = None,
+    ):
+        self.move = move
+        self.parent = parent
+        self.children: List["ProofNode"] = []
+        self.proof = 1
+        self.disproof = 1
+
+    def set_value(self, proven: bool) -> None:
+        """
+        Marks the node as proven or disproven.
+
+        Args:
+            proven (bool): True if the node is proven, False if it is disproven.
+        """
+        self.proof, self.disproof = (0, INFINITY) if proven else (INFINITY, 0)
+
+
+class ProofNumberSolver:
+    """
+    Solves positions with proof-number search.
+
+    A proof-number search proves or disproves that one color, the attacker, can
+    force a win. It always expands the most-proving leaf: the one whose proof
+    would bring the root closest to being proven or disproven, going down the
+    child with the smallest proof number where the attacker moves and the child
+    with the smallest disproof number where the defender moves.
+
+    A position is solved with up to two searches: a win of the side to move, and
+    failing that a win of the opponent. When neither color can force a win the
+    position is drawn. Every search builds a tree of at most `max_nodes` nodes,
+    which bounds its memory, and a search that runs out of them leaves the
+    position unsolved.
+
+    Attributes:
+        max_nodes (int): The node budget of a search.
+        nodes (int): The nodes created by the last call of `solve`.
+    """
+
+    def __init__(self, max_nodes: int = 100000):
+        self.max_nodes = max_nodes
+        self.nodes = 0
+
+    def solve(
+        self, bitboard: "BitBoard", color: str
+    ) -> Tuple[Optional[str], Optional[Tuple[int, int]]]:
+        """
+        Solves a position.
+
+        Args:
+            bitboard (BitBoard): The position, which is left untouched.
+            color (str): The stone color of the side to move.
+
+        Returns:
+            Tuple[Optional[str], Optional[Tuple[int, int]]]: The stone color of the winner,
+            DRAW, or None if the position was not solved within the budget, and the move
+            that wins or holds the draw, or None if the side to move loses.
+        """
+        opponent = WHITE if color == BLACK else BLACK
+        work = bitboard.copy()
+        self.nodes = 0
+
+        proven, move = self._prove(work, color, color)
+        if proven is None:
+            return None, None
+        if proven:
+            return color, move
+
+        proven, move = self._prove(work, color, opponent)
+        if proven is None:
+            return None, None
+        if proven:
+            return opponent, None
+
+        return DRAW, move
+
+    def _prove(
+        self, bitboard: "BitBoard", color: str, attacker: str
+    ) -> Tuple[Optional[bool], Optional[Tuple[int, int]]]:
+        root = ProofNode()
+        n_nodes = 1
+        while root.proof and root.disproof:
+            if n_nodes >= self.max_nodes:
+                self.nodes += n_nodes
+                return None, None
+
+            # walk down to the most-proving node, playing its moves
+            node, mover = root, color
+            while node.children:
+                if mover == attacker:
+                    node = min(node.children, key=lambda child: child.proof)
+                else:
+                    node = min(node.children, key=lambda child: child.disproof)
+                bitboard.set_stone(*node.move, mover)
+                mover = WHITE if mover == BLACK else BLACK
+
+            n_nodes += self._expand(node, bitboard, mover, attacker)
+
+            # back up the proof numbers, taking the moves back
+            while True:
+                if node.children:
+                    self._update(node, mover == attacker)
+                if node.parent is None:
+                    break
+                if not node.proof or not node.disproof:
+                    # a solved subtree is never searched again
+                    node.children = []
+                bitboard.remove_stone(*node.move)
+                node = node.parent
+                mover = WHITE if mover == BLACK else BLACK
+
+        self.nodes += n_nodes
+        if root.proof == 0:
+            solved = [child for child in root.children if child.proof == 0]
+        else:
+            solved = [child for child in root.children if child.disproof == 0]
+        return root.proof == 0, solved[0].move if solved else None
+
+    def _expand(
+        self, node: ProofNode, bitboard: "BitBoard", mover: str, attacker: str
+    ) -> int:
+        waiter = WHITE if mover == BLACK else BLACK
+        wins = bitboard.get_winning_cells(mover)
+        if wins:
+            cells = bitboard.get_cells(wins)[:1]
+            value = mover == attacker
+        else:
+            threats = bitboard.get_winning_cells(waiter)
+            if threats & (threats - 1):
+                # only one of the cells can be blocked
+                cells = bitboard.get_cells(threats)[:1]
+                value = waiter == attacker
+            elif threats:
+                cells = bitboard.get_cells(threats)
+                value = None
+            elif not bitboard.get_open_cells(attacker):
+                # no window is left that the attacker could complete
+                node.set_value(False)
+                return 0
+            else:
+                cells = bitboard.get_cells(
+                    bitboard.get_open_cells(mover) | bitboard.get_open_cells(waiter)
+                )
+                cells.sort(
+                    key=lambda cell: bitboard.get_pattern_score(*cell, mover)
+                    + bitboard.get_pattern_score(*cell, waiter),
+                    reverse=True,
+                )
+                value = None
+
+        node.children = [ProofNode(cell, node) for cell in cells]
+        if value is not None:
+            for child in node.children:
+                child.set_value(value)
+        return len(node.children)
+
+    def _update(self, node: ProofNode, is_or_node: bool) -> None:
+        if is_or_node:
+            node.proof = min(child.proof for child in node.children)
+            node.disproof = sum(child.disproof for child in node.children)
+        else:
+            node.proof = sum(child.proof for child in node.children)
+            node.disproof = min(child.disproof for child in node.children)
@@ -0,0 +1,120 @@
+from typing import Dict, List, Tuple
+
+
+class SearchStats:
+    """
+    Collects the statistics of one move search of a SmartPlayer.
+
+    Attributes:
+        nodes (int): The number of minimax nodes visited.
+        leaf_evaluations (int): The number of positions scored by the evaluation function.
+        cutoffs_by_ply (Dict[int, int]): The alpha-beta cutoffs at the nodes of each ply,
+            the positions after the root moves being ply 1.
+        depth_reached (int): The number of plies of the deepest completed iteration.
+        tt_probes (int): The transposition table lookups.
+        tt_hits (int): The lookups that found an entry.
+        first_move_cutoffs (int): The cutoffs caused by the first move tried at a node.
+        pvs_researches (int): The moves searched again with a full window after failing
+            high on a null window.
+        aspiration_researches (int): The iterations searched again with a full window
+            after their score fell outside the aspiration window.
+        elapsed_time (float): The duration of the search in seconds.
+        principal_variation (List[Tuple[int, int]]): The expected line of play.
+    """
+
+    def __init__(self):
+        self.nodes = 0
+        self.leaf_evaluations = 0
+        self.cutoffs_by_ply: Dict[int, int] = {}
+        self.depth_reached = 0
+        self.tt_probes = 0
+        self.tt_hits = 0
+        self.first_move_cutoffs = 0
+        self.pvs_researches = 0
+        self.aspiration_researches = 0
+        self.elapsed_time = 0.0
+        self.principal_variation: List[Tuple[int, int]] = []
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Returns the search speed in nodes per second."""
+        return self.nodes / self.elapsed_time if self.elapsed_time else 0.0
+
+    @property
+    def tt_hit_rate(self) -> float:
+        """Returns the share of transposition table lookups that found an entry."""
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+    @property
+    def cutoffs(self) -> int:
+        """Returns the alpha-beta cutoffs at all plies."""
+        return sum(self.cutoffs_by_ply.values())
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Returns the share of alpha-beta cutoffs caused by the first move tried."""
+        cutoffs = self.cutoffs
+        return self.first_move_cutoffs / cutoffs if cutoffs else 0.0
+
+    def merge(self, other: "SearchStats") -> None:
+        """
+        Adds the node, evaluation, cutoff, re-search and lookup counts of another search,
+        such as the search of a root move in a worker process.
+
+        Args:
+            other (SearchStats): The statistics to add.
+        """
+        self.nodes += other.nodes
+        self.leaf_evaluations += other.leaf_evaluations
+        self.tt_probes += other.tt_probes
+        self.tt_hits += other.tt_hits
+        self.first_move_cutoffs += other.first_move_cutoffs
+        self.pvs_researches += other.pvs_researches
+        self.aspiration_researches += other.aspiration_researches
+        for ply, cutoffs in other.cutoffs_by_ply.items():
+            self.cutoffs_by_ply[ply] = self.cutoffs_by_ply.get(ply, 0) + cutoffs
+
+    def to_dict(self) -> dict:
+        """
+        Returns the statistics as plain values, ready for JSON.
+
+        Returns:
+            dict: The statistics by name, including the derived rates.
+        """
+        return {
+            "nodes": self.nodes,
+            "leaf_evaluations": self.leaf_evaluations,
+            "cutoffs_by_ply": dict(sorted(self.cutoffs_by_ply.items())),
+            "depth_reached": self.depth_reached,
+            "tt_probes": self.tt_probes,
+            "tt_hits": self.tt_hits,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoff_rate,
+            "pvs_researches": self.pvs_researches,
+            "aspiration_researches": self.aspiration_researches,
+            "elapsed_time": self.elapsed_time,
+            "nodes_per_second": self.nodes_per_second,
+            "principal_variation": [list(move) for move in self.principal_variation],
+        }
+
+    def format_summary(self) -> str:
+        """
+        Formats the statistics as a compact summary for the console.
+
+        Returns:
+            str: The summary on two lines.
+        """
+        cutoffs = " ".join(
+            f"{ply}:{count}" for ply, count in sorted(self.cutoffs_by_ply.items())
+        )
+        principal_variation = " > ".join(
+            f"{x} {y}" for x, y in self.principal_variation
+        )
+        return (
+            f"Depth {self.depth_reached} plies, {self.nodes} nodes"
+            f" ({self.nodes_per_second:.0f}/s), {self.leaf_evaluations} evaluations,"
+            f" TT hits {self.tt_hit_rate:.1%}, cutoffs {cutoffs or '-'}"
+            f" (first move {self.first_move_cutoff_rate:.1%}),"
+            f" re-searches {self.pvs_researches} PVS {self.aspiration_researches} aspiration\n"
+            f"Principal variation: {principal_variation or '-'}"
+        )
@@ -0,0 +1,343 @@
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .bitboard import BitBoard
+from .constants import BLACK, WHITE
+from .game_record import RESULT_CODES, RESULTS, GameRecord
+from .proof_number import ProofNumberSolver
+
+# Start of every database file, with the version of the format
+FILE_MAGIC = b"GMKS\x01"
+
+# Size and n_win of the positions of a database
+FILE_HEADER = struct.Struct("<BB")
+
+# Canonical hash, result, move cell and node budget of a solved position
+ENTRY = struct.Struct("<QBHI")
+
+# Move cell of the positions without a move to play
+NO_MOVE = 0xFFFF
+
+
+def replay_moves(
+    size: int,
+    n_win: int,
+    moves: Iterable[Tuple[int, int]],
+    candidate_radius: int = 1,
+) -> Tuple[BitBoard, str]:
+    """
+    Plays moves on an empty bitboard, black first.
+
+    Args:
+        size (int): The size of the board.
+        n_win (int): The number of stones in a row needed to win.
+        moves (Iterable[Tuple[int, int]]): The moves.
+        candidate_radius (int, optional): The radius of candidate moves. Defaults to 1.
+
+    Returns:
+        Tuple[BitBoard, str]: The position and the stone color of the side to move.
+    """
+    bitboard = BitBoard(size, n_win, candidate_radius)
+    color = BLACK
+    for x, y in moves:
+        bitboard.set_stone(x, y, color)
+        color = WHITE if color == BLACK else BLACK
+
+    return bitboard, color
+
+
+class SolvedPositionDatabase:
+    """
+    The game-theoretic results of positions, in a file keyed by canonical hash.
+
+    Positions are keyed by `BitBoard.get_canonical_hash`, so a result holds for all
+    8 symmetric positions, and moves are stored in the orientation of the canonical
+    position. The file starts with the format magic and the board size and n_win,
+    followed by entries of 15 bytes: the key, the result code of `GameRecord`, the
+    move cell x * size + y and the node budget of the search.
+
+    Entries are only ever appended, and a later entry of a key replaces an earlier
+    one, so positions left unsolved can be searched again with a larger budget.
+    The file is read once when the database is opened, and only created once the
+    first entry is added. A partial entry at the end of the file, left behind by
+    an interrupted build, is dropped.
+
+    Attributes:
+        file_path (str): The path of the database file.
+        size (int): The size of the board of the positions.
+        n_win (int): The number of stones in a row needed to win.
+    """
+
+    def __init__(self, file_path: str, size: int, n_win: int):
+        """
+        Opens a database, reading its entries if the file exists.
+
+        Args:
+            file_path (str): The path of the database file.
+            size (int): The size of the board of the positions.
+            n_win (int): The number of stones in a row needed to win.
+
+        Raises:
+            ValueError: If the file is not a database file or holds positions of another board.
+        """
+        self.file_path = file_path
+        self.size = size
+        self.n_win = n_win
+        self._file = None
+        # the length of the file up to its last whole entry
+        self._length = 0
+        self._entries: Dict[int, Tuple[Optional[str], Optional[int], int]] = {}
+
+        if os.path.exists(file_path) and os.path.getsize(file_path):
+            self._read()
+
+    def _read(self) -> None:
+        with open(self.file_path, "rb") as file:
+            buffer = file.read()
+
+        offset = len(FILE_MAGIC) + FILE_HEADER.size
+        if buffer[: len(FILE_MAGIC)] != FILE_MAGIC or len(buffer) < offset:
+            raise ValueError(f"{self.file_path} is not a solved-position database.")
+        size, n_win = FILE_HEADER.unpack_from(buffer, len(FILE_MAGIC))
+        if (size, n_win) != (self.size, self.n_win):
+            raise ValueError(
+                f"The database holds positions of {size}x{size} boards with n_win {n_win},"
+                f" not {self.size}x{self.size} with n_win {self.n_win}."
+            )
+        self._length = len(buffer) - (len(buffer) - offset) % ENTRY.size
+        for key, result, cell, max_nodes in ENTRY.iter_unpack(
+            buffer[offset : self._length]
+        ):
+            self._entries[key] = (
+                RESULTS[result],
+                None if cell == NO_MOVE else cell,
+                max_nodes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_searched(self, key: int, max_nodes: int) -> bool:
+        """
+        Check if a position is solved, or was left unsolved by a search at least as large.
+
+        Args:
+            key (int): The canonical hash of the position.
+            max_nodes (int): The node budget of the next search.
+
+        Returns:
+            bool: True if searching the position again is pointless, False otherwise.
+        """
+        if key not in self._entries:
+            return False
+        result, _, searched_nodes = self._entries[key]
+        return result is not None or searched_nodes >= max_nodes
+
+    def probe(
+        self, bitboard: BitBoard, color: str
+    ) -> Optional[Tuple[str, Optional[Tuple[int, int]]]]:
+        """
+        Looks up the result of a position.
+
+        Args:
+            bitboard (BitBoard): The position.
+            color (str): The stone color of the side to move.
+
+        Returns:
+            Optional[Tuple[str, Optional[Tuple[int, int]]]]: The stone color of the winner
+            or DRAW, and the move that wins or holds the draw for the side to move, or None
+            if the side to move loses. None if the position is not solved.
+        """
+        key, symmetry = bitboard.get_canonical_hash(color)
+        result, cell, _ = self._entries.get(key, (None, None, 0))
+        if result is None:
+            return None
+        if cell is None:
+            return result, None
+
+        return result, bitboard.get_symmetric_cell(
+            *divmod(cell, self.size), symmetry, inverse=True
+        )
+
+    def add(
+        self,
+        key: int,
+        result: Optional[str],
+        move: Optional[Tuple[int, int]],
+        max_nodes: int,
+    ) -> None:
+        """
+        Appends the result of a search.
+
+        Args:
+            key (int): The canonical hash of the position.
+            result (str): The stone color of the winner, DRAW, or None if the position was not solved.
+            move (Tuple[int, int]): The move of the side to move in the canonical position, or None.
+            max_nodes (int): The node budget of the search.
+        """
+        if self._file is None:
+            self._file = open(self.file_path, "ab")
+            if self._length:
+                self._file.truncate(self._length)
+            else:
+                self._file.write(FILE_MAGIC + FILE_HEADER.pack(self.size, self.n_win))
+
+        cell = NO_MOVE if move is None else move[0] * self.size + move[1]
+        self._file.write(ENTRY.pack(key, RESULT_CODES[result], cell, max_nodes))
+        self._entries[key] = (result, None if move is None else cell, max_nodes)
+
+    def flush(self) -> None:
+        """Writes the buffered entries to the file."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Closes the database file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "SolvedPositionDatabase":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def solve_position(
+    size: int, n_win: int, moves: List[Tuple[int, int]], max_nodes: int
+) -> dict:
+    """
+    Solves the position after some moves with proof-number search.
+
+    Args:
+        size (int): The size of the board.
+        n_win (int): The number of stones in a row needed to win.
+        moves (List[Tuple[int, int]]): The moves of the position, black first.
+        max_nodes (int): The node budget of every proof-number search.
+
+    Returns:
+        dict: The canonical hash of the position, the result, the move in the
+        orientation of the canonical position and the number of nodes searched.
+    """
+    bitboard, color = replay_moves(size, n_win, moves)
+    key, symmetry = bitboard.get_canonical_hash(color)
+
+    solver = ProofNumberSolver(max_nodes)
+    result, move = solver.solve(bitboard, color)
+    if move is not None:
+        move = bitboard.get_symmetric_cell(*move, symmetry)
+
+    return {"key": key, "result": result, "move": move, "nodes": solver.nodes}
+
+
+def get_opening_positions(
+    size: int, n_win: int, depth: int, candidate_radius: int = 1
+) -> List[List[Tuple[int, int]]]:
+    """
+    Lists the positions of the first moves of a game, one per class of symmetric positions.
+
+    Every move is played on a candidate cell, within `candidate_radius` of a stone.
+
+    Args:
+        size (int): The size of the board.
+        n_win (int): The number of stones in a row needed to win.
+        depth (int): The number of moves of the deepest positions.
+        candidate_radius (int, optional): The radius of candidate moves. Defaults to 1.
+
+    Returns:
+        List[List[Tuple[int, int]]]: The moves of every position, by number of moves.
+    """
+    positions = [[]]
+    level = [[]]
+    for _ in range(depth):
+        seen = set()
+        next_level = []
+        for moves in level:
+            bitboard, color = replay_moves(size, n_win, moves, candidate_radius)
+            if bitboard.get_winner_color() is not None:
+                continue
+
+            for x, y in bitboard.get_candidate_cells():
+                bitboard.set_stone(x, y, color)
+                key, _ = bitboard.get_canonical_hash(WHITE if color == BLACK else BLACK)
+                bitboard.remove_stone(x, y)
+                if key not in seen:
+                    seen.add(key)
+                    next_level.append(moves + [(x, y)])
+
+        positions += next_level
+        level = next_level
+
+    return positions
+
+
+def get_record_positions(
+    records: Iterable[GameRecord], size: int, n_win: int, min_stones: int = 0
+) -> Iterator[List[Tuple[int, int]]]:
+    """
+    Yields the positions before every move of stored games, such as those of `read_game_records`.
+
+    Args:
+        records (Iterable[GameRecord]): The games, read lazily.
+        size (int): The board size of the games to use, games of other boards are skipped.
+        n_win (int): The number of stones in a row needed to win.
+        min_stones (int, optional): The fewest stones of a position. Defaults to 0.
+
+    Yields:
+        List[Tuple[int, int]]: The moves of every position.
+    """
+    for record in records:
+        if (record.size, record.n_win) == (size, n_win):
+            for n_moves in range(min_stones, len(record.moves)):
+                yield record.moves[:n_moves]
+
+
+def build_solved_positions(
+    database: SolvedPositionDatabase,
+    positions: Iterable[List[Tuple[int, int]]],
+    max_nodes: int,
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> int:
+    """
+    Solves positions across a pool of processes and adds their results to a database.
+
+    Positions the database already holds a result for, or that a search with at least
+    `max_nodes` nodes left unsolved, are skipped, and every result is written to the
+    file as soon as it comes in, so an interrupted build resumes where it stopped.
+
+    Args:
+        database (SolvedPositionDatabase): The database.
+        positions (Iterable[List[Tuple[int, int]]]): The moves of the positions, black first.
+        max_nodes (int): The node budget of every proof-number search.
+        workers (int, optional): The number of processes, None for one per core. Defaults to None.
+        on_result (Callable[[dict], None], optional): Called with every result as it comes in. Defaults to None.
+
+    Returns:
+        int: The number of positions searched.
+    """
+    pending = {}
+    for moves in positions:
+        bitboard, color = replay_moves(database.size, database.n_win, moves)
+        key, _ = bitboard.get_canonical_hash(color)
+        if key not in pending and not database.is_searched(key, max_nodes):
+            pending[key] = moves
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(
+                solve_position, database.size, database.n_win, moves, max_nodes
+            )
+            for moves in pending.values()
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            database.add(result["key"], result["result"], result["move"], max_nodes)
+            database.flush()
+            if on_result is not None:
+                on_result(result)
+
+    return len(pending)
@@ -7,6 +7,11 @@ class Stone:
     """
     Represents a stone in the Gomoku game.
 
+    The board keeps its cells in a flat array of codes, and hands out read-only
+    StoneView objects for them, such as in `Board.board` or for the moves in
+    `Board.history`. A grid of Stones is loaded into a board by assigning it to
+    `Board.board`.
+
     Attributes:
         x (int): The x-coordinate of the stone.
         y (int): The y-coordinate of the stone.
@@ -15,6 +20,8 @@ class Stone:
         visited (bool): Flag to check if the stone has been visited, default is False.
     """
 
+    __slots__ = ("x", "y", "color", "player", "visited")
+
     def __init__(
         self,
         x: int,
@@ -31,3 +38,35 @@ class Stone:
 
     def __str__(self) -> str:
         return f"{self.color}"
+
+
+class StoneView(Stone):
+    """
+    A read-only view of a cell of a board.
+
+    Changing a view could not change the cell array of the board it comes from,
+    so setting any attribute raises instead of being silently ignored.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        color: str = "_",
+        player: Optional[Player] = None,
+        visited: bool = False,
+    ):
+        set_slot = object.__setattr__
+        set_slot(self, "x", x)
+        set_slot(self, "y", y)
+        set_slot(self, "color", color)
+        set_slot(self, "player", player)
+        set_slot(self, "visited", visited)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(
+            f"The stone at ({self.x},{self.y}) is a read-only view of the board,"
+            " assign a grid of stones to Board.board to change it."
+        )
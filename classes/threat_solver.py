@@ -0,0 +1,252 @@
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .constants import BLACK, WHITE
+from .patterns import CLOSED_FOUR, OPEN_FOUR, OPEN_THREE
+
+if TYPE_CHECKING:
+    from .bitboard import BitBoard
+
+
+class ThreatSearchLimit(Exception):
+    """Raised when the threat-space solver runs out of nodes or time."""
+
+
+class ThreatSolver:
+    """
+    Proves forced wins with a threat-space search.
+
+    The attacker only plays threats: fours, which leave the defender a single reply,
+    and with `vct` also open threes, which the defender must answer on a cell of the
+    attacker's next four or with a four of its own. The defender tries every one of
+    these replies, so a win is only reported when it holds against all of them.
+    Victories by continuous fours (VCF) are looked for first, since they branch far
+    less, then victories by continuous threats (VCT) with iterative deepening, so
+    that short wins are found before the budget is spent on long ones.
+
+    Every proof has its own budget of nodes, and every public call its own time limit,
+    unless the call is given a deadline, which lets several calls share one budget.
+    A proof that runs out of either is reported as no win.
+
+    Attributes:
+        max_nodes (int): The node budget of a proof.
+        time_limit (float): The time budget of a call in seconds, 0 for no limit.
+        max_depth (int): The maximum number of attacker moves of a win.
+        vct (bool): True to also attack with open threes.
+        nodes (int): The nodes visited by the last proof.
+    """
+
+    def __init__(
+        self,
+        max_nodes: int = 10000,
+        time_limit: float = 0,
+        max_depth: int = 10,
+        vct: bool = True,
+    ):
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.vct = vct
+        self.nodes = 0
+
+        self._deadline = None
+        self._vct_pass = False
+        self._depth_limit = max_depth
+        # the smallest depth left with which an attacker position was refuted
+        self._refuted: Dict[Tuple[int, str, bool], int] = {}
+
+    def solve(
+        self, bitboard: "BitBoard", color: str, deadline: Optional[float] = None
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Looks for a forced win of a color, as if it were to move.
+
+        Args:
+            bitboard (BitBoard): The position, which is left untouched.
+            color (str): The stone color of the attacker.
+            deadline (float, optional): The `time.perf_counter` time to stop at instead
+                of the time limit. Defaults to None.
+
+        Returns:
+            Optional[List[Tuple[int, int]]]: The winning line, attacker moves and the first
+            defender reply tried in turn, or None if no win was proven.
+        """
+        self._start(deadline)
+        try:
+            return self._prove(bitboard.copy(), color)
+        except ThreatSearchLimit:
+            return None
+
+    def find_defences(
+        self,
+        bitboard: "BitBoard",
+        color: str,
+        threat: List[Tuple[int, int]],
+        deadline: Optional[float] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Finds the moves that refute a forced win of the opponent.
+
+        The cells of the winning line and the fours of the defending color are tried,
+        and a move counts as a defence when the opponent has no proven win after it.
+
+        Args:
+            bitboard (BitBoard): The position, with `color` to move, which is left untouched.
+            color (str): The stone color of the defender.
+            threat (List[Tuple[int, int]]): The winning line of the opponent from `solve`.
+            deadline (float, optional): The `time.perf_counter` time to stop at instead
+                of the time limit. Defaults to None.
+
+        Returns:
+            List[Tuple[int, int]]: The defences found before the time limit ran out.
+        """
+        opponent = WHITE if color == BLACK else BLACK
+        work = bitboard.copy()
+        candidates = [move for move in threat if not work.is_occupied(*move)]
+        candidates += work.get_cells(work.get_threat_cells(color, 2))
+
+        self._start(deadline)
+        defences = []
+        for x, y in dict.fromkeys(candidates):
+            work.set_stone(x, y, color)
+            try:
+                if self._prove(work, opponent) is None:
+                    defences.append((x, y))
+            except ThreatSearchLimit:
+                # like `solve`, a win that is not proven within the budget does not count
+                if self._is_out_of_time():
+                    break
+                defences.append((x, y))
+            finally:
+                work.remove_stone(x, y)
+
+        return defences
+
+    def _start(self, deadline: Optional[float] = None) -> None:
+        if deadline is None and self.time_limit:
+            deadline = time.perf_counter() + self.time_limit
+        self._deadline = deadline
+        self._refuted = {}
+
+    def _is_out_of_time(self) -> bool:
+        return self._deadline is not None and time.perf_counter() > self._deadline
+
+    def _count_node(self) -> None:
+        self.nodes += 1
+        if self.nodes > self.max_nodes or self._is_out_of_time():
+            raise ThreatSearchLimit()
+
+    def _prove(
+        self, bitboard: "BitBoard", color: str
+    ) -> Optional[List[Tuple[int, int]]]:
+        opponent = WHITE if color == BLACK else BLACK
+        self.nodes = 0
+        self._vct_pass = False
+        self._depth_limit = self.max_depth
+        line = self._attack(bitboard, color, opponent, 0)
+        if line is not None or not self.vct:
+            return line
+
+        self._vct_pass = True
+        for depth_limit in range(1, self.max_depth + 1):
+            self._depth_limit = depth_limit
+            line = self._attack(bitboard, color, opponent, 0)
+            if line is not None:
+                return line
+
+        return None
+
+    def _attack(
+        self, bitboard: "BitBoard", attacker: str, defender: str, depth: int
+    ) -> Optional[List[Tuple[int, int]]]:
+        self._count_node()
+        wins = bitboard.get_winning_cells(attacker)
+        if wins:
+            return bitboard.get_cells(wins)[:1]
+        if depth == self._depth_limit:
+            return None
+
+        key = (bitboard.hash, attacker, self._vct_pass)
+        if self._refuted.get(key, -1) >= self._depth_limit - depth:
+            return None
+
+        # a four of the defender has to be blocked first
+        threats = bitboard.get_winning_cells(defender)
+        if threats & (threats - 1):
+            return None
+        moves = (
+            bitboard.get_cells(threats)
+            if threats
+            else self._get_attacks(bitboard, attacker)
+        )
+
+        for x, y in moves:
+            bitboard.set_stone(x, y, attacker)
+            try:
+                line = self._defend(bitboard, attacker, defender, depth)
+            finally:
+                bitboard.remove_stone(x, y)
+            if line is not None:
+                return [(x, y)] + line
+
+        self._refuted[key] = self._depth_limit - depth
+        return None
+
+    def _defend(
+        self, bitboard: "BitBoard", attacker: str, defender: str, depth: int
+    ) -> Optional[List[Tuple[int, int]]]:
+        self._count_node()
+        if bitboard.get_winning_cells(defender):
+            return None
+
+        wins = bitboard.get_winning_cells(attacker)
+        if wins & (wins - 1):
+            # an open four or a double four, only one of its cells can be blocked
+            return bitboard.get_cells(wins)[:2]
+        elif wins:
+            replies = bitboard.get_cells(wins)
+        elif self._vct_pass and self._has_open_four_move(bitboard, attacker):
+            replies = bitboard.get_cells(
+                bitboard.get_threat_cells(attacker, 2)
+                | bitboard.get_threat_cells(defender, 2)
+            )
+        else:
+            return None
+
+        line = None
+        for x, y in replies:
+            bitboard.set_stone(x, y, defender)
+            try:
+                reply_line = self._attack(bitboard, attacker, defender, depth + 1)
+            finally:
+                bitboard.remove_stone(x, y)
+            if reply_line is None:
+                return None
+            if line is None:
+                line = [(x, y)] + reply_line
+
+        return line
+
+    def _get_attacks(
+        self, bitboard: "BitBoard", attacker: str
+    ) -> List[Tuple[int, int]]:
+        fours = bitboard.get_threat_cells(attacker, 2)
+        moves = bitboard.get_cells(fours)
+        if self._vct_pass:
+            moves += [
+                (x, y)
+                for x, y in bitboard.get_cells(
+                    bitboard.get_threat_cells(attacker, 3) & ~fours
+                )
+                if OPEN_THREE in bitboard.get_pattern_classes(x, y, attacker)
+            ]
+
+        return moves
+
+    def _has_open_four_move(self, bitboard: "BitBoard", attacker: str) -> bool:
+        for x, y in bitboard.get_cells(bitboard.get_threat_cells(attacker, 2)):
+            classes = bitboard.get_pattern_classes(x, y, attacker)
+            if OPEN_FOUR in classes or sum(c >= CLOSED_FOUR for c in classes) >= 2:
+                return True
+
+        return False
@@ -0,0 +1,291 @@
+import itertools
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+from .constants import BLACK, DRAW, WHITE
+from .game_controller import GameController
+from .player import DumbPlayer, MCTSPlayer, Player, SmartPlayer
+
+# z-score of the 95% confidence interval of the Elo estimates
+CONFIDENCE_Z = 1.96
+
+
+def create_player(
+    engine: dict, stone_color: str, time_per_move: float, seed: Optional[int] = None
+) -> Player:
+    """
+    Creates the computer player described by an engine entry of the tournament config.
+
+    Args:
+        engine (dict): The engine with its `player` type, "dumb", "smart" or "mcts", and
+            optionally `heuristics`, `target_depth`, `pvs`, `iterations` and `time_limit`.
+        stone_color (str): The stone color of the player.
+        time_per_move (float): The cap on the time per move in seconds.
+        seed (int, optional): The seed of the random moves of an MCTS player. Defaults to None.
+
+    Returns:
+        Player: The player, with its opponent still unset.
+
+    Raises:
+        ValueError: If the player type is unknown.
+    """
+    time_limit = min(engine.get("time_limit", time_per_move), time_per_move)
+
+    if engine["player"] == "dumb":
+        return DumbPlayer(stone_color=stone_color)
+    elif engine["player"] == "smart":
+        return SmartPlayer(
+            stone_color=stone_color,
+            opponent=None,
+            target_depth=engine.get("target_depth"),
+            time_limit=time_limit,
+            heuristics=engine.get("heuristics", "advanced"),
+            pvs=engine.get("pvs"),
+        )
+    elif engine["player"] == "mcts":
+        return MCTSPlayer(
+            stone_color=stone_color,
+            opponent=None,
+            iterations=engine.get("iterations", 0),
+            time_limit=time_limit,
+            seed=seed,
+        )
+
+    raise ValueError(f"Unknown player type: {engine['player']}")
+
+
+def play_game(
+    board_config: dict,
+    black: Tuple[str, dict],
+    white: Tuple[str, dict],
+    time_per_move: float,
+    seed: int,
+) -> dict:
+    """
+    Plays a single game between two engines through a GameController, without I/O.
+
+    Args:
+        board_config (dict): The board configuration.
+        black (Tuple[str, dict]): The name and engine entry of the black player.
+        white (Tuple[str, dict]): The name and engine entry of the white player.
+        time_per_move (float): The cap on the time per move in seconds.
+        seed (int): The seed of the random moves of the game.
+
+    Returns:
+        dict: The names of both engines, the result, the number of moves, the
+        duration in seconds and the moves of the game.
+    """
+    # the MCTS players draw their random moves from their own generators
+    random.seed(seed)
+    player_black = create_player(black[1], BLACK, time_per_move, random.getrandbits(32))
+    player_white = create_player(white[1], WHITE, time_per_move, random.getrandbits(32))
+    player_black.opponent, player_white.opponent = player_white, player_black
+
+    # the tournament already spreads the games over the cores
+    controller = GameController(dict(board_config, search_workers=1))
+    controller.new_game(player_black, player_white)
+
+    start_time = time.perf_counter()
+    while not controller.is_over:
+        controller.request_ai_move()
+
+    return {
+        "black": black[0],
+        "white": white[0],
+        "result": controller.result,
+        "moves": len(controller.history),
+        "duration": round(time.perf_counter() - start_time, 3),
+        "history": controller.history,
+    }
+
+
+def get_elo_difference(wins: int, draws: int, losses: int) -> Tuple[float, float]:
+    """
+    Estimates the Elo difference implied by a match score and its error margin.
+
+    The margin is half the width of the 95% confidence interval, from the standard
+    error of the mean score per game. A score of 0% or 100% gives an infinite
+    difference.
+
+    Args:
+        wins (int): The games won.
+        draws (int): The games drawn.
+        losses (int): The games lost.
+
+    Returns:
+        Tuple[float, float]: The Elo difference and its error margin.
+    """
+    n_games = wins + draws + losses
+    if not n_games:
+        return 0.0, math.inf
+
+    score = (wins + draws / 2) / n_games
+    if score in (0, 1):
+        return math.copysign(math.inf, score - 0.5), math.inf
+
+    variance = (
+        wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score**2
+    ) / n_games
+    margin = CONFIDENCE_Z * math.sqrt(variance / n_games)
+
+    def to_elo(s: float) -> float:
+        if s <= 0:
+            return -math.inf
+        if s >= 1:
+            return math.inf
+        return -400 * math.log10(1 / s - 1)
+
+    elo_margin = (to_elo(score + margin) - to_elo(score - margin)) / 2
+    return to_elo(score), elo_margin
+
+
+class Tournament:
+    """
+    Plays every pairing of a set of engines across a pool of processes.
+
+    Each pairing plays `games_per_pairing` games with alternating colors. The games
+    are independent, so they are spread over the worker processes one game per
+    task, and every finished game is written out as a line of JSON right away.
+
+    Attributes:
+        results (List[dict]): The results of the games played so far.
+    """
+
+    def __init__(self, config: dict, board_config: dict):
+        """
+        Initializes the tournament.
+
+        Args:
+            config (dict): The tournament configuration with `engines`, `games_per_pairing`,
+                `time_per_move` and `workers`.
+            board_config (dict): The board configuration.
+        """
+        self._engines: Dict[str, dict] = config["engines"]
+        self._games_per_pairing = config["games_per_pairing"]
+        self._time_per_move = config["time_per_move"]
+        self._workers = config["workers"] or None
+        self._board_config = board_config
+        self.results: List[dict] = []
+
+    def get_games(self) -> List[Tuple[str, str]]:
+        """
+        Returns the (black, white) engine names of every game, alternating the colors
+        within each pairing.
+
+        Returns:
+            List[Tuple[str, str]]: The engines of every game.
+        """
+        games = []
+        for first, second in itertools.combinations(self._engines, 2):
+            for k in range(self._games_per_pairing):
+                games.append((first, second) if k % 2 == 0 else (second, first))
+
+        return games
+
+    def run(
+        self,
+        stream: Optional[TextIO] = None,
+        on_result: Optional[Callable[[dict], None]] = None,
+    ) -> List[dict]:
+        """
+        Plays all games of the tournament.
+
+        Args:
+            stream (TextIO, optional): The file every result is written to as a line of JSON. Defaults to None.
+            on_result (Callable[[dict], None], optional): Called with every result as it comes in. Defaults to None.
+
+        Returns:
+            List[dict]: The results of all games in the order they finished.
+        """
+        games = self.get_games()
+        self.results = []
+
+        with ProcessPoolExecutor(self._workers) as executor:
+            futures = {
+                executor.submit(
+                    play_game,
+                    self._board_config,
+                    (black, self._engines[black]),
+                    (white, self._engines[white]),
+                    self._time_per_move,
+                    seed,
+                ): seed
+                for seed, (black, white) in enumerate(games)
+            }
+            for future in as_completed(futures):
+                result = dict(game=futures[future], **future.result())
+                self.results.append(result)
+                if stream is not None:
+                    stream.write(json.dumps(result) + "\n")
+                    stream.flush()
+                if on_result is not None:
+                    on_result(result)
+
+        return self.results
+
+    def get_scores(self) -> Dict[str, Dict[str, List[int]]]:
+        """
+        Counts the wins, draws and losses of every engine against every opponent.
+
+        Returns:
+            Dict[str, Dict[str, List[int]]]: The [wins, draws, losses] by engine and opponent.
+        """
+        scores = {
+            engine: {opponent: [0, 0, 0] for opponent in self._engines}
+            for engine in self._engines
+        }
+        for result in self.results:
+            black, white = result["black"], result["white"]
+            if result["result"] == DRAW:
+                scores[black][white][1] += 1
+                scores[white][black][1] += 1
+            else:
+                winner, loser = (
+                    (black, white) if result["result"] == BLACK else (white, black)
+                )
+                scores[winner][loser][0] += 1
+                scores[loser][winner][2] += 1
+
+        return scores
+
+    def format_summary(self) -> str:
+        """
+        Formats the win/draw/loss table of all pairings and the Elo estimate of every
+        engine against the rest of the field.
+
+        Returns:
+            str: The summary as text.
+        """
+        scores = self.get_scores()
+        names = list(self._engines)
+        width = max(len(name) for name in names + ["W-D-L"]) + 2
+
+        lines = ["W-D-L".ljust(width) + "".join(name.rjust(width) for name in names)]
+        for engine in names:
+            cells = [
+                (
+                    "-"
+                    if opponent == engine
+                    else "{}-{}-{}".format(*scores[engine][opponent])
+                )
+                for opponent in names
+            ]
+            lines.append(engine.ljust(width) + "".join(c.rjust(width) for c in cells))
+
+        lines.append("")
+        lines.append("Elo against the field (95% confidence):")
+        for engine in names:
+            wins, draws, losses = (
+                sum(score[k] for score in scores[engine].values()) for k in range(3)
+            )
+            elo, margin = get_elo_difference(wins, draws, losses)
+            lines.append(
+                f"{engine.ljust(width)}{elo:+8.1f} +/- {margin:.1f}"
+                f"  ({wins}-{draws}-{losses})"
+            )
+
+        return "\n".join(lines)
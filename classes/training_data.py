@@ -0,0 +1,335 @@
+import json
+import os
+import shutil
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .constants import BLACK, WHITE
+from .game_record import GameRecord
+
+# Input planes of a position: stones of the side to move, of the opponent, empty
+# cells, and a constant plane that is 1 when black is to move
+N_PLANES = 4
+
+MANIFEST_NAME = "manifest.json"
+
+
+def get_symmetries(size: int) -> np.ndarray:
+    """
+    Returns the 8 symmetries of the square board as permutations of the cells.
+
+    Args:
+        size (int): The size of the board.
+
+    Returns:
+        np.ndarray: An (8, size * size) array whose row k maps every cell of the
+        transformed board to the cell of the original board it comes from.
+    """
+    cells = np.arange(size * size).reshape(size, size)
+    symmetries = []
+    for flip in (False, True):
+        board = cells.T if flip else cells
+        for k in range(4):
+            symmetries.append(np.rot90(board, k).ravel())
+
+    return np.array(symmetries)
+
+
+def encode_game(
+    size: int, moves: Sequence[Tuple[int, int]], result: Optional[str]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Encodes every position of a game before each of its moves.
+
+    Args:
+        size (int): The size of the board.
+        moves (Sequence[Tuple[int, int]]): The moves of the game, black first.
+        result (str): The stone color of the winner, DRAW, or None if the game was not finished.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The (n_moves, 4, size, size) uint8 planes,
+        the cell index of the move played in every position and the final outcome for the
+        side to move, 1 for a win, -1 for a loss and 0 otherwise.
+    """
+    n_moves = len(moves)
+    cells = np.array([x * size + y for x, y in moves], dtype=np.int64)
+
+    # the number of the move that filled every cell, n_moves for the empty ones
+    filled_at = np.full(size * size, n_moves)
+    filled_at[cells] = np.arange(n_moves)
+
+    plies = np.arange(n_moves)[:, None]
+    is_stone = filled_at[None, :] < plies
+    is_black = is_stone & (filled_at[None, :] % 2 == 0)
+    is_white = is_stone & ~is_black
+    black_to_move = plies % 2 == 0
+
+    planes = np.empty((n_moves, N_PLANES, size * size), dtype=np.uint8)
+    planes[:, 0] = np.where(black_to_move, is_black, is_white)
+    planes[:, 1] = np.where(black_to_move, is_white, is_black)
+    planes[:, 2] = ~is_stone
+    planes[:, 3] = black_to_move
+
+    outcomes = np.zeros(n_moves, dtype=np.int8)
+    if result in (BLACK, WHITE):
+        sign = np.where(black_to_move[:, 0], 1, -1)
+        outcomes[:] = sign if result == BLACK else -sign
+
+    return planes.reshape(n_moves, N_PLANES, size, size), cells, outcomes
+
+
+class TrainingDataWriter:
+    """
+    Streams the positions of games into NumPy arrays on disk.
+
+    The positions are written to shards of up to `chunk_size` positions each: a
+    planes array, a moves array and an outcomes array per shard. The rows of an
+    open shard are appended to raw files as they come in, so memory use does not
+    grow with the number of games, and become `.npy` files of the positions
+    actually written when the shard is full or the writer is closed. A manifest
+    lists the shards and how many positions each of them holds.
+
+    Attributes:
+        n_positions (int): The number of positions written so far.
+    """
+
+    def __init__(
+        self, directory: str, size: int, chunk_size: int = 65536, augment: bool = False
+    ):
+        """
+        Initializes the writer on an empty or new directory.
+
+        Args:
+            directory (str): The directory of the shards and the manifest.
+            size (int): The size of the board of every position.
+            chunk_size (int, optional): The positions per shard. Defaults to 65536.
+            augment (bool, optional): True to also write the 7 other symmetries of every
+                position. Defaults to False.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._size = size
+        self._chunk_size = chunk_size
+        self._symmetries = get_symmetries(size) if augment else get_symmetries(size)[:1]
+        self._inverse_symmetries = np.argsort(self._symmetries, axis=1)
+
+        # the shape of a row and the dtype of every array of a shard
+        self._layouts = {
+            "planes": ((N_PLANES, size, size), np.uint8),
+            "moves": ((), np.int16),
+            "outcomes": ((), np.int8),
+        }
+
+        self._shards: List[dict] = []
+        self._files = None
+        self._count = 0
+        self.n_positions = 0
+
+    def _get_path(self, key: str, extension: str) -> str:
+        return os.path.join(
+            self._directory, f"{self._shards[-1]['name']}.{key}.{extension}"
+        )
+
+    def _open_shard(self) -> None:
+        self._shards.append({"name": f"shard_{len(self._shards):05d}", "count": 0})
+        self._files = {
+            key: open(self._get_path(key, "raw"), "wb") for key in self._layouts
+        }
+        self._count = 0
+
+    def _close_shard(self) -> None:
+        for key, (row_shape, dtype) in self._layouts.items():
+            self._files[key].close()
+            header = {
+                "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                "fortran_order": False,
+                "shape": (self._count,) + row_shape,
+            }
+            with open(self._get_path(key, "npy"), "wb") as file, open(
+                self._get_path(key, "raw"), "rb"
+            ) as raw_file:
+                np.lib.format.write_array_header_1_0(file, header)
+                shutil.copyfileobj(raw_file, file)
+            os.remove(self._get_path(key, "raw"))
+
+        self._shards[-1]["count"] = self._count
+        self._files = None
+
+    def add_game(self, moves: Sequence[Tuple[int, int]], result: Optional[str]) -> None:
+        """
+        Writes the positions of a game, before each of its moves.
+
+        Args:
+            moves (Sequence[Tuple[int, int]]): The moves of the game, black first.
+            result (str): The stone color of the winner, DRAW, or None if the game was not finished.
+        """
+        planes, cells, outcomes = encode_game(self._size, moves, result)
+        flat_planes = planes.reshape(len(cells), N_PLANES, -1)
+
+        for symmetry, inverse in zip(self._symmetries, self._inverse_symmetries):
+            self._write(
+                flat_planes[:, :, symmetry].reshape(planes.shape),
+                inverse[cells],
+                outcomes,
+            )
+
+    def add_record(self, record: GameRecord) -> None:
+        """
+        Writes the positions of a stored game.
+
+        Args:
+            record (GameRecord): The game.
+
+        Raises:
+            ValueError: If the board of the game has another size than the writer.
+        """
+        if record.size != self._size:
+            raise ValueError(
+                f"The game is played on a {record.size}x{record.size} board,"
+                f" the training data on {self._size}x{self._size}."
+            )
+        self.add_game(record.moves, record.result)
+
+    def _write(self, planes: np.ndarray, moves: np.ndarray, outcomes: np.ndarray):
+        start = 0
+        while start < len(moves):
+            if self._files is None:
+                self._open_shard()
+
+            n = min(len(moves) - start, self._chunk_size - self._count)
+            rows = slice(start, start + n)
+            for key, array in (
+                ("planes", planes),
+                ("moves", moves),
+                ("outcomes", outcomes),
+            ):
+                dtype = self._layouts[key][1]
+                self._files[key].write(array[rows].astype(dtype, copy=False).tobytes())
+            self._count += n
+            self.n_positions += n
+            start += n
+
+            if self._count == self._chunk_size:
+                self._close_shard()
+
+    def close(self) -> None:
+        """Flushes the last shard and writes the manifest."""
+        if self._files is not None:
+            self._close_shard()
+
+        with open(os.path.join(self._directory, MANIFEST_NAME), "w") as file:
+            json.dump(
+                {"size": self._size, "planes": N_PLANES, "shards": self._shards}, file
+            )
+
+    def __enter__(self) -> "TrainingDataWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def export_training_data(
+    records: Iterable[GameRecord],
+    directory: str,
+    size: int,
+    chunk_size: int = 65536,
+    augment: bool = False,
+) -> int:
+    """
+    Exports the positions of stored games, such as those of `read_game_records`.
+
+    Args:
+        records (Iterable[GameRecord]): The games, read lazily.
+        directory (str): The directory of the training data.
+        size (int): The board size of the games to export, games of other sizes are skipped.
+        chunk_size (int, optional): The positions per shard. Defaults to 65536.
+        augment (bool, optional): True to write all 8 symmetries of every position. Defaults to False.
+
+    Returns:
+        int: The number of positions written.
+    """
+    with TrainingDataWriter(directory, size, chunk_size, augment) as writer:
+        for record in records:
+            if record.size == size:
+                writer.add_record(record)
+
+    return writer.n_positions
+
+
+class TrainingDataLoader:
+    """
+    Draws random mini-batches from the training data of a TrainingDataWriter.
+
+    The shards are opened as read-only memory maps, so a batch only reads the
+    pages of the positions it contains.
+
+    Attributes:
+        size (int): The size of the board of the positions.
+        rng (np.random.Generator): The random number generator of the batches.
+    """
+
+    def __init__(self, directory: str, seed: Optional[int] = None):
+        """
+        Opens the training data in a directory.
+
+        Args:
+            directory (str): The directory of the shards and the manifest.
+            seed (int, optional): The seed of the random number generator. Defaults to None.
+        """
+        with open(os.path.join(directory, MANIFEST_NAME), "r") as file:
+            manifest = json.load(file)
+
+        self.size = manifest["size"]
+        self.rng = np.random.default_rng(seed)
+        self._shards = [
+            {
+                key: np.load(
+                    os.path.join(directory, f"{shard['name']}.{key}.npy"),
+                    mmap_mode="r",
+                )
+                for key in ("planes", "moves", "outcomes")
+            }
+            for shard in manifest["shards"]
+        ]
+        counts = [shard["count"] for shard in manifest["shards"]]
+        self._offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def get_batch(self, batch_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns a mini-batch of positions drawn uniformly at random.
+
+        Args:
+            batch_size (int): The number of positions.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The planes, the moves played and
+            the outcomes of the positions.
+
+        Raises:
+            ValueError: If the training data holds no positions.
+        """
+        if not len(self):
+            raise ValueError("The training data holds no positions to draw from.")
+
+        indices = np.sort(self.rng.integers(0, len(self), batch_size))
+        shard_indices = np.searchsorted(self._offsets, indices, side="right") - 1
+
+        planes = np.empty((batch_size, N_PLANES, self.size, self.size), dtype=np.uint8)
+        moves = np.empty(batch_size, dtype=np.int16)
+        outcomes = np.empty(batch_size, dtype=np.int8)
+        for k in np.unique(shard_indices):
+            in_shard = shard_indices == k
+            rows = indices[in_shard] - self._offsets[k]
+            shard = self._shards[k]
+            planes[in_shard] = shard["planes"][rows]
+            moves[in_shard] = shard["moves"][rows]
+            outcomes[in_shard] = shard["outcomes"][rows]
+
+        # the positions were read in file order for locality, shuffle them back
+        order = self.rng.permutation(batch_size)
+        return planes[order], moves[order], outcomes[order]
@@ -0,0 +1,142 @@
+from typing import List, Optional, Tuple
+
+# Bound types of a stored score
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class TranspositionTable:
+    """
+    Represents a fixed-size transposition table for the game tree search.
+
+    Each entry lives in the slot given by its Zobrist key modulo the table
+    size and stores the score, the remaining search depth, the bound type of
+    the score, the best move and the ply the position was searched at. A
+    colliding entry is replaced when it comes from an earlier search or was
+    searched to a lower or equal depth.
+
+    Win scores count the plies from the root of the search, so a score only
+    holds when the position is reached at the ply it was stored at. A score that
+    depends on the moves leading to the position is stored without a ply, and
+    the entry then only serves its best move.
+
+    Attributes:
+        probes (int): The number of lookups since the last reset of the stats.
+        hits (int): The number of lookups that found an entry for the key.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._keys: List[Optional[int]] = [None] * size
+        self._entries: List[Optional[tuple]] = [None] * size
+        self._generation = 0
+
+        self.probes = 0
+        self.hits = 0
+
+    @property
+    def size(self) -> int:
+        """Returns the number of slots in the table."""
+        return self._size
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the share of lookups that found an entry."""
+        return self.hits / self.probes if self.probes else 0.0
+
+    def new_search(self) -> None:
+        """
+        Marks the start of a new search.
+
+        Entries of earlier searches are kept for lookups but may be replaced
+        by any new entry, and the hit statistics are reset.
+        """
+        self._generation += 1
+        self.probes = 0
+        self.hits = 0
+
+    def clear(self) -> None:
+        """Removes all entries from the table."""
+        self._keys = [None] * self._size
+        self._entries = [None] * self._size
+
+    def probe(
+        self, key: int
+    ) -> Optional[Tuple[int, float, int, Tuple[int, int], Optional[int]]]:
+        """
+        Looks up the entry stored for the given key.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            Optional[Tuple[int, float, int, Tuple[int, int], Optional[int]]]: The depth,
+            score, bound type, best move and ply of the entry, or None if there is none.
+        """
+        if not self._size:
+            return None
+
+        self.probes += 1
+        slot = key % self._size
+        if self._keys[slot] != key:
+            return None
+
+        self.hits += 1
+        return self._entries[slot][:5]
+
+    def get_move(self, key: int) -> Optional[Tuple[int, int]]:
+        """
+        Returns the best move stored for the given key without counting a lookup.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            Optional[Tuple[int, int]]: The best move, or None if there is no entry.
+        """
+        if not self._size:
+            return None
+
+        slot = key % self._size
+        if self._keys[slot] != key:
+            return None
+
+        return self._entries[slot][3]
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        score: float,
+        flag: int,
+        move: Tuple[int, int],
+        ply: Optional[int] = 0,
+    ) -> None:
+        """
+        Stores a search result for the given key.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            depth (int): The remaining depth the position was searched to.
+            score (float): The score of the position.
+            flag (int): The bound type of the score, EXACT, LOWER_BOUND or UPPER_BOUND.
+            move (Tuple[int, int]): The best move found in the position.
+            ply (int, optional): The ply the position was searched at, None if the score
+                depends on the moves leading to it. Defaults to 0.
+        """
+        if not self._size:
+            return
+
+        slot = key % self._size
+        entry = self._entries[slot]
+        if (
+            entry is not None
+            and self._keys[slot] != key
+            and entry[5] == self._generation
+            and entry[0] > depth
+        ):
+            return
+
+        self._keys[slot] = key
+        self._entries[slot] = (depth, score, flag, move, ply, self._generation)
@@ -0,0 +1,37 @@
+import argparse
+
+from classes.game_record import read_game_records
+from classes.training_data import export_training_data
+
+
+def parse_args():
+    """
+    Parses the command line arguments of the training data export.
+
+    Returns:
+        argparse.Namespace: The arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Export the positions of stored games as training data"
+    )
+    parser.add_argument("records", nargs="+", help="the game record files")
+    parser.add_argument("--output", required=True, help="the directory of the data")
+    parser.add_argument("--size", type=int, required=True, help="the board size")
+    parser.add_argument(
+        "--chunk-size", type=int, default=65536, help="positions per shard"
+    )
+    parser.add_argument("--augment", action="store_true", help="add the 8 symmetries")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    def read_records():
+        for file_path in args.records:
+            yield from read_game_records(file_path)
+
+    n_positions = export_training_data(
+        read_records(), args.output, args.size, args.chunk_size, args.augment
+    )
+    print(f"Exported {n_positions} positions to {args.output}")
@@ -0,0 +1,59 @@
+import argparse
+import asyncio
+import os
+
+from classes.game_server import GameServer
+from run import load_config
+
+GAME_CONFIG_PATH = "config/game.yml"
+SERVER_CONFIG_PATH = "config/server.yml"
+
+
+def parse_args():
+    """
+    Parses the command line arguments of the server.
+
+    Returns:
+        argparse.Namespace: The arguments, overriding the server config when given.
+    """
+    parser = argparse.ArgumentParser(description="Gomoku game server")
+    parser.add_argument("--config", default=SERVER_CONFIG_PATH)
+    parser.add_argument("--host", help="the address of the TCP socket")
+    parser.add_argument("--port", type=int, help="the port of the TCP socket")
+    parser.add_argument("--unix-socket", help="the path of a Unix socket instead")
+    parser.add_argument("--workers", type=int, help="processes, 0 for one per core")
+    return parser.parse_args()
+
+
+async def main(server_config, board_config):
+    server = GameServer(server_config, board_config)
+    await server.start()
+    print(f"Serving Gomoku on {server.address}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    root = os.path.dirname(os.path.abspath(__file__))
+
+    game_config = load_config(os.path.join(root, GAME_CONFIG_PATH))
+    board_config = load_config(
+        os.path.join(root, game_config["config_paths"]["board_config"])
+    )
+    server_config = load_config(args.config)
+    for key, value in [
+        ("host", args.host),
+        ("port", args.port),
+        ("unix_socket", args.unix_socket),
+        ("workers", args.workers),
+    ]:
+        if value is not None:
+            server_config[key] = value
+
+    try:
+        asyncio.run(main(server_config, board_config))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,51 @@
+import os
+
+import numpy as np
+import pytest
+import yaml
+from classes.batch_simulator import BLACK_WIN, DRAW, WHITE_WIN, BatchSimulator
+from classes.bitboard import BitBoard
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+
+@pytest.mark.parametrize(
+    "n_cells, n_win", [(board_config["n_cells"], board_config["n_win"]), (4, 3)]
+)
+def test_batch_simulator_matches_replay(n_cells, n_win):
+    config = dict(board_config, n_cells=n_cells, n_win=n_win)
+    simulator = BatchSimulator(config, seed=5)
+    winners, n_moves, moves = simulator.simulate(300)
+
+    codes = {BLACK_WIN: "B", WHITE_WIN: "W"}
+    for winner, n_game_moves, game_moves in zip(winners, n_moves, moves):
+        bitboard = BitBoard(n_cells, n_win)
+        replay_winner = None
+        for step, cell in enumerate(game_moves):
+            x, y = divmod(int(cell), n_cells)
+            bitboard.set_stone(x, y, "B" if step % 2 == 0 else "W")
+            replay_winner = bitboard.get_winner_color_at(x, y)
+            if replay_winner is not None:
+                break
+
+        assert codes.get(int(winner)) == replay_winner
+        assert n_game_moves == step + 1
+
+    assert set(np.unique(winners)) <= {DRAW, BLACK_WIN, WHITE_WIN}
+    assert (n_moves >= 2 * n_win - 1).all()
+
+
+def test_batch_simulator_seed():
+    first = BatchSimulator(board_config, seed=1).simulate(50)
+    second = BatchSimulator(board_config, seed=1).simulate(50)
+
+    for first_array, second_array in zip(first, second):
+        assert np.array_equal(first_array, second_array)
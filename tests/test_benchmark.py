@@ -0,0 +1,74 @@
+import os
+
+import yaml
+from classes.benchmark import create_position, find_regressions, run_benchmarks
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+
+def test_benchmark_positions_are_seeded():
+    first = create_position(board_config, 15, seed=1)
+    second = create_position(board_config, 15, seed=1)
+
+    assert str(first) == str(second)
+    assert first.current_player is first.player_white
+    assert not first.bitboard.get_winning_cells("B")
+    assert not first.bitboard.get_winning_cells("W")
+
+
+def test_benchmark_positions_are_searched():
+    config = dict(board_config, heuristics_target_depth=1, heuristics_time_limit=0)
+    for n_cells in (9, 15, 19):
+        for seed in range(3):
+            board = create_position(config, n_cells, seed)
+            player = board.player_white
+            player.collect_stats = True
+            player.find_optimal_input(board, "advanced")
+            assert player.search_stats.nodes > 0
+
+
+def test_run_benchmarks_metrics():
+    results = run_benchmarks(
+        board_config, sizes=[9], depths=[1, 2], repeats=1, min_time=0.01
+    )
+
+    assert set(results["metrics"]) == {
+        "check_win_condition/n9",
+        "get_pattern_count/n9",
+        "get_unvisited_xy_pairs/n9",
+        "find_optimal_input/n9/d1",
+        "find_optimal_input/n9/d2",
+        "minimax_nodes_per_second/n9/d1",
+        "minimax_nodes_per_second/n9/d2",
+        "search_nodes/n9/d1",
+        "search_nodes/n9/d2",
+        "search_nodes_pvs/n9/d1",
+        "search_nodes_pvs/n9/d2",
+    }
+    assert all(metric["value"] > 0 for metric in results["metrics"].values())
+
+
+def test_find_regressions():
+    def results(seconds, rate):
+        return {
+            "metrics": {
+                "search": {"value": seconds, "unit": "s", "higher_is_better": False},
+                "nodes": {"value": rate, "unit": "nodes/s", "higher_is_better": True},
+            }
+        }
+
+    baseline = results(1.0, 1000)
+    assert find_regressions(baseline, results(1.05, 960), threshold=10) == []
+
+    regressions = dict(find_regressions(baseline, results(1.2, 800), threshold=10))
+    assert set(regressions) == {"search", "nodes"}
+    assert round(regressions["search"]) == 20
+    assert round(regressions["nodes"]) == 25
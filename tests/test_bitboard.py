@@ -0,0 +1,185 @@
+import os
+import random
+
+import pytest
+import yaml
+from classes.bitboard import BitBoard
+from classes.board import Board
+from classes.player import Player
+from classes.stone import Stone
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+
+@pytest.fixture
+def random_scenario_board():
+    random.seed(42)
+    n = board_config["n_cells"]
+
+    colors = ["B", "W", "_"]
+    _board = []
+    for i in range(n):
+        _board.append([])
+        for j in range(n):
+            c = colors[random.randint(0, 2)]
+            _board[i].append(Stone(x=i, y=j, color=c, visited=c != "_"))
+
+    return _board
+
+
+def test_bitboard_from_stones(random_scenario_board):
+    bitboard = BitBoard.from_stones(random_scenario_board, board_config["n_win"])
+
+    for i, row in enumerate(random_scenario_board):
+        for j, stone in enumerate(row):
+            assert bitboard.get_color(i, j) == stone.color
+            assert bitboard.is_occupied(i, j) == stone.visited
+
+
+@pytest.mark.parametrize("dx, dy", [(0, 1), (1, 0), (1, 1), (1, -1)])
+def test_bitboard_win_directions(dx, dy):
+    n, n_win = board_config["n_cells"], board_config["n_win"]
+    bitboard = BitBoard(n, n_win)
+
+    x, y = 0, n - 1 if dy < 0 else 0
+    for k in range(n_win - 1):
+        bitboard.set_stone(x + k * dx, y + k * dy, "W")
+    assert bitboard.get_winner_color() is None
+
+    bitboard.set_stone(x + (n_win - 1) * dx, y + (n_win - 1) * dy, "W")
+    assert bitboard.get_winner_color() == "W"
+    assert not bitboard.has_win("B")
+
+
+def test_bitboard_no_wrap_around_rows():
+    n, n_win = board_config["n_cells"], board_config["n_win"]
+    bitboard = BitBoard(n, n_win)
+
+    # the last cells of row 0 followed by the first cells of row 1
+    for y in range(n - 2, n):
+        bitboard.set_stone(0, y, "B")
+    for y in range(n_win - 2):
+        bitboard.set_stone(1, y, "B")
+
+    assert not bitboard.has_win("B")
+
+
+def test_bitboard_matches_full_scan(random_scenario_board):
+    board = Board(board_config)
+    board.board = random_scenario_board
+
+    full_scan = (
+        board.check_rowwise_win_condition()[0]
+        or board.check_colwise_win_condition()[0]
+        or board.check_diagwise_win_condition()[0]
+    )
+    assert full_scan == (board.bitboard.get_winner_color() is not None)
+
+
+def test_board_put_stone_updates_bitboard():
+    board = Board(board_config)
+    board.player_black = Player(stone_color="B")
+    board.player_white = Player(stone_color="W")
+    board.current_player = board.player_black
+
+    assert board.put_stone(2, 3)
+    assert not board.put_stone(2, 3)
+    assert board.bitboard.get_color(2, 3) == "B"
+    assert (2, 3) not in board.get_unvisited_xy_pairs()
+    assert len(board.get_unvisited_xy_pairs()) == board.get_left_stones()
+
+
+def test_bitboard_incremental_zobrist_hash(random_scenario_board):
+    n_win = board_config["n_win"]
+    bitboard = BitBoard.from_stones(random_scenario_board, n_win)
+    initial_hash = bitboard.hash
+
+    empty_cells = bitboard.get_empty_cells()
+    for k, (x, y) in enumerate(empty_cells):
+        bitboard.set_stone(x, y, "B" if k % 2 else "W")
+    for x, y in reversed(empty_cells):
+        bitboard.remove_stone(x, y)
+
+    assert bitboard.hash == initial_hash
+    assert BitBoard.from_stones(random_scenario_board, n_win).hash == initial_hash
+    assert BitBoard(board_config["n_cells"], n_win).hash == 0
+
+
+@pytest.mark.parametrize("radius", [1, 2])
+def test_bitboard_incremental_candidates(radius):
+    n, n_win = board_config["n_cells"], board_config["n_win"]
+    bitboard = BitBoard(n, n_win, radius)
+    assert bitboard.get_candidate_cells() == [(n // 2, n // 2)]
+
+    random.seed(3)
+    moves = random.sample([(x, y) for x in range(n) for y in range(n)], n)
+    for x, y in moves:
+        bitboard.set_stone(x, y, "B")
+    for x, y in moves[: n // 2]:
+        bitboard.remove_stone(x, y)
+
+    stones = moves[n // 2 :]
+    expected = [
+        (x, y)
+        for x in range(n)
+        for y in range(n)
+        if (x, y) not in stones
+        and any(max(abs(x - sx), abs(y - sy)) <= radius for sx, sy in stones)
+    ]
+    assert bitboard.get_candidate_cells() == expected
+
+
+def test_bitboard_window_counters():
+    n, n_win = board_config["n_cells"], board_config["n_win"]
+    bitboard = BitBoard(n, n_win)
+    # every window by its cells, along rows, columns and both diagonals
+    windows = [
+        [(x + dx * k, y + dy * k) for k in range(n_win)]
+        for dx, dy in [(0, 1), (1, 0), (1, 1), (1, -1)]
+        for x in range(n)
+        for y in range(n)
+        if 0 <= x + dx * (n_win - 1) < n and 0 <= y + dy * (n_win - 1) < n
+    ]
+
+    def open_window_counts(color):
+        counts = [0] * (n_win + 1)
+        for window in windows:
+            colors = [bitboard.get_color(x, y) for x, y in window]
+            if all(c in (color, "_") for c in colors):
+                counts[colors.count(color)] += 1
+        return tuple(counts)
+
+    random.seed(7)
+    moves = []
+    for _ in range(200):
+        if moves and random.random() < 0.3:
+            bitboard.remove_stone(*moves.pop())
+        else:
+            x, y = random.choice(bitboard.get_empty_cells())
+            bitboard.set_stone(x, y, random.choice("BW"))
+            moves.append((x, y))
+
+        for color in ("B", "W"):
+            expected = open_window_counts(color)
+            assert bitboard.get_open_window_counts(color) == expected
+            assert bitboard.has_five(color) == bitboard.has_win(color)
+            assert bitboard.get_threat_count(color) == expected[n_win - 1]
+        assert bitboard.has_open_window() == any(
+            sum(open_window_counts(color)) for color in ("B", "W")
+        )
+
+    copy = bitboard.copy()
+    x, y = bitboard.get_empty_cells()[0]
+    copy.set_stone(x, y, "B")
+    assert bitboard.get_open_window_counts("B") == open_window_counts("B")
+    bitboard.set_stone(x, y, "B")
+    assert copy.get_open_window_counts("B") == open_window_counts("B")
+    assert copy.get_window_score("W") == bitboard.get_window_score("W")
@@ -3,7 +3,7 @@ import random
 
 import pytest
 import yaml
-from classes.board import Board, Stone
+from classes.board import Board, Player, Stone
 
 GAME_CONFIG_PATH = "../config/game.yml"
 
@@ -234,3 +234,106 @@ def test_board_weights():
     ]
     board.assign_board_weights()
     assert board._board_weights == weights
+
+
+def test_incremental_win_condition_matches_full_scan():
+    random.seed(7)
+    for _ in range(20):
+        board = Board(game_config["board_config"])
+        board.player_black = Player(stone_color="B")
+        board.player_white = Player(stone_color="W")
+        board.current_player = board.player_black
+
+        while board.get_left_stones() > 0:
+            x, y = random.choice(board.get_unvisited_xy_pairs())
+            board.put_stone(x, y)
+
+            incremental = board.check_win_condition_at()
+            assert incremental == board.check_win_condition()
+            if incremental:
+                assert board.winner is board.current_player
+                break
+
+            board.toggle_player()
+
+
+def test_board_copy_and_stone_views():
+    board = Board(game_config["board_config"])
+    board.player_black = Player(stone_color="B")
+    board.player_white = Player(stone_color="W")
+    board.current_player = board.player_black
+    for x, y in [(4, 4), (4, 5), (3, 3)]:
+        board.put_stone(x, y)
+        board.toggle_player()
+
+    copy = board.copy()
+    copy.make_move(0, 0, copy.current_player)
+    assert not board.is_visited(0, 0) and copy.is_visited(0, 0)
+    assert board.zobrist_hash != copy.zobrist_hash
+    copy.unmake_move()
+    assert str(copy) == str(board) and copy.zobrist_hash == board.zobrist_hash
+    assert copy.get_candidate_moves() == board.get_candidate_moves()
+
+    stone = board.board[4][5]
+    assert (stone.color, stone.player, stone.visited) == ("W", board.player_white, True)
+    assert board.board[0][0].color == "_" and not board.board[0][0].visited
+    assert board.history[-1] is board.last_move is board.board[3][3]
+    assert board.cells[4 * board.size + 4] == 1 and board.cells.count(0) == (
+        board.get_left_stones()
+    )
+    with pytest.raises(AttributeError):
+        stone.owner = board.player_white
+
+
+def test_board_grid_is_cached_and_read_only():
+    board = Board(board_config)
+    board.player_black = Player(stone_color="B")
+    board.player_white = Player(stone_color="W")
+    board.current_player = board.player_black
+
+    grid = board.board
+    assert board.board is grid
+    with pytest.raises(AttributeError):
+        grid[0][0].color = "B"
+    assert grid[0][0].color == "_"
+
+    board.put_stone(4, 4)
+    assert board.board is not grid and board.board[4][4] is board.last_move
+    with pytest.raises(AttributeError):
+        board.last_move.visited = False
+
+    grid = board.board
+    board.unmake_move()
+    assert board.board is not grid and not board.board[4][4].visited
+
+    grid = board.board
+    board.player_black = Player(stone_color="B")
+    assert board.board is not grid
+
+
+def test_board_config_defaults():
+    first_release_keys = [
+        "n_cells",
+        "n_win",
+        "heuristics_target_depth",
+        "heuristics_score_win",
+        "heuristics_score_loose",
+    ]
+    board = Board({key: board_config[key] for key in first_release_keys})
+    shipped = Board(board_config)
+
+    for name in [
+        "time_limit",
+        "transposition_table_size",
+        "search_workers",
+        "search_pvs",
+        "aspiration_window",
+        "threat_search_nodes",
+        "threat_search_time_limit",
+        "solved_positions_path",
+        "mcts_iterations",
+        "mcts_time_limit",
+        "mcts_exploration",
+    ]:
+        assert getattr(board, name) == getattr(shipped, name)
+    assert board.bitboard.candidate_radius == board_config["candidate_radius"]
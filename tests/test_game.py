@@ -1,8 +1,9 @@
 import os
 
 import yaml
+from classes.constants import DRAW
 from classes.game import Game
-from classes.player import DumbPlayer
+from classes.player import DumbPlayer, Player, SmartPlayer
 
 
 GAME_CONFIG_PATH = "../config/game.yml"
@@ -23,7 +24,7 @@ def test_game_for_dumb_computer():
     game.board.player_white = DumbPlayer(stone_color="W")
     game.board.current_player = game.board.player_black
 
-    while game.board.get_left_stones() > 0:
+    while not game.controller.is_over:
         print(f"{game.board.current_player.get_color_desc()} turn")
 
         xy_pairs = game.board.get_unvisited_xy_pairs()
@@ -33,7 +34,8 @@ def test_game_for_dumb_computer():
         x, y = game.validate_input(line_input)
 
         if game.handle_turn(x, y):
-            assert True
+            assert game.controller.result == game.board.current_player.stone_color
+            break
 
         print()
         print("-----------------------")
@@ -41,4 +43,23 @@ def test_game_for_dumb_computer():
         print("-----------------------")
         print()
 
-    assert True
+    # a full board or a dead draw ends the game without a winner
+    if game.controller.result == DRAW:
+        assert game.board.get_left_stones() == 0 or game.board.is_drawn()
+    else:
+        assert game.controller.result == game.board.current_player.stone_color
+
+
+def test_smart_computer_input_without_stats():
+    config = dict(game_config)
+    config["board_config"] = dict(board_config, heuristics_target_depth=1)
+    game = Game(config)
+
+    player_black = Player(stone_color="B")
+    player_white = SmartPlayer(stone_color="W", opponent=player_black)
+    game.controller.new_game(player_black, player_white)
+    game.board.put_stone(4, 4)
+    game.board.toggle_player()
+
+    x, y = game.validate_input(game.handle_player_input())
+    assert not game.board.is_visited(x, y)
@@ -0,0 +1,157 @@
+import os
+import time
+
+import pytest
+import yaml
+from classes.constants import DRAW
+from classes.game_controller import GameController
+from classes.player import DumbPlayer, Player, SmartPlayer
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+
+def test_controller_play_until_win():
+    controller = GameController(board_config)
+    controller.new_game(Player(stone_color="B"), Player(stone_color="W"))
+
+    moves = []
+    for y in range(board_config["n_win"] - 1):
+        moves += [(0, y), (1, y)]
+    for x, y in moves:
+        assert controller.play(x, y) is None
+
+    assert controller.play(0, board_config["n_win"] - 1) == "B"
+    assert controller.is_over
+    assert controller.board.winner is controller.board.player_black
+    assert controller.history == moves + [(0, board_config["n_win"] - 1)]
+
+    with pytest.raises(ValueError):
+        controller.play(2, 2)
+
+
+def test_controller_rejects_invalid_moves():
+    controller = GameController(board_config)
+    controller.new_game(Player(stone_color="B"), Player(stone_color="W"))
+    controller.play(4, 4)
+
+    with pytest.raises(ValueError):
+        controller.play(4, 4)
+    with pytest.raises(ValueError):
+        controller.play(board_config["n_cells"], 0)
+    with pytest.raises(ValueError):
+        controller.request_ai_move()
+
+    assert controller.history == [(4, 4)]
+    assert controller.board.current_player is controller.board.player_white
+
+
+def test_controller_draw():
+    controller = GameController(dict(board_config, n_cells=3, n_win=3))
+    controller.new_game(Player(stone_color="B"), Player(stone_color="W"))
+
+    moves = [(0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1), (2, 0), (2, 2)]
+    results = [controller.play(x, y) for x, y in moves[:-1]]
+
+    # no line is open to either player any more, before the board fills up
+    assert results == [None] * 7 + [DRAW]
+    assert controller.board.get_left_stones() == 1
+    assert controller.board.winner is None
+
+
+def test_controller_batch_games_without_output(capsys):
+    controller = GameController(board_config)
+    for _ in range(5):
+        controller.new_game(DumbPlayer(stone_color="B"), DumbPlayer(stone_color="W"))
+        while not controller.is_over:
+            controller.request_ai_move()
+
+        assert controller.result in ("B", "W", DRAW)
+        assert len(controller.history) == len(set(controller.history))
+
+    assert capsys.readouterr().out == ""
+
+
+def test_controller_ponders_on_human_turn():
+    controller = GameController(
+        dict(board_config, n_cells=9, search_workers=1), heuristics="basic"
+    )
+    human = Player(stone_color="B")
+    computer = SmartPlayer("W", human, target_depth=2, time_limit=0, ponder=True)
+    controller.new_game(human, computer)
+
+    controller.play(4, 4)
+    move = controller.request_ai_move()
+    predicted = computer.ponder_move
+    assert predicted is not None
+    # the pondering search leaves the results of the last search alone
+    assert computer.completed_depth == 2
+    assert computer.principal_variation[:2] == [move, predicted]
+
+    controller.play(*predicted)
+    move = controller.request_ai_move()
+    assert (computer.ponder_hits, computer.ponder_misses) == (1, 0)
+    assert computer.completed_depth == 2
+    assert computer.principal_variation[0] == move
+    assert computer.ponder_time_saved > 0
+    assert computer.ponder_hit_rate == 1.0
+
+    x, y = next(
+        (x, y)
+        for x, y in controller.board.get_unvisited_xy_pairs()
+        if (x, y) != computer.ponder_move
+    )
+    controller.play(x, y)
+    x, y = controller.request_ai_move()
+    assert (computer.ponder_hits, computer.ponder_misses) == (1, 1)
+    assert controller.history[-1] == (x, y)
+    assert len(controller.history) == 6
+
+    controller.new_game(human, computer)
+    assert computer.ponder_move is None
+
+
+def test_pondering_stopped_before_it_starts():
+    controller = GameController(
+        dict(board_config, n_cells=9, search_workers=1), heuristics="basic"
+    )
+    human = Player(stone_color="B")
+    controller.new_game(human, SmartPlayer("W", human, time_limit=0))
+    controller.play(4, 4)
+
+    # the opponent moved before the pondering search started, so its deadline has passed
+    ponderer = SmartPlayer("W", human, target_depth=12, time_limit=0)
+    ponderer._pondering = True
+    ponderer._search_deadline = -float("inf")
+    start_time = time.perf_counter()
+    ponderer.find_optimal_input(controller.board, "basic")
+
+    assert ponderer.completed_depth == 0
+    assert time.perf_counter() - start_time < 1
+
+
+def test_pondering_stopped_in_first_iteration():
+    controller = GameController(
+        dict(board_config, n_cells=9, search_workers=1), heuristics="basic"
+    )
+    human = Player(stone_color="B")
+    controller.new_game(human, SmartPlayer("W", human, time_limit=0))
+    controller.play(4, 4)
+
+    # the opponent moved while the first iteration was running
+    ponderer = SmartPlayer("W", human, time_limit=0, collect_stats=True)
+    ponderer._pondering = True
+    ponderer._deadline = ponderer._search_deadline = -float("inf")
+    board_state = str(controller.board)
+
+    assert ponderer.find_optimal_input(controller.board, "basic") is None
+    assert ponderer.completed_depth is None
+    assert ponderer.search_stats.depth_reached == 0
+    assert str(controller.board) == board_state
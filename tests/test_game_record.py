@@ -0,0 +1,101 @@
+import os
+import random
+
+import pytest
+import yaml
+from classes.constants import BLACK, WHITE
+from classes.game_controller import GameController
+from classes.game_record import (
+    FILE_MAGIC,
+    RECORD_HEADER,
+    GameRecord,
+    GameRecordWriter,
+    read_game_records,
+)
+from classes.player import DumbPlayer
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+
+def play_random_game(n_cells, n_win, seed):
+    random.seed(seed)
+    controller = GameController(dict(board_config, n_cells=n_cells, n_win=n_win))
+    controller.new_game(DumbPlayer(stone_color=BLACK), DumbPlayer(stone_color=WHITE))
+    while not controller.is_over:
+        controller.request_ai_move()
+    return controller
+
+
+@pytest.mark.parametrize(
+    "n_cells, n_win, move_bytes", [(9, 5, 1), (15, 5, 1), (19, 5, 2), (3, 3, 1)]
+)
+def test_record_round_trip_replays_final_position(tmp_path, n_cells, n_win, move_bytes):
+    file_path = str(tmp_path / "games.gmr")
+    controllers = [play_random_game(n_cells, n_win, seed) for seed in range(5)]
+
+    with GameRecordWriter(file_path) as writer:
+        for k, controller in enumerate(controllers):
+            record = GameRecord(
+                n_cells,
+                n_win,
+                controller.history,
+                "dumb",
+                f"dumb-{k}",
+                controller.result,
+            )
+            assert len(record.to_bytes()) == (
+                RECORD_HEADER.size
+                + 4
+                + len(f"dumb-{k}")
+                + move_bytes * len(record.moves)
+            )
+            writer.write(record)
+
+    records = list(read_game_records(file_path))
+    assert len(records) == len(controllers)
+    for k, (record, controller) in enumerate(zip(records, controllers)):
+        assert (record.size, record.n_win) == (n_cells, n_win)
+        assert (record.black, record.white) == ("dumb", f"dumb-{k}")
+        assert record.result == controller.result
+        assert record.moves == controller.history
+
+        board = record.replay(board_config)
+        assert board.bitboard.black == controller.board.bitboard.black
+        assert board.bitboard.white == controller.board.bitboard.white
+        assert board.zobrist_hash == controller.board.zobrist_hash
+
+
+def test_records_are_appended_and_read_lazily(tmp_path):
+    file_path = str(tmp_path / "games.gmr")
+    open(file_path, "wb").close()
+    assert list(read_game_records(file_path)) == []
+
+    for n_moves in (3, 4):
+        with GameRecordWriter(file_path) as writer:
+            writer.write(GameRecord(9, 5, [(4, k) for k in range(n_moves)]))
+
+    records = read_game_records(file_path)
+    first = next(records)
+    assert first.moves == [(4, 0), (4, 1), (4, 2)] and first.result is None
+    assert len(next(records).moves) == 4
+    assert next(records, None) is None
+
+    with open(file_path, "rb") as file:
+        content = file.read()
+    assert content.startswith(FILE_MAGIC) and content.count(FILE_MAGIC) == 1
+
+    with open(file_path, "ab") as file:
+        file.write(content[len(FILE_MAGIC) : -2])
+    with pytest.raises(ValueError):
+        list(read_game_records(file_path))
+
+    with pytest.raises(ValueError):
+        GameRecord(9, 5, [(4, 4), (4, 4)]).replay(board_config)
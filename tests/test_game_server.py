@@ -0,0 +1,148 @@
+import asyncio
+import json
+import multiprocessing
+import os
+
+import yaml
+from classes.board import Board
+from classes.constants import BLACK, WHITE
+from classes.game_server import GameServer, compute_ai_move
+from classes.player import Player
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = dict(game_config["board_config"], n_cells=9)
+
+server_config = {
+    "host": "127.0.0.1",
+    "port": 0,
+    "unix_socket": "",
+    "workers": 2,
+    "max_sessions": 8,
+    "max_pending_moves": 8,
+    "ai_time_per_move": 1,
+    "move_timeout": 10,
+    "idle_timeout": 10,
+}
+
+
+async def request(reader, writer, **kwargs):
+    writer.write(json.dumps(kwargs).encode() + b"\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+def run_server(config, client):
+    async def main():
+        server = GameServer(config, board_config)
+        await server.start()
+        try:
+            return await client(server)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_compute_ai_move_searches_in_process():
+    board = Board(dict(board_config, search_workers=2, threat_search_nodes=0))
+    board.make_move(4, 4, Player(stone_color=BLACK))
+    engine = {"player": "smart", "target_depth": 2}
+
+    x, y = compute_ai_move(board.get_snapshot(), engine, WHITE, 1)
+    assert not board.is_visited(x, y)
+    assert not multiprocessing.active_children()
+
+
+def test_human_vs_computer_session():
+    async def client(server):
+        reader, writer = await asyncio.open_connection(*server.address)
+        response = await request(reader, writer, cmd="new_game", white="smart", id=1)
+        assert response["ok"] and response["id"] == 1 and response["to_move"] == BLACK
+
+        response = await request(reader, writer, cmd="play", x=4, y=4)
+        assert response["ok"] and response["history"] == [[4, 4]]
+        assert response["board"][4][4] == BLACK
+
+        response = await request(reader, writer, cmd="ai_move")
+        assert response["ok"] and len(response["history"]) == 2
+        assert response["history"][1] == response["move"]
+
+        response = await request(reader, writer, cmd="play", x=4, y=4)
+        assert not response["ok"]
+        response = await request(reader, writer, cmd="ai_move")
+        assert not response["ok"]
+        response = await request(reader, writer, cmd="quit")
+        assert response["ok"] and await reader.readline() == b""
+
+    run_server(server_config, client)
+
+
+def test_concurrent_sessions_play_to_the_end():
+    async def play_session(server, k):
+        reader, writer = await asyncio.open_connection(*server.address)
+        engine = {"player": "smart", "heuristics": "basic", "target_depth": 1}
+        response = await request(
+            reader, writer, cmd="new_game", black="dumb", white=engine
+        )
+        while response["ok"] and response["result"] is None:
+            response = await request(reader, writer, cmd="ai_move", id=k)
+            assert response["id"] == k
+        writer.close()
+        return response
+
+    async def client(server):
+        return await asyncio.gather(*(play_session(server, k) for k in range(4)))
+
+    for response in run_server(server_config, client):
+        assert response["ok"] and response["result"] is not None
+
+        board = response["board"]
+        assert sum(row.count("_") for row in board) == 81 - len(response["history"])
+
+
+def test_move_timeout_and_busy_server():
+    config = dict(server_config, move_timeout=0.01, max_pending_moves=1)
+
+    async def client(server):
+        reader, writer = await asyncio.open_connection(*server.address)
+        await request(reader, writer, cmd="new_game", black="mcts")
+        timed_out = await request(reader, writer, cmd="ai_move")
+        busy = await request(reader, writer, cmd="ai_move")
+        state = await request(reader, writer, cmd="state")
+        writer.close()
+        return timed_out, busy, state
+
+    timed_out, busy, state = run_server(config, client)
+    assert not timed_out["ok"] and "timed out" in timed_out["error"]
+    assert not busy["ok"] and "busy" in busy["error"]
+    assert state["ok"] and state["history"] == []
+
+
+def test_unix_socket_and_session_limits(tmp_path):
+    config = dict(
+        server_config, unix_socket=str(tmp_path / "gomoku.sock"), max_sessions=1
+    )
+
+    async def client(server):
+        reader, writer = await asyncio.open_unix_connection(server.address)
+        response = await request(reader, writer, cmd="state")
+        assert response["ok"] and response["to_move"] is None
+        response = await request(reader, writer, cmd="move")
+        assert not response["ok"]
+        writer.write(b"not json\n")
+        assert not json.loads(await reader.readline())["ok"]
+
+        other_reader, other_writer = await asyncio.open_unix_connection(server.address)
+        response = json.loads(await other_reader.readline())
+        assert not response["ok"] and "sessions" in response["error"]
+        assert await other_reader.readline() == b""
+        writer.close()
+
+    run_server(config, client)
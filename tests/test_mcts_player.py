@@ -0,0 +1,78 @@
+import os
+import random
+
+import pytest
+import yaml
+from classes.bitboard import BitBoard
+from classes.board import Board
+from classes.player import MCTSPlayer, Player
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+
+@pytest.fixture
+def mcts_board():
+    board = Board(dict(board_config, mcts_iterations=500, mcts_time_limit=0))
+    board.player_black = Player(stone_color="B")
+    board.player_white = MCTSPlayer(stone_color="W", opponent=board.player_black)
+    board.current_player = board.player_white
+    board.player_white._rng = random.Random(7)
+    return board
+
+
+def test_bitboard_playout():
+    n, n_win = board_config["n_cells"], board_config["n_win"]
+    bitboard = BitBoard(n, n_win)
+    for x in range(n):
+        for y in range(n):
+            if (x, y) != (0, n_win - 1):
+                bitboard.set_stone(x, y, "B" if (x + y // 2) % 2 else "W")
+    bitboard.remove_stone(0, n_win - 1)
+    for y in range(n_win - 1):
+        bitboard.set_stone(0, y, "W")
+    black, white = bitboard.black, bitboard.white
+
+    assert bitboard.playout("W") == "W"
+    assert (bitboard.black, bitboard.white) == (black, white)
+
+
+def test_mcts_player_takes_win(mcts_board):
+    for y in range(board_config["n_win"] - 1):
+        mcts_board.make_move(3, y + 1, mcts_board.player_white)
+        mcts_board.make_move(6, y, mcts_board.player_black)
+    black, white = mcts_board.bitboard.black, mcts_board.bitboard.white
+
+    x, y = mcts_board.player_white.find_optimal_input(mcts_board)
+    assert (x, y) in [(3, 0), (3, board_config["n_win"])]
+    assert mcts_board.player_white.playouts == 500
+    assert (mcts_board.bitboard.black, mcts_board.bitboard.white) == (black, white)
+    assert len(mcts_board.history) == 2 * (board_config["n_win"] - 1)
+
+
+def test_mcts_player_reuses_subtree(mcts_board):
+    player = mcts_board.player_white
+    mcts_board.make_move(4, 4, mcts_board.player_black)
+
+    move = player.find_optimal_input(mcts_board)
+    assert player.reused_playouts == 0
+    mcts_board.make_move(*move, player)
+
+    reply = next(iter(player.root.children))
+    expected_playouts = player.root.children[reply].visits
+    mcts_board.make_move(*reply, mcts_board.player_black)
+
+    player.find_optimal_input(mcts_board)
+    assert player.reused_playouts == expected_playouts > 0
+
+    # an unexpected position starts a new tree
+    mcts_board.unmake_move()
+    player.find_optimal_input(mcts_board)
+    assert player.reused_playouts == 0
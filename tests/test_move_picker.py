@@ -0,0 +1,78 @@
+import os
+
+import yaml
+from classes.board import Board
+from classes.move_picker import (
+    HASH_MOVE,
+    KILLER_MOVES,
+    QUIET_MOVES,
+    THREAT_MOVES,
+    MovePicker,
+)
+from classes.player import Player, SmartPlayer
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+
+def make_board(black_moves, white_moves):
+    board = Board(board_config)
+    board.player_black = Player(stone_color="B")
+    board.player_white = SmartPlayer(stone_color="W", opponent=board.player_black)
+
+    for color, moves in (("B", black_moves), ("W", white_moves)):
+        for x, y in moves:
+            board.bitboard.set_stone(x, y, color)
+
+    return board
+
+
+def test_move_picker_order():
+    """
+    B _ _ _ _ _
+    B W _ _ _ _
+    B _ W _ _ _
+    B _ _ W _ _
+    _ _ _ _ W _
+    _ _ _ _ _ _
+    """
+    board = make_board(
+        [(0, 0), (1, 0), (2, 0), (3, 0)], [(1, 1), (2, 2), (3, 3), (4, 4)]
+    )
+    move_picker = MovePicker(
+        board,
+        "W",
+        hash_move=(6, 6),
+        killer_moves=[(4, 0), (2, 1)],
+        history={(3, 2): 10, (4, 3): 5},
+    )
+
+    moves = []
+    stages = []
+    for move in move_picker:
+        moves.append(move)
+        stages.append(move_picker.stage)
+
+    # hash move, white win at (5, 5), black win at (4, 0) to block, killer (2, 1)
+    assert moves[:4] == [(6, 6), (5, 5), (4, 0), (2, 1)]
+    assert stages[1:4] == [THREAT_MOVES, THREAT_MOVES, KILLER_MOVES]
+    assert moves[4:6] == [(3, 2), (4, 3)]
+    assert set(stages[4:]) == {QUIET_MOVES}
+    assert len(moves) == len(set(moves))
+    assert set(moves) == set(board.get_candidate_moves()) | {(6, 6)}
+
+
+def test_move_picker_is_lazy():
+    board = make_board([(4, 4)], [])
+    move_picker = MovePicker(board, "W", hash_move=(3, 3))
+
+    moves = iter(move_picker)
+    assert next(moves) == (3, 3)
+    assert move_picker.stage == HASH_MOVE
@@ -0,0 +1,89 @@
+import os
+import random
+
+import pytest
+import yaml
+from classes.bitboard import BitBoard
+from classes.patterns import (
+    BLOCKED_CELL,
+    CLOSED_FOUR,
+    CLOSED_THREE,
+    EMPTY_CELL,
+    FIVE,
+    NONE,
+    OPEN_FOUR,
+    OPEN_THREE,
+    OPEN_TWO,
+    OWN_CELL,
+    classify_segment,
+    get_pattern_tables,
+)
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+CELLS = {"_": EMPTY_CELL, "X": OWN_CELL, "O": BLOCKED_CELL}
+
+
+@pytest.mark.parametrize(
+    "segment, pattern",
+    [
+        ("XXXXX____", FIVE),
+        ("____XXXX_", OPEN_FOUR),
+        ("___OXXXX_", CLOSED_FOUR),
+        ("___XX_XX_", CLOSED_FOUR),
+        ("X_XXX_X__", OPEN_FOUR),
+        ("___XX_X__", OPEN_THREE),
+        ("___XXX_O_", OPEN_THREE),
+        ("O_XXX_O__", CLOSED_THREE),
+        ("____XX___", OPEN_TWO),
+        ("____X____", NONE),
+        ("___OXXXXO", NONE),
+    ],
+)
+def test_classify_segment(segment, pattern):
+    assert classify_segment(tuple(CELLS[c] for c in segment), 5) == pattern
+
+
+def test_pattern_tables_are_shared():
+    bitboard1 = BitBoard(9, 5)
+    bitboard2 = BitBoard(15, 5)
+
+    assert get_pattern_tables(5) is get_pattern_tables(5)
+    assert bitboard1._pattern_tables is bitboard2._pattern_tables
+
+
+def test_pattern_lookup_matches_segments():
+    random.seed(11)
+    n, n_win = board_config["n_cells"], board_config["n_win"]
+    bitboard = BitBoard(n, n_win)
+    for x, y in random.sample([(x, y) for x in range(n) for y in range(n)], 30):
+        bitboard.set_stone(x, y, random.choice("BW"))
+
+    for x in range(n):
+        for y in range(n):
+            for color in "BW":
+                expected = []
+                for dx, dy in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+                    cells = []
+                    for k in range(1 - n_win, n_win):
+                        nx, ny = x + k * dx, y + k * dy
+                        if k == 0:
+                            cells.append(OWN_CELL)
+                        elif not (0 <= nx < n and 0 <= ny < n):
+                            cells.append(BLOCKED_CELL)
+                        elif bitboard.get_color(nx, ny) == "_":
+                            cells.append(EMPTY_CELL)
+                        else:
+                            own = bitboard.get_color(nx, ny) == color
+                            cells.append(OWN_CELL if own else BLOCKED_CELL)
+                    expected.append(classify_segment(tuple(cells), n_win))
+
+                assert bitboard.get_pattern_classes(x, y, color) == expected
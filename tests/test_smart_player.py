@@ -1,8 +1,10 @@
 import os
+import time
 
 import pytest
 import random
 import yaml
+from classes.board import Board
 from classes.game import Game
 from classes.player import Player, SmartPlayer
 from classes.stone import Stone
@@ -245,3 +247,228 @@ def test_game_find_optimal_move(empty_board):
     smart_player_input = game.board.player_white.get_input(game.board)
     x, y = game.validate_input(smart_player_input)
     assert (x, y) == (4, 0)  # win condition for white player
+
+
+def get_board_state(board):
+    return (
+        str(board),
+        board.bitboard.black,
+        board.bitboard.white,
+        board.zobrist_hash,
+        board.get_candidate_moves(),
+        board.weighted_score,
+        board.pattern_score,
+        board.get_left_stones(),
+        board.last_move,
+        list(board.history),
+        [(s.color, s.player, s.visited) for row in board.board for s in row],
+    )
+
+
+@pytest.mark.parametrize("heuristics", ["basic", "advanced"])
+def test_game_search_restores_board(heuristics):
+    game = Game(game_config)
+    game.board.player_black = Player(stone_color="B")
+    game.board.player_white = SmartPlayer(
+        stone_color="W", opponent=game.board.player_black
+    )
+    game.board.current_player = game.board.player_black
+
+    for x, y in [(4, 4), (4, 5), (5, 5), (3, 3), (5, 4)]:
+        game.handle_turn(x, y)
+
+    state = get_board_state(game.board)
+    game.board.player_white.get_input(game.board, heuristics)
+
+    assert get_board_state(game.board) == state
+
+
+def test_board_make_unmake_move():
+    game = Game(game_config)
+    game.board.player_black = Player(stone_color="B")
+    game.board.player_white = Player(stone_color="W")
+    game.board.current_player = game.board.player_black
+    game.handle_turn(4, 4)
+
+    state = get_board_state(game.board)
+    game.board.make_move(4, 5, game.board.player_white)
+    game.board.weighted_score += 10
+    game.board.make_move(3, 3)
+
+    assert game.board.last_move is game.board.board[3][3]
+    assert game.board.get_left_stones() == board_config["n_cells"] ** 2 - 3
+
+    game.board.unmake_move()
+    game.board.unmake_move()
+    assert get_board_state(game.board) == state
+
+
+def test_game_iterative_deepening_time_limit():
+    config = dict(game_config)
+    config["board_config"] = dict(
+        board_config, heuristics_target_depth=12, heuristics_time_limit=0.3
+    )
+    game = Game(config)
+    game.board.player_black = Player(stone_color="B")
+    game.board.player_white = SmartPlayer(
+        stone_color="W", opponent=game.board.player_black
+    )
+    game.board.current_player = game.board.player_black
+
+    for x, y in [(4, 4), (4, 5), (5, 5), (3, 3), (5, 4)]:
+        game.handle_turn(x, y)
+
+    state = get_board_state(game.board)
+    start_time = time.perf_counter()
+    x, y = game.validate_input(game.board.player_white.get_input(game.board))
+
+    assert time.perf_counter() - start_time < 1.5
+    assert 0 <= game.board.player_white.completed_depth < 12
+    assert game.board.player_white.principal_variation[0] == (x, y)
+    assert get_board_state(game.board) == state
+
+
+@pytest.mark.parametrize("heuristics", ["basic", "advanced"])
+def test_parallel_search_matches_sequential(heuristics):
+    config = dict(board_config, heuristics_target_depth=2, heuristics_time_limit=0)
+    random.seed(11)
+
+    for _ in range(3):
+        moves = {}
+        for search_workers in (1, 2):
+            board = Board(dict(config, search_workers=search_workers))
+            board.player_black = Player(stone_color="B")
+            board.player_white = SmartPlayer(
+                stone_color="W", opponent=board.player_black
+            )
+            board.current_player = board.player_white
+
+            if search_workers == 1:
+                cells = random.sample(board.get_unvisited_xy_pairs(), 8)
+            for k, (x, y) in enumerate(cells):
+                player = board.player_black if k % 2 else board.player_white
+                board.make_move(x, y, player)
+            board_state = get_board_state(board)
+
+            try:
+                moves[search_workers] = board.player_white.find_optimal_input(
+                    board, heuristics
+                )
+            finally:
+                board.player_white.close()
+            assert get_board_state(board) == board_state
+
+        assert moves[2] == moves[1]
+
+
+def test_pvs_matches_full_window_search():
+    # a narrow aspiration window makes the iterations fail and search again
+    config = dict(
+        board_config,
+        heuristics_target_depth=3,
+        heuristics_time_limit=0,
+        aspiration_window=1,
+    )
+    random.seed(5)
+
+    researches = 0
+    for _ in range(3):
+        cells = random.sample([(x, y) for x in range(2, 7) for y in range(2, 7)], 6)
+        results = {}
+        for pvs in (False, True):
+            board = Board(config)
+            board.player_black = Player(stone_color="B")
+            board.player_white = SmartPlayer(
+                stone_color="W",
+                opponent=board.player_black,
+                collect_stats=True,
+                pvs=pvs,
+            )
+            board.current_player = board.player_white
+            for k, (x, y) in enumerate(cells):
+                player = board.player_black if k % 2 else board.player_white
+                board.make_move(x, y, player)
+
+            player = board.player_white
+            move = player.find_optimal_input(board, "advanced")
+            researches += player.search_stats.aspiration_researches
+            results[pvs] = move, player.search_root(board, 3, "advanced")[1]
+
+        assert results[True] == results[False]
+
+    assert researches > 0
+
+
+def test_transposition_table_scores_do_not_depend_on_path():
+    # the advanced scores depend on the order of the moves, and the scores of an
+    # earlier search count plies from another root, so neither may be reused
+    config = dict(
+        board_config,
+        heuristics_target_depth=3,
+        heuristics_time_limit=0,
+        threat_search_nodes=0,
+    )
+    for seed in (6, 13, 19):
+        random.seed(seed)
+        cells = random.sample([(x, y) for x in range(2, 7) for y in range(2, 7)], 6)
+        board = Board(config)
+        board.player_black = Player(stone_color="B")
+        board.player_white = SmartPlayer(stone_color="W", opponent=board.player_black)
+        board.current_player = board.player_white
+        for k, (x, y) in enumerate(cells):
+            board.make_move(x, y, board.player_black if k % 2 else board.player_white)
+
+        player = board.player_white
+        board.make_move(*player.find_optimal_input(board, "advanced"), player)
+        board.make_move(*board.get_candidate_moves()[0], board.player_black)
+
+        score = player.search_root(board, 3, "advanced")[1]
+        player.transposition_table.clear()
+        assert player.search_root(board, 3, "advanced")[1] == score
+
+
+def test_board_snapshot_round_trip(random_scenario_board):
+    board = Board(board_config)
+    board.board = random_scenario_board
+    board.weighted_score, board.pattern_score = 12, -340
+
+    restored = Board.from_snapshot(board.get_snapshot())
+    assert str(restored) == str(board)
+    assert restored.zobrist_hash == board.zobrist_hash
+    assert restored.get_candidate_moves() == board.get_candidate_moves()
+    assert restored.get_left_stones() == board.get_left_stones()
+    assert (restored.weighted_score, restored.pattern_score) == (12, -340)
+
+
+def test_search_stats():
+    config = dict(game_config)
+    config["board_config"] = dict(
+        board_config, heuristics_target_depth=3, heuristics_time_limit=0
+    )
+    game = Game(config)
+    game.controller.new_game(
+        Player(stone_color="B"), SmartPlayer(stone_color="W", opponent=None)
+    )
+    game.board.player_white.opponent = game.board.player_black
+    for x, y in [(4, 4), (4, 5), (5, 5)]:
+        game.handle_turn(x, y)
+
+    reply = game.controller.request_ai_move()
+    assert game.controller.last_search_stats is None
+
+    game.handle_turn(*next(m for m in [(3, 3), (6, 6)] if m != reply))
+    player = game.board.player_white
+    player.collect_stats = True
+    move = game.controller.request_ai_move()
+    stats = game.controller.last_search_stats
+
+    assert stats is player.search_stats
+    assert stats.depth_reached == 4
+    assert 0 < stats.leaf_evaluations < stats.nodes
+    assert stats.cutoffs == sum(stats.cutoffs_by_ply.values()) > 0
+    assert set(stats.cutoffs_by_ply) <= {1, 2, 3}
+    assert stats.tt_probes >= stats.tt_hits
+    assert stats.nodes_per_second > 0
+    assert stats.principal_variation[0] == move
+    assert stats.to_dict()["principal_variation"][0] == list(move)
+    assert "Principal variation" in stats.format_summary()
@@ -0,0 +1,133 @@
+import os
+import random
+
+import yaml
+from classes.bitboard import BitBoard
+from classes.board import Board
+from classes.constants import DRAW
+from classes.player import Player, SmartPlayer
+from classes.proof_number import ProofNumberSolver
+from classes.solved_positions import (
+    SolvedPositionDatabase,
+    build_solved_positions,
+    get_opening_positions,
+    replay_moves,
+)
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+
+def test_canonical_hash():
+    random.seed(8)
+    n, n_win = board_config["n_cells"], board_config["n_win"]
+    moves = random.sample([(x, y) for x in range(n) for y in range(n)], 11)
+    bitboard, color = replay_moves(n, n_win, moves)
+    key, symmetry = bitboard.get_canonical_hash(color)
+
+    for k in range(8):
+        symmetric_moves = [bitboard.get_symmetric_cell(x, y, k) for x, y in moves]
+        symmetric_bitboard, _ = replay_moves(n, n_win, symmetric_moves)
+        symmetric_key, _ = symmetric_bitboard.get_canonical_hash(color)
+        assert symmetric_key == key
+        assert [
+            bitboard.get_symmetric_cell(x, y, k, inverse=True)
+            for x, y in symmetric_moves
+        ] == moves
+
+    assert bitboard.get_canonical_hash("B" if color == "W" else "W")[0] != key
+    canonical_moves = [bitboard.get_symmetric_cell(x, y, symmetry) for x, y in moves]
+    canonical_bitboard, _ = replay_moves(n, n_win, canonical_moves)
+    assert canonical_bitboard.hash ^ (bitboard.side_key if color == "W" else 0) == key
+
+
+def test_proof_number_solver_small_boards():
+    solver = ProofNumberSolver(100000)
+    assert solver.solve(BitBoard(3, 3), "B") == (DRAW, (1, 1))
+    assert solver.solve(BitBoard(4, 3), "B")[0] == "B"
+
+    # black makes two threes at once, and wins even with white to move
+    bitboard, color = replay_moves(4, 3, [(1, 1), (0, 0), (2, 2), (3, 3)])
+    result, move = solver.solve(bitboard, color)
+    assert result == "B"
+    assert not bitboard.is_occupied(*move)
+    assert solver.solve(bitboard, "W") == ("B", None)
+
+
+def test_proof_number_solver_node_limit():
+    solver = ProofNumberSolver(100)
+    assert solver.solve(BitBoard(4, 4), "B") == (None, None)
+    assert solver.nodes >= 100
+
+
+def test_solved_position_database(tmp_path):
+    file_path = str(tmp_path / "solved.db")
+    positions = get_opening_positions(4, 3, 2)
+    assert len(positions) == 1 + 1 + 5
+
+    with SolvedPositionDatabase(file_path, 4, 3) as database:
+        assert build_solved_positions(database, positions, 20000, workers=2) == 7
+        assert len(database) == 7
+
+    # an interrupted build leaves a partial entry, which is dropped on resume
+    with open(file_path, "ab") as file:
+        file.write(b"\x01\x02\x03")
+    with SolvedPositionDatabase(file_path, 4, 3) as database:
+        assert len(database) == 7
+        assert build_solved_positions(database, positions, 20000, workers=1) == 0
+
+        bitboard, color = replay_moves(4, 3, [(2, 2)])
+        result, move = database.probe(bitboard, color)
+        assert result in ("B", "W", DRAW)
+        for k in range(8):
+            symmetric_bitboard, _ = replay_moves(
+                4, 3, [bitboard.get_symmetric_cell(2, 2, k)]
+            )
+            symmetric_result, symmetric_move = database.probe(symmetric_bitboard, color)
+            assert symmetric_result == result
+            if move is not None:
+                assert symmetric_move == bitboard.get_symmetric_cell(*move, k)
+
+        database.add(123, None, None, 20000)
+    assert os.path.getsize(file_path) == 5 + 2 + 8 * 15
+    assert SolvedPositionDatabase(file_path, 4, 3).is_searched(123, 20000)
+    assert not SolvedPositionDatabase(file_path, 4, 3).is_searched(123, 40000)
+
+
+def test_smart_player_answers_from_database(tmp_path):
+    file_path = str(tmp_path / "solved.db")
+    n, n_win = board_config["n_cells"], board_config["n_win"]
+    moves = [(4, 2), (0, 0), (4, 3), (0, 8), (2, 4), (8, 0), (3, 4), (8, 8)]
+
+    with SolvedPositionDatabase(file_path, n, n_win) as database:
+        build_solved_positions(database, [moves], 20000, workers=1)
+        bitboard, color = replay_moves(n, n_win, moves)
+        assert database.probe(bitboard, color)[0] == "B"
+
+    board = Board(
+        dict(
+            board_config,
+            solved_positions_path=file_path,
+            threat_search_nodes=0,
+            heuristics_time_limit=0,
+        )
+    )
+    board.player_white = Player(stone_color="W")
+    board.player_black = SmartPlayer(
+        stone_color="B", opponent=board.player_white, collect_stats=True
+    )
+    for k, (x, y) in enumerate(moves):
+        board.make_move(x, y, board.player_white if k % 2 else board.player_black)
+    board.current_player = board.player_black
+
+    player = board.player_black
+    move = player.find_optimal_input(board, "advanced")
+    assert move == database.probe(bitboard, color)[1]
+    assert player.search_stats.nodes == 0
@@ -0,0 +1,152 @@
+import os
+import random
+import time
+
+import yaml
+from classes.bitboard import BitBoard
+from classes.board import Board
+from classes.player import Player, SmartPlayer
+from classes.threat_solver import ThreatSolver
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+
+def create_bitboard(black, white):
+    bitboard = BitBoard(board_config["n_cells"], board_config["n_win"])
+    for x, y in black:
+        bitboard.set_stone(x, y, "B")
+    for x, y in white:
+        bitboard.set_stone(x, y, "W")
+
+    return bitboard
+
+
+def test_threat_cells():
+    random.seed(3)
+    n, n_win = board_config["n_cells"], board_config["n_win"]
+    cells = [(x, y) for x in range(n) for y in range(n)]
+    lines = []
+    for dx, dy in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+        for x, y in cells:
+            line = [(x + k * dx, y + k * dy) for k in range(n_win)]
+            if all(0 <= i < n and 0 <= j < n for i, j in line):
+                lines.append(line)
+
+    for _ in range(5):
+        stones = dict(zip(random.sample(cells, 30), ["B", "W"] * 15))
+        bitboard = create_bitboard(
+            [cell for cell, color in stones.items() if color == "B"],
+            [cell for cell, color in stones.items() if color == "W"],
+        )
+        for missing in (1, 2, 3):
+            expected = set()
+            for line in lines:
+                colors = [stones.get(cell) for cell in line]
+                if "W" not in colors and colors.count(None) == missing:
+                    expected.update(cell for cell in line if cell not in stones)
+
+            cells_found = bitboard.get_cells(bitboard.get_threat_cells("B", missing))
+            assert set(cells_found) == expected
+
+
+def test_solver_finds_double_four():
+    bitboard = create_bitboard(
+        [(4, 1), (4, 2), (4, 3), (1, 4), (2, 4), (3, 4)], [(4, 0), (0, 4), (8, 8)]
+    )
+    state = bitboard.copy()
+
+    line = ThreatSolver(vct=False).solve(bitboard, "B")
+    assert line[0] == (4, 4)
+    assert set(line[1:]) == {(4, 5), (5, 4)}
+    assert ThreatSolver().solve(bitboard, "W") is None
+    assert bitboard.hash == state.hash
+    assert bitboard.get_cells(bitboard.get_stones("B")) == [
+        (1, 4),
+        (2, 4),
+        (3, 4),
+        (4, 1),
+        (4, 2),
+        (4, 3),
+    ]
+
+
+def test_solver_finds_double_three():
+    bitboard = create_bitboard(
+        [(4, 2), (4, 3), (2, 4), (3, 4)], [(0, 0), (0, 8), (8, 0), (8, 8)]
+    )
+
+    assert ThreatSolver(vct=False).solve(bitboard, "B") is None
+    line = ThreatSolver().solve(bitboard, "B")
+    assert line[0] == (4, 4)
+
+
+def test_solver_finds_defences():
+    bitboard = create_bitboard([(4, 2), (4, 3), (4, 4)], [(0, 0), (8, 8)])
+
+    solver = ThreatSolver()
+    threat = solver.solve(bitboard, "B")
+    assert threat is not None
+    assert sorted(solver.find_defences(bitboard, "W", threat)) == [(4, 1), (4, 5)]
+
+
+def test_solver_shares_deadline():
+    bitboard = create_bitboard([(4, 2), (4, 3), (4, 4)], [(0, 0), (8, 8)])
+
+    # a deadline given to a call replaces the time limit of the solver
+    solver = ThreatSolver(time_limit=60)
+    threat = solver.solve(bitboard, "B")
+    assert solver.solve(bitboard, "B", time.perf_counter() - 1) is None
+    assert solver.find_defences(bitboard, "W", threat, time.perf_counter() - 1) == []
+    assert solver.solve(bitboard, "B", time.perf_counter() + 60) == threat
+
+
+def test_solver_node_limit():
+    bitboard = create_bitboard(
+        [(4, 2), (4, 3), (2, 4), (3, 4)], [(0, 0), (0, 8), (8, 0), (8, 8)]
+    )
+
+    solver = ThreatSolver(max_nodes=10)
+    assert solver.solve(bitboard, "B") is None
+    assert solver.nodes == 11
+
+
+def create_board(black, white, **config):
+    board = Board(dict(board_config, heuristics_time_limit=0, **config))
+    board.player_black = Player(stone_color="B")
+    board.player_white = SmartPlayer(
+        stone_color="W", opponent=board.player_black, collect_stats=True
+    )
+    board.current_player = board.player_white
+    for x, y in black:
+        board.make_move(x, y, board.player_black)
+    for x, y in white:
+        board.make_move(x, y, board.player_white)
+
+    return board
+
+
+def test_smart_player_plays_forced_win():
+    board = create_board(
+        [(0, 0), (0, 8), (8, 0), (8, 8)], [(4, 2), (4, 3), (2, 4), (3, 4)]
+    )
+
+    player = board.player_white
+    assert player.find_optimal_input(board, "advanced") == (4, 4)
+    assert player.principal_variation[0] == (4, 4)
+    assert player.search_stats.nodes == 0
+
+
+def test_smart_player_blocks_forced_win():
+    board = create_board(
+        [(4, 2), (4, 3), (4, 4)], [(0, 0), (8, 8)], heuristics_target_depth=1
+    )
+
+    assert board.player_white.find_optimal_input(board, "basic") in [(4, 1), (4, 5)]
@@ -0,0 +1,80 @@
+import io
+import json
+import math
+import os
+
+import pytest
+import yaml
+from classes.tournament import Tournament, get_elo_difference, play_game
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = game_config["board_config"]
+
+tournament_config = {
+    "engines": {
+        "dumb": {"player": "dumb"},
+        "smart": {"player": "smart", "heuristics": "basic", "target_depth": 1},
+        "mcts": {"player": "mcts", "iterations": 50},
+    },
+    "games_per_pairing": 2,
+    "time_per_move": 1,
+    "workers": 2,
+}
+
+
+def test_get_elo_difference():
+    assert get_elo_difference(5, 0, 5)[0] == 0.0
+    elo, margin = get_elo_difference(75, 0, 25)
+    assert elo == pytest.approx(190.8, abs=0.1)
+    assert 0 < margin < get_elo_difference(15, 0, 5)[1]
+    assert get_elo_difference(3, 0, 0) == (math.inf, math.inf)
+    assert get_elo_difference(0, 1, 2)[0] < 0
+
+
+def test_play_game_is_reproducible():
+    engines = tournament_config["engines"]
+    first = play_game(
+        board_config, ("dumb", engines["dumb"]), ("smart", engines["smart"]), 1, 3
+    )
+    second = play_game(
+        board_config, ("dumb", engines["dumb"]), ("smart", engines["smart"]), 1, 3
+    )
+
+    assert first["history"] == second["history"]
+    assert first["result"] in ("B", "W", "draw")
+    assert first["moves"] == len(first["history"])
+
+    # the MCTS players are seeded from the seed of the game as well
+    games = [
+        play_game(
+            board_config, ("mcts", engines["mcts"]), ("dumb", engines["dumb"]), 1, 5
+        )
+        for _ in range(2)
+    ]
+    assert games[0]["history"] == games[1]["history"]
+
+
+def test_tournament_streams_results():
+    tournament = Tournament(tournament_config, board_config)
+    games = tournament.get_games()
+    assert len(games) == 6
+    assert games[:2] == [("dumb", "smart"), ("smart", "dumb")]
+
+    stream = io.StringIO()
+    results = tournament.run(stream)
+
+    lines = stream.getvalue().splitlines()
+    assert sorted(json.loads(line)["game"] for line in lines) == list(range(6))
+    assert [json.loads(line) for line in lines] == json.loads(json.dumps(results))
+
+    scores = tournament.get_scores()
+    for engine, opponents in scores.items():
+        assert sum(sum(score) for score in opponents.values()) == 4
+    assert "Elo against the field" in tournament.format_summary()
@@ -0,0 +1,136 @@
+import os
+import random
+
+import numpy as np
+import pytest
+import yaml
+from classes.constants import BLACK, WHITE
+from classes.game_controller import GameController
+from classes.game_record import GameRecord, GameRecordWriter, read_game_records
+from classes.player import DumbPlayer
+from classes.training_data import (
+    TrainingDataLoader,
+    TrainingDataWriter,
+    encode_game,
+    export_training_data,
+)
+
+GAME_CONFIG_PATH = "../config/game.yml"
+
+with open(os.path.join(os.path.dirname(__file__), GAME_CONFIG_PATH), "r") as file:
+    game_config = yaml.safe_load(file)
+
+for config_name, path in game_config["config_paths"].items():
+    with open(path, "r") as file:
+        game_config[config_name] = yaml.safe_load(file)
+        board_config = dict(game_config["board_config"], n_cells=9)
+
+
+def play_random_game(seed):
+    random.seed(seed)
+    controller = GameController(board_config)
+    controller.new_game(DumbPlayer(stone_color=BLACK), DumbPlayer(stone_color=WHITE))
+    while not controller.is_over:
+        controller.request_ai_move()
+    return GameRecord(
+        9, board_config["n_win"], controller.history, result=controller.result
+    )
+
+
+def test_encode_game_matches_replay():
+    record = play_random_game(0)
+    planes, moves, outcomes = encode_game(9, record.moves, record.result)
+    assert planes.shape == (len(record.moves), 4, 9, 9)
+
+    for k in range(len(record.moves)):
+        board = GameRecord(9, record.n_win, record.moves[:k]).replay(board_config)
+        own, other = (BLACK, WHITE) if k % 2 == 0 else (WHITE, BLACK)
+        colors = np.array([[stone.color for stone in row] for row in board.board])
+        assert (planes[k, 0] == (colors == own)).all()
+        assert (planes[k, 1] == (colors == other)).all()
+        assert (planes[k, 2] == (planes[k, 0] + planes[k, 1] == 0)).all()
+        assert (planes[k, 3] == (k % 2 == 0)).all()
+        assert divmod(int(moves[k]), 9) == record.moves[k]
+        assert outcomes[k] == (1 if record.result == own else -1)
+
+
+def test_writer_chunks_and_loader_batches(tmp_path):
+    records = [play_random_game(seed) for seed in range(6)]
+    n_positions = sum(len(record.moves) for record in records)
+
+    records_path = str(tmp_path / "games.gmr")
+    with GameRecordWriter(records_path) as writer:
+        for record in records:
+            writer.write(record)
+
+    directory = str(tmp_path / "data")
+    assert export_training_data(read_game_records(records_path), directory, 9, 50) == (
+        n_positions
+    )
+
+    loader = TrainingDataLoader(directory, seed=0)
+    assert len(loader) == n_positions
+    planes, moves, outcomes = loader.get_batch(64)
+    assert planes.shape == (64, 4, 9, 9) and moves.shape == outcomes.shape == (64,)
+    # the move played is on an empty cell, and the planes cover the board once
+    assert planes[np.arange(64), 2].reshape(64, -1)[np.arange(64), moves].all()
+    assert (planes[:, :3].sum(axis=1) == 1).all()
+
+    same_planes, same_moves, _ = TrainingDataLoader(directory, seed=0).get_batch(64)
+    assert (same_planes == planes).all() and (same_moves == moves).all()
+
+
+def test_writer_augments_with_the_board_symmetries(tmp_path):
+    record = play_random_game(1)
+    directory = str(tmp_path / "data")
+    with TrainingDataWriter(directory, 9, chunk_size=1000, augment=True) as writer:
+        writer.add_record(record)
+    assert writer.n_positions == 8 * len(record.moves)
+
+    planes, moves, outcomes = TrainingDataLoader(directory).get_batch(200)
+    n = len(moves)
+    assert planes[np.arange(n), 2].reshape(n, -1)[np.arange(n), moves].all()
+
+    # the last position of the game in all 8 orientations
+    original, _, _ = encode_game(9, record.moves, record.result)
+    shard = np.load(os.path.join(directory, "shard_00000.planes.npy"), mmap_mode="r")
+    last = [len(record.moves) * k + len(record.moves) - 1 for k in range(8)]
+    orientations = {shard[k].tobytes() for k in last}
+    expected = set()
+    for flip in (False, True):
+        board = original[-1].transpose(0, 2, 1) if flip else original[-1]
+        for k in range(4):
+            expected.add(
+                np.ascontiguousarray(np.rot90(board, k, axes=(1, 2))).tobytes()
+            )
+    assert orientations == expected
+
+
+def test_writer_sizes_shards_to_the_positions_written(tmp_path):
+    record = play_random_game(2)
+    directory = str(tmp_path / "data")
+    with TrainingDataWriter(directory, 9) as writer:
+        writer.add_record(record)
+
+    planes = np.load(os.path.join(directory, "shard_00000.planes.npy"))
+    assert planes.shape == (len(record.moves), 4, 9, 9)
+    assert os.path.getsize(os.path.join(directory, "shard_00000.planes.npy")) < (
+        planes.nbytes + 4096
+    )
+    assert sorted(os.listdir(directory)) == [
+        "manifest.json",
+        "shard_00000.moves.npy",
+        "shard_00000.outcomes.npy",
+        "shard_00000.planes.npy",
+    ]
+
+
+def test_loader_without_positions(tmp_path):
+    directory = str(tmp_path / "data")
+    with TrainingDataWriter(directory, 9):
+        pass
+
+    loader = TrainingDataLoader(directory)
+    assert len(loader) == 0
+    with pytest.raises(ValueError):
+        loader.get_batch(8)
@@ -0,0 +1,38 @@
+from classes.transposition import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+)
+
+
+def test_transposition_table_store_and_probe():
+    table = TranspositionTable(16)
+    table.new_search()
+
+    assert table.probe(42) is None
+    table.store(42, 3, 7, EXACT, (1, 2))
+    assert table.probe(42) == (3, 7, EXACT, (1, 2), 0)
+    assert table.hit_rate == 0.5
+
+
+def test_transposition_table_keeps_deeper_entry():
+    table = TranspositionTable(16)
+    table.new_search()
+
+    table.store(1, 4, 10, LOWER_BOUND, (0, 0))
+    table.store(17, 2, -3, UPPER_BOUND, (1, 1))  # same slot, shallower
+    assert table.probe(1) == (4, 10, LOWER_BOUND, (0, 0), 0)
+    assert table.probe(17) is None
+
+    table.new_search()
+    table.store(17, 2, -3, UPPER_BOUND, (1, 1))  # stale entries are replaced
+    assert table.probe(17) == (2, -3, UPPER_BOUND, (1, 1), 0)
+
+
+def test_transposition_table_disabled():
+    table = TranspositionTable(0)
+    table.store(1, 4, 10, EXACT, (0, 0))
+
+    assert table.probe(1) is None
+    assert table.hit_rate == 0.0
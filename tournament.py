@@ -0,0 +1,81 @@
+import argparse
+import os
+
+from classes.game_record import GameRecord, GameRecordWriter
+from classes.tournament import Tournament
+from run import load_config
+
+GAME_CONFIG_PATH = "config/game.yml"
+TOURNAMENT_CONFIG_PATH = "config/tournament.yml"
+
+
+def parse_args():
+    """
+    Parses the command line arguments of the tournament.
+
+    Returns:
+        argparse.Namespace: The arguments, overriding the tournament config when given.
+    """
+    parser = argparse.ArgumentParser(
+        description="Self-play tournament of Gomoku engines"
+    )
+    parser.add_argument("--config", default=TOURNAMENT_CONFIG_PATH)
+    parser.add_argument("--games", type=int, help="games per pairing")
+    parser.add_argument("--time-per-move", type=float, help="seconds per move")
+    parser.add_argument("--workers", type=int, help="processes, 0 for one per core")
+    parser.add_argument("--output", help="the file of the per-game results")
+    parser.add_argument("--records", help="the binary file the games are appended to")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    root = os.path.dirname(os.path.abspath(__file__))
+
+    game_config = load_config(os.path.join(root, GAME_CONFIG_PATH))
+    board_config = load_config(
+        os.path.join(root, game_config["config_paths"]["board_config"])
+    )
+    tournament_config = load_config(args.config)
+    for key, value in [
+        ("games_per_pairing", args.games),
+        ("time_per_move", args.time_per_move),
+        ("workers", args.workers),
+        ("results_path", args.output),
+        ("records_path", args.records),
+    ]:
+        if value is not None:
+            tournament_config[key] = value
+
+    tournament = Tournament(tournament_config, board_config)
+    n_games = len(tournament.get_games())
+
+    records = None
+    if tournament_config["records_path"]:
+        records = GameRecordWriter(tournament_config["records_path"])
+
+    def print_result(result):
+        if records is not None:
+            records.write(
+                GameRecord(
+                    board_config["n_cells"],
+                    board_config["n_win"],
+                    result["history"],
+                    result["black"],
+                    result["white"],
+                    result["result"],
+                )
+            )
+        print(
+            f"[{len(tournament.results)}/{n_games}] game {result['game']}:"
+            f" {result['black']} (black) vs {result['white']} (white):"
+            f" {result['result']} in {result['moves']} moves, {result['duration']}s"
+        )
+
+    with open(tournament_config["results_path"], "w") as results_file:
+        tournament.run(results_file, print_result)
+    if records is not None:
+        records.close()
+
+    print("-----------------------")
+    print(tournament.format_summary())